@@ -0,0 +1,25 @@
+"""versao_atletas
+
+Revision ID: 3c7a9e2f5d14
+Revises: 9e4c1d7a2b60
+Create Date: 2026-10-18 18:30:42.118406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c7a9e2f5d14'
+down_revision = '9e4c1d7a2b60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Com default constante o Postgres (11+) só altera o catálogo, sem reescrever a tabela
+    op.add_column('atletas', sa.Column('versao', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('atletas', 'versao')
@@ -0,0 +1,35 @@
+"""indices_unicos_id
+
+Revision ID: 5b1f2a9c7d3e
+Revises: c006e8463eb4
+Create Date: 2026-10-18 10:12:41.208315
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1f2a9c7d3e'
+down_revision = 'c006e8463eb4'
+branch_labels = None
+depends_on = None
+
+TABELAS = ('categorias', 'centros_treinamento', 'atletas')
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de uma transação.
+    # Se falhar, o índice fica INVALID e deve ser removido antes de repetir.
+    with op.get_context().autocommit_block():
+        for tabela in TABELAS:
+            op.create_index(
+                op.f(f'ix_{tabela}_id'), tabela, ['id'],
+                unique=True, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for tabela in reversed(TABELAS):
+            op.drop_index(op.f(f'ix_{tabela}_id'), table_name=tabela, postgresql_concurrently=True)
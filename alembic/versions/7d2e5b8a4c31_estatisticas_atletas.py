@@ -0,0 +1,46 @@
+"""estatisticas_atletas
+
+Revision ID: 7d2e5b8a4c31
+Revises: 3c7a9e2f5d14
+Create Date: 2026-10-18 20:12:05.361902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2e5b8a4c31'
+down_revision = '3c7a9e2f5d14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'atletas_estatisticas',
+        sa.Column('categoria_id', sa.Integer(), nullable=False),
+        sa.Column('centro_treinamento_id', sa.Integer(), nullable=False),
+        sa.Column('sexo', sa.String(length=1), nullable=False),
+        sa.Column('quantidade', sa.BigInteger(), nullable=False),
+        sa.Column('soma_idade', sa.BigInteger(), nullable=False),
+        sa.Column('soma_peso', sa.Float(), nullable=False),
+        sa.Column('soma_altura', sa.Float(), nullable=False),
+        sa.Column('soma_imc', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['categoria_id'], ['categorias.pk_id'], ),
+        sa.ForeignKeyConstraint(['centro_treinamento_id'], ['centros_treinamento.pk_id'], ),
+        sa.PrimaryKeyConstraint('categoria_id', 'centro_treinamento_id', 'sexo')
+    )
+
+    # Carga inicial com os atletas existentes; daí em diante a API mantém os agregados
+    op.execute(
+        "INSERT INTO atletas_estatisticas "
+        "(categoria_id, centro_treinamento_id, sexo, quantidade, soma_idade, soma_peso, soma_altura, soma_imc) "
+        "SELECT categoria_id, centro_treinamento_id, sexo, count(*), sum(idade), sum(peso), sum(altura), "
+        "sum(peso / (altura * altura)) "
+        "FROM atletas GROUP BY categoria_id, centro_treinamento_id, sexo"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('atletas_estatisticas')
@@ -0,0 +1,44 @@
+"""busca_trigram_atletas
+
+Revision ID: 9e4c1d7a2b60
+Revises: 5b1f2a9c7d3e
+Create Date: 2026-10-18 11:02:17.940113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4c1d7a2b60'
+down_revision = '5b1f2a9c7d3e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+
+    # unaccent() é STABLE; o wrapper IMMUTABLE permite usá-lo em um índice de expressão
+    op.execute(
+        "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text "
+        "AS $$ SELECT public.unaccent('public.unaccent', $1) $$ "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT"
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_atletas_nome_trgm',
+            'atletas',
+            [sa.text('f_unaccent(lower(nome)) gin_trgm_ops')],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_atletas_nome_trgm', table_name='atletas', postgresql_concurrently=True)
+
+    op.execute('DROP FUNCTION IF EXISTS f_unaccent(text)')
@@ -0,0 +1,36 @@
+"""contagens
+
+Revision ID: a8d4e6f2c915
+Revises: f5c2d8a1e437
+Create Date: 2026-10-19 01:12:07.418352
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d4e6f2c915'
+down_revision = 'f5c2d8a1e437'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'contagens',
+        sa.Column('tabela', sa.String(length=50), nullable=False),
+        sa.Column('quantidade', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('tabela')
+    )
+
+    # Carga inicial; daí em diante a API mantém os contadores
+    op.execute(
+        "INSERT INTO contagens (tabela, quantidade) "
+        "SELECT 'categorias', count(*) FROM categorias "
+        "UNION ALL SELECT 'centros_treinamento', count(*) FROM centros_treinamento"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('contagens')
@@ -0,0 +1,45 @@
+"""jobs
+
+Revision ID: b4f81c6e2a97
+Revises: 7d2e5b8a4c31
+Create Date: 2026-10-18 21:04:48.520317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4f81c6e2a97'
+down_revision = '7d2e5b8a4c31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jobs',
+        sa.Column('pk_id', sa.Integer(), nullable=False),
+        sa.Column('tipo', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('parametros', sa.JSON(), nullable=False),
+        sa.Column('progresso', sa.JSON(), nullable=True),
+        sa.Column('resultado', sa.JSON(), nullable=True),
+        sa.Column('erro', sa.Text(), nullable=True),
+        sa.Column('tentativas', sa.Integer(), nullable=False),
+        sa.Column('cancelamento_solicitado', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('iniciado_em', sa.DateTime(), nullable=True),
+        sa.Column('concluido_em', sa.DateTime(), nullable=True),
+        sa.Column('lease_ate', sa.DateTime(), nullable=True),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.PrimaryKeyConstraint('pk_id')
+    )
+    op.create_index(op.f('ix_jobs_id'), 'jobs', ['id'], unique=True)
+    op.create_index(op.f('ix_jobs_status'), 'jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_jobs_status'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_id'), table_name='jobs')
+    op.drop_table('jobs')
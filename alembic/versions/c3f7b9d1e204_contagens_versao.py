@@ -0,0 +1,25 @@
+"""contagens_versao
+
+Revision ID: c3f7b9d1e204
+Revises: a8d4e6f2c915
+Create Date: 2026-10-19 10:04:52.631940
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f7b9d1e204'
+down_revision = 'a8d4e6f2c915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Versão das tabelas (ETag das respostas de categorias e centros de treinamento)
+    op.add_column('contagens', sa.Column('versao', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('contagens', 'versao')
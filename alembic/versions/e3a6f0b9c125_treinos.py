@@ -0,0 +1,59 @@
+"""treinos
+
+Revision ID: e3a6f0b9c125
+Revises: b4f81c6e2a97
+Create Date: 2026-10-18 23:12:05.684219
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a6f0b9c125'
+down_revision = 'b4f81c6e2a97'
+branch_labels = None
+depends_on = None
+
+
+def _proximo_mes(mes: date) -> date:
+    return date(mes.year + mes.month // 12, mes.month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    # Particionada por mês de realizado_em; as partições dos demais meses são criadas pela
+    # API na primeira escrita de cada mês (treino/particoes.py)
+    op.create_table(
+        'treinos',
+        sa.Column('realizado_em', sa.DateTime(), nullable=False),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('atleta_id', sa.Integer(), nullable=False),
+        sa.Column('tipo', sa.String(length=10), nullable=False),
+        sa.Column('exercicio', sa.String(length=50), nullable=False),
+        sa.Column('series', sa.Integer(), nullable=True),
+        sa.Column('repeticoes', sa.Integer(), nullable=True),
+        sa.Column('carga', sa.Float(), nullable=True),
+        sa.Column('pontuacao', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['atleta_id'], ['atletas.pk_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('realizado_em', 'id'),
+        postgresql_partition_by='RANGE (realizado_em)',
+    )
+    op.create_index('ix_treinos_atleta_realizado', 'treinos', ['atleta_id', 'realizado_em', 'id'], unique=False)
+
+    mes = date.today().replace(day=1)
+    for _ in range(2):
+        proximo = _proximo_mes(mes)
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS treinos_p{mes:%Y_%m} PARTITION OF treinos "
+            f"FOR VALUES FROM ('{mes.isoformat()}') TO ('{proximo.isoformat()}')"
+        )
+        mes = proximo
+
+
+def downgrade() -> None:
+    op.drop_index('ix_treinos_atleta_realizado', table_name='treinos')
+    # As partições são removidas junto com a tabela principal
+    op.drop_table('treinos')
@@ -0,0 +1,62 @@
+"""treinos_recordes
+
+Revision ID: f5c2d8a1e437
+Revises: e3a6f0b9c125
+Create Date: 2026-10-18 23:48:31.205716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5c2d8a1e437'
+down_revision = 'e3a6f0b9c125'
+branch_labels = None
+depends_on = None
+
+# Valor padrão de LEADERBOARD_EXERCICIOS_POR_TEMPO quando a migração foi escrita: a carga inicial
+# não depende do ambiente de quem a executa. Com outra lista configurada, recalcule os recordes
+# (job treinos.recordes)
+POR_TEMPO = ('Fran', 'Grace', 'Helen', 'Diane', 'Elizabeth', 'Isabel', 'Karen', 'Annie', 'Jackie', 'Murph')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'treinos_recordes',
+        sa.Column('atleta_id', sa.Integer(), nullable=False),
+        sa.Column('exercicio', sa.String(length=50), nullable=False),
+        sa.Column('valor', sa.Float(), nullable=False),
+        sa.Column('chave', sa.Float(), nullable=False),
+        sa.Column('realizado_em', sa.DateTime(), nullable=False),
+        sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['atleta_id'], ['atletas.pk_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('atleta_id', 'exercicio')
+    )
+    op.create_index(
+        op.f('ix_treinos_recordes_atualizado_em'), 'treinos_recordes', ['atualizado_em'], unique=False
+    )
+
+    # Carga inicial com os treinos existentes (mesma consulta de treino/recordes.py);
+    # daí em diante a API mantém os recordes
+    por_tempo = ', '.join(f"'{exercicio}'" for exercicio in POR_TEMPO)
+    op.execute(
+        "INSERT INTO treinos_recordes (atleta_id, exercicio, valor, chave, realizado_em, atualizado_em) "
+        "SELECT atleta_id, exercicio, valor, chave, realizado_em, now() FROM ("
+        "  SELECT atleta_id, exercicio, valor, realizado_em,"
+        f"    CASE WHEN exercicio IN ({por_tempo}) THEN valor ELSE -valor END AS chave,"
+        "    row_number() OVER ("
+        "      PARTITION BY atleta_id, exercicio"
+        f"      ORDER BY CASE WHEN exercicio IN ({por_tempo}) THEN valor ELSE -valor END, realizado_em"
+        "    ) AS ordem"
+        "  FROM ("
+        "    SELECT atleta_id, exercicio, realizado_em,"
+        "      CASE WHEN tipo = 'forca' THEN carga ELSE pontuacao END AS valor"
+        "    FROM treinos"
+        "  ) AS resultados WHERE valor IS NOT NULL"
+        ") AS ordenados WHERE ordem = 1"
+    )
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_treinos_recordes_atualizado_em'), table_name='treinos_recordes')
+    op.drop_table('treinos_recordes')
@@ -0,0 +1,132 @@
+"""Utilitários compartilhados pelos benchmarks: engine, schema, carga de dados e percentis."""
+import math
+import random
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+import workout_api.contrib.repository.models  # noqa: F401  (registra todos os modelos no metadata)
+from workout_api.atleta.estatisticas import recalcular_estatisticas
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.contrib.contagem import recalcular_contagem
+from workout_api.contrib.models import BaseModel
+from workout_api.treino.models import TreinoModel
+from workout_api.treino.particoes import ddl_particao, mes_de, proximo_mes
+from workout_api.treino.recordes import recalcular_recordes
+
+LOTE = 5_000
+
+NOMES = ['João', 'José', 'Maria', 'Ana', 'Antônio', 'Francisco', 'Luíza', 'Márcia', 'Sebastião', 'Conceição']
+SOBRENOMES = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Lima', 'Araújo', 'Gonçalves', 'Conceição', 'Simões', 'Brandão']
+
+
+def criar_engine(url: str) -> AsyncEngine:
+    return create_async_engine(url, echo=False)
+
+
+async def recriar_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.drop_all)
+        await conn.run_sync(BaseModel.metadata.create_all)
+
+
+async def popular(
+    engine: AsyncEngine,
+    atletas: int,
+    categorias: int = 5,
+    centros: int = 10,
+    treinos_por_atleta: int = 0,
+    seed: int = 42,
+) -> list:
+    """
+    Insere os volumes pedidos em lotes e devolve os ids (UUID) dos atletas criados. Os treinos
+    de cada atleta ficam espalhados pelos últimos 12 meses.
+    """
+    aleatorio = random.Random(seed)
+    ids = []
+
+    async with engine.begin() as conn:
+        await conn.execute(insert(CategoriaModel), [
+            {'pk_id': i + 1, 'id': uuid4(), 'nome': f'Cat {i + 1}'} for i in range(categorias)
+        ])
+        await conn.execute(insert(CentroTreinamentoModel), [
+            {'pk_id': i + 1, 'id': uuid4(), 'nome': f'CT {i + 1}', 'endereco': f'Rua {i + 1}', 'proprietario': 'Bench'}
+            for i in range(centros)
+        ])
+
+        for inicio in range(0, atletas, LOTE):
+            linhas = []
+            for n in range(inicio, min(inicio + LOTE, atletas)):
+                atleta_id = uuid4()
+                ids.append(atleta_id)
+                linhas.append({
+                    'pk_id': n + 1,
+                    'id': atleta_id,
+                    'nome': f'{aleatorio.choice(NOMES)} {aleatorio.choice(SOBRENOMES)} {n}',
+                    'cpf': f'{n:011d}',
+                    'idade': aleatorio.randint(14, 70),
+                    'peso': round(aleatorio.uniform(45, 130), 1),
+                    'altura': round(aleatorio.uniform(1.45, 2.05), 2),
+                    'sexo': aleatorio.choice('MF'),
+                    'created_at': datetime.now(),
+                    'categoria_id': aleatorio.randint(1, categorias),
+                    'centro_treinamento_id': aleatorio.randint(1, centros),
+                })
+            await conn.execute(insert(AtletaModel), linhas)
+
+        # A carga direta não passa pela API, que mantém as estatísticas e os contadores
+        await recalcular_estatisticas(conn)
+        await recalcular_contagem(conn, CategoriaModel.__table__)
+        await recalcular_contagem(conn, CentroTreinamentoModel.__table__)
+
+        if treinos_por_atleta:
+            await _popular_treinos(conn, atletas, treinos_por_atleta, aleatorio)
+            # Idem para os recordes, base dos placares do leaderboard
+            await recalcular_recordes(conn)
+
+    return ids
+
+
+async def _popular_treinos(conn, atletas: int, por_atleta: int, aleatorio: random.Random) -> None:
+    agora = datetime.now()
+    inicio = agora - timedelta(days=365)
+    if conn.dialect.name == 'postgresql':
+        # A carga direta não passa pela API, que cria as partições mensais sob demanda
+        mes = mes_de(inicio)
+        while mes <= agora.date():
+            await conn.execute(text(ddl_particao(mes)))
+            mes = proximo_mes(mes)
+
+    linhas = []
+    for atleta in range(1, atletas + 1):
+        for _ in range(por_atleta):
+            forca = aleatorio.random() < 0.5
+            linhas.append({
+                'id': uuid4(),
+                'atleta_id': atleta,
+                'realizado_em': inicio + timedelta(seconds=aleatorio.randint(0, 365 * 86_400)),
+                'tipo': 'forca' if forca else 'wod',
+                'exercicio': aleatorio.choice(['Back Squat', 'Deadlift', 'Snatch']) if forca else 'Fran',
+                'series': 5 if forca else None,
+                'repeticoes': 5 if forca else None,
+                'carga': round(aleatorio.uniform(40, 200), 1) if forca else None,
+                'pontuacao': None if forca else aleatorio.randint(120, 900),
+                'created_at': agora,
+            })
+            if len(linhas) >= LOTE:
+                await conn.execute(insert(TreinoModel), linhas)
+                linhas = []
+    if linhas:
+        await conn.execute(insert(TreinoModel), linhas)
+
+
+def percentil(valores: list[float], p: float) -> float:
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    posicao = max(0, math.ceil(p / 100 * len(ordenados)) - 1)
+    return ordenados[posicao]
@@ -0,0 +1,74 @@
+"""
+Formatos de resposta das listagens: JSON (pydantic-core) contra MessagePack, sem compressão
+e com gzip/brotli (nos níveis usados por NegociacaoConteudo). Mede o tamanho do corpo e o
+tempo de codificação (serialização + compressão) de páginas de 1k atletas; só CPU, sem banco.
+Sem o pacote `brotli` instalado, as variantes 'br' são omitidas.
+
+    python -m benchmarks.formatos --tamanhos 1000 --repeticoes 20
+"""
+import argparse
+import gzip
+import json
+import time
+
+import msgpack
+
+from benchmarks.comum import percentil
+from benchmarks.serializacao import CENARIOS, _linhas
+from workout_api.contrib.negociacao import RespostaMsgpack
+from workout_api.contrib.serializacao import RespostaJson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FORMATOS = {
+    'json': lambda conteudo: RespostaJson(conteudo).body,
+    'msgpack': lambda conteudo: RespostaMsgpack(conteudo).body,
+}
+
+COMPRESSOES = {
+    'identity': lambda corpo: corpo,
+    'gzip': lambda corpo: gzip.compress(corpo, compresslevel=6),
+}
+if brotli is not None:
+    COMPRESSOES['br'] = lambda corpo: brotli.compress(corpo, quality=5)
+
+
+def _medir(conteudo, repeticoes: int) -> dict:
+    resultado = {}
+    for formato, serializar in FORMATOS.items():
+        for compressao, comprimir in COMPRESSOES.items():
+            tempos = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                corpo = comprimir(serializar(conteudo))
+                tempos.append((time.perf_counter() - inicio) * 1000)
+            resultado[f'{formato}+{compressao}'] = {
+                'bytes': len(corpo),
+                'p50_ms': round(percentil(tempos, 50), 2),
+                'p95_ms': round(percentil(tempos, 95), 2),
+            }
+
+    base = resultado['json+identity']
+    for medida in resultado.values():
+        medida['bytes_vs_json'] = round(medida['bytes'] / base['bytes'], 3)
+    return resultado
+
+
+def main(args) -> None:
+    for tamanho in args.tamanhos:
+        linhas = _linhas(tamanho)
+        for nome, (_, _, projetar_linhas) in CENARIOS.items():
+            conteudo = projetar_linhas(linhas)
+            # Os dois formatos devem carregar os mesmos dados
+            assert msgpack.unpackb(FORMATOS['msgpack'](conteudo)) == json.loads(FORMATOS['json'](conteudo))
+            print(json.dumps({'cenario': nome, 'itens': tamanho, **_medir(conteudo, args.repeticoes)}))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[1_000])
+    parser.add_argument('--repeticoes', type=int, default=20)
+    main(parser.parse_args())
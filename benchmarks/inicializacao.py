@@ -0,0 +1,131 @@
+"""
+Relatório de inicialização (cold start) da API, medido em processos Python novos:
+
+- importação de `workout_api.main`, que é o tempo até o uvicorn poder aceitar conexões;
+- construção do app (corpo de `workout_api.main`, sem as importações que ele dispara);
+- tempo até todas as rotas estarem registradas (`pronto_ms`), que com LAZY_ROUTERS inclui
+  o carregamento feito depois da subida;
+- tempo de importação por módulo da API e por pacote externo (python -X importtime).
+
+    python -m benchmarks.inicializacao --repeticoes 5 --saida inicializacao.json
+    python -m benchmarks.inicializacao --orcamento-ms 3000
+
+Com --orcamento-ms o comando é o teste de orçamento de inicialização: termina com código 1
+se a mediana de `pronto_ms` de algum modo passar do limite (use no CI para barrar regressões).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+MEDICAO = """
+import asyncio, json, time
+inicio = time.perf_counter()
+import workout_api.main as main
+importado = time.perf_counter()
+if main.settings.LAZY_ROUTERS:
+    asyncio.run(main.carregamento.aguardar(main.app))
+pronto = time.perf_counter()
+print(json.dumps({
+    'importacao_main_ms': (importado - inicio) * 1000,
+    'pronto_ms': (pronto - inicio) * 1000,
+    'rotas': len(main.app.routes),
+}))
+"""
+
+MODOS = {'padrao': 'false', 'lazy_routers': 'true'}
+
+
+def _ler_importtime(saida: str) -> dict[str, tuple[float, float]]:
+    # Linhas "import time: <próprio us> | <acumulado us> | <módulo indentado>"
+    modulos = {}
+    for linha in saida.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        _, proprio, acumulado, nome = (parte.strip() for parte in linha.replace('import time:', '|').split('|'))
+        modulos[nome] = (int(proprio) / 1000, int(acumulado) / 1000)
+    return modulos
+
+
+def medir(modo: str) -> dict:
+    ambiente = {**os.environ, 'LAZY_ROUTERS': MODOS[modo], 'JOBS_ENABLED': 'false'}
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', MEDICAO],
+        env=ambiente, capture_output=True, text=True, check=True,
+    )
+    resultado = json.loads(processo.stdout.strip().splitlines()[-1])
+    modulos = _ler_importtime(processo.stderr)
+
+    pacotes = defaultdict(float)
+    for nome, (proprio, _) in modulos.items():
+        pacotes[nome.split('.')[0]] += proprio
+
+    resultado['construcao_app_ms'] = modulos['workout_api.main'][0]
+    resultado['pacotes_ms'] = dict(pacotes)
+    resultado['modulos_ms'] = {
+        nome: {'proprio': proprio, 'acumulado': acumulado}
+        for nome, (proprio, acumulado) in modulos.items()
+        if nome.startswith('workout_api')
+    }
+    return resultado
+
+
+def _mediana(execucoes: list[dict]) -> dict:
+    # Mediana de cada métrica entre as execuções (módulos ausentes em alguma contam como 0)
+    def valores(obter):
+        return round(statistics.median(obter(execucao) for execucao in execucoes), 2)
+
+    modulos = {nome for execucao in execucoes for nome in execucao['modulos_ms']}
+    pacotes = {nome for execucao in execucoes for nome in execucao['pacotes_ms']}
+    return {
+        'importacao_main_ms': valores(lambda e: e['importacao_main_ms']),
+        'construcao_app_ms': valores(lambda e: e['construcao_app_ms']),
+        'pronto_ms': valores(lambda e: e['pronto_ms']),
+        'rotas': execucoes[0]['rotas'],
+        'pacotes_ms': dict(sorted(
+            ((nome, valores(lambda e: e['pacotes_ms'].get(nome, 0))) for nome in pacotes),
+            key=lambda item: -item[1],
+        )[:15]),
+        'modulos_ms': dict(sorted(
+            (
+                (nome, {
+                    'proprio': valores(lambda e: e['modulos_ms'].get(nome, {}).get('proprio', 0)),
+                    'acumulado': valores(lambda e: e['modulos_ms'].get(nome, {}).get('acumulado', 0)),
+                })
+                for nome in modulos
+            ),
+            key=lambda item: -item[1]['acumulado'],
+        )),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modos', nargs='+', choices=list(MODOS), default=list(MODOS))
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--orcamento-ms', type=float, help='Limite para a mediana de pronto_ms')
+    parser.add_argument('--saida', help='Arquivo do relatório JSON (padrão: stdout)')
+    args = parser.parse_args()
+
+    relatorio = {modo: _mediana([medir(modo) for _ in range(args.repeticoes)]) for modo in args.modos}
+
+    texto = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, 'w') as arquivo:
+            arquivo.write(texto)
+    else:
+        print(texto)
+
+    if args.orcamento_ms is not None:
+        estourados = {modo: r['pronto_ms'] for modo, r in relatorio.items() if r['pronto_ms'] > args.orcamento_ms}
+        for modo, pronto_ms in estourados.items():
+            print(f'{modo}: pronto em {pronto_ms} ms, acima do orçamento de {args.orcamento_ms} ms', file=sys.stderr)
+        if estourados:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
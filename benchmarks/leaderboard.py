@@ -0,0 +1,77 @@
+"""
+Placares do leaderboard: Ranking (listas ordenadas + árvore de Fenwick) contra a ordenação
+dos resultados a cada consulta. Mede a montagem com N resultados, a atualização incremental
+(novo recorde de um atleta), o top-10 e a posição de um atleta. Só CPU, sem banco.
+
+    python -m benchmarks.leaderboard --resultados 1000000 --operacoes 2000
+"""
+import argparse
+import json
+import random
+import time
+
+from benchmarks.comum import percentil
+from workout_api.leaderboard.ranking import Ranking
+
+
+def _medir(operacao, argumentos) -> dict:
+    tempos = []
+    for argumento in argumentos:
+        inicio = time.perf_counter()
+        operacao(argumento)
+        tempos.append((time.perf_counter() - inicio) * 1_000_000)
+    return {'p50_us': round(percentil(tempos, 50), 2), 'p95_us': round(percentil(tempos, 95), 2)}
+
+
+def _ordenar_topo(resultados: dict, n: int) -> list:
+    # Sem estrutura mantida: ordena todos os resultados a cada consulta
+    return sorted((chave, atleta) for atleta, chave in resultados.items())[:n]
+
+
+def _ordenar_posicao(resultados: dict, atleta: int) -> int:
+    chave = resultados[atleta]
+    return sum(1 for outra in resultados.values() if outra < chave) + 1
+
+
+def main(args) -> None:
+    aleatorio = random.Random(args.seed)
+    # Cargas em kg com uma casa decimal: muitos empates, como nos placares reais
+    resultados = {atleta: -round(aleatorio.uniform(40, 250), 1) for atleta in range(1, args.resultados + 1)}
+    atletas = [aleatorio.randint(1, args.resultados) for _ in range(args.operacoes)]
+
+    inicio = time.perf_counter()
+    ranking = Ranking((chave, atleta) for atleta, chave in resultados.items())
+    montagem_ms = (time.perf_counter() - inicio) * 1000
+    print(json.dumps({'cenario': 'montagem', 'resultados': args.resultados, 'ms': round(montagem_ms, 1)}))
+
+    def novo_recorde(atleta):
+        resultados[atleta] = chave = resultados[atleta] - 2.5
+        ranking.definir(atleta, chave)
+
+    cenarios = {
+        'novo recorde': (novo_recorde, None),
+        'top-10': (lambda _: list(ranking.topo(10)), lambda _: _ordenar_topo(resultados, 10)),
+        'posição do atleta': (ranking.posicao, lambda atleta: _ordenar_posicao(resultados, atleta)),
+    }
+    for nome, (estrutura, ordenacao) in cenarios.items():
+        resultado = {'cenario': nome, 'resultados': args.resultados, 'ranking': _medir(estrutura, atletas)}
+        if ordenacao is not None:
+            # A ordenação por consulta é ordens de grandeza mais lenta: poucas amostras bastam
+            resultado['ordenacao'] = _medir(ordenacao, atletas[:args.amostras_ordenacao])
+            resultado['ganho_p50'] = round(
+                resultado['ordenacao']['p50_us'] / max(resultado['ranking']['p50_us'], 0.01), 1
+            )
+        print(json.dumps(resultado))
+
+    # Conferência: a estrutura mantida incrementalmente concorda com a ordenação completa
+    assert [(chave, atleta) for _, atleta, chave in ranking.topo(10)] == _ordenar_topo(resultados, 10)
+    assert all(ranking.posicao(atleta) == _ordenar_posicao(resultados, atleta) for atleta in atletas[:3])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resultados', type=int, default=1_000_000)
+    parser.add_argument('--operacoes', type=int, default=2_000)
+    parser.add_argument('--amostras-ordenacao', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    main(parser.parse_args())
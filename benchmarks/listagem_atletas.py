@@ -0,0 +1,102 @@
+"""
+Listagem de atletas: objetos ORM com lazy='selectin' (implementação anterior) contra a
+projeção de colunas com JOIN usada por GET /atletas. Mede linhas/s e pico de RSS.
+
+    python -m benchmarks.listagem_atletas --db-url sqlite+aiosqlite:///bench.db --atletas 100000
+
+Cada variante roda em um subprocesso próprio, para que o pico de RSS de uma não
+contamine a outra. ATENÇÃO: o schema do banco informado é recriado.
+"""
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.comum import criar_engine, popular, recriar_schema
+from workout_api.atleta.atleta_crud import _consulta_resumo
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletaResumo
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+VARIANTES = ('orm', 'projecao')
+
+
+def _rss_mb() -> float:
+    # ru_maxrss é em KiB no Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _orm(session: AsyncSession) -> list:
+    query = select(AtletaModel).join(CategoriaModel).join(CentroTreinamentoModel)
+    atletas = (await session.execute(query)).scalars().all()
+    return [
+        {
+            'nome': atleta.nome,
+            'centro_treinamento': atleta.centro_treinamento.nome,
+            'categoria': atleta.categoria.nome,
+        }
+        for atleta in atletas
+    ]
+
+
+async def _projecao(session: AsyncSession) -> list:
+    linhas = (await session.execute(_consulta_resumo())).all()
+    return [AtletaResumo.model_validate(linha) for linha in linhas]
+
+
+async def medir_variante(db_url: str, variante: str) -> dict:
+    engine = criar_engine(db_url)
+    rss_inicial = _rss_mb()
+
+    async with AsyncSession(engine) as session:
+        inicio = time.perf_counter()
+        itens = await (_orm if variante == 'orm' else _projecao)(session)
+        duracao = time.perf_counter() - inicio
+
+    await engine.dispose()
+
+    return {
+        'variante': variante,
+        'linhas': len(itens),
+        'segundos': round(duracao, 3),
+        'linhas_por_segundo': round(len(itens) / duracao),
+        'pico_rss_mb': round(_rss_mb() - rss_inicial, 1),
+    }
+
+
+async def preparar(db_url: str, atletas: int) -> None:
+    engine = criar_engine(db_url)
+    await recriar_schema(engine)
+    await popular(engine, atletas)
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db-url', default='sqlite+aiosqlite:///bench.db')
+    parser.add_argument('--atletas', type=int, default=100_000)
+    parser.add_argument('--variante', choices=VARIANTES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variante:
+        print(json.dumps(asyncio.run(medir_variante(args.db_url, args.variante))))
+        return
+
+    asyncio.run(preparar(args.db_url, args.atletas))
+
+    for variante in VARIANTES:
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.listagem_atletas', '--db-url', args.db_url, '--variante', variante],
+            check=True,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Serialização das respostas de listagem: model_validate por linha seguido da validação
+e serialização pelo response_model do FastAPI (implementação anterior) contra os dados
+projetados das linhas, com e sem o modo rápido (bytes direto do pydantic-core).
+Com 1k e 10k itens; só CPU, sem banco.
+
+    python -m benchmarks.serializacao --tamanhos 1000 10000 --repeticoes 20
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import (
+    Column, DateTime, Float, Integer, MetaData, String, Table, Uuid, create_engine, insert, select
+)
+
+from benchmarks.comum import NOMES, SOBRENOMES, percentil
+from workout_api.atleta.schemas import AtletaOut, AtletaResumo
+from workout_api.contrib.pagination import CursorPage
+from workout_api.contrib.serializacao import RespostaJson, projetar
+
+
+def _linhas(quantidade: int) -> list:
+    # Linhas (Row) de verdade, com os tipos devolvidos pelo SQLAlchemy, lidas de um SQLite em memória
+    tabela = Table(
+        'linhas', MetaData(),
+        Column('pk_id', Integer, primary_key=True), Column('id', Uuid), Column('nome', String),
+        Column('cpf', String), Column('idade', Integer), Column('peso', Float), Column('altura', Float),
+        Column('sexo', String), Column('created_at', DateTime), Column('categoria', String),
+        Column('centro_treinamento', String),
+    )
+    engine = create_engine('sqlite://')
+    tabela.create(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(tabela), [
+            {
+                'pk_id': n,
+                'id': uuid4(),
+                'nome': f'{NOMES[n % len(NOMES)]} {SOBRENOMES[n % len(SOBRENOMES)]} {n}',
+                'cpf': f'{n:011d}',
+                'idade': 20 + n % 50,
+                'peso': 70.5,
+                'altura': 1.75,
+                'sexo': 'M',
+                'created_at': datetime.now(),
+                'categoria': 'Scale',
+                'centro_treinamento': 'CT King',
+            }
+            for n in range(quantidade)
+        ])
+        return conn.execute(select(tabela)).all()
+
+
+def _resumo_validado(linhas):
+    return CursorPage(items=[AtletaResumo.model_validate(linha) for linha in linhas], size=len(linhas))
+
+
+def _resumo_projetado(linhas):
+    return CursorPage(items=[projetar(AtletaResumo, linha) for linha in linhas], size=len(linhas))
+
+
+def _completo_validado(linhas):
+    atletas = []
+    for linha in linhas:
+        dados = {campo: valor for campo, valor in linha._mapping.items() if campo != 'pk_id'}
+        dados['categoria'] = {'nome': linha.categoria}
+        dados['centro_treinamento'] = {'nome': linha.centro_treinamento}
+        atletas.append(AtletaOut.model_validate(dados))
+    return atletas
+
+
+def _completo_projetado(linhas):
+    atletas = []
+    for linha in linhas:
+        atleta = projetar(AtletaOut, linha)
+        atleta['categoria'] = {'nome': linha.categoria}
+        atleta['centro_treinamento'] = {'nome': linha.centro_treinamento}
+        atletas.append(atleta)
+    return atletas
+
+
+CENARIOS = {
+    'GET /atletas (CursorPage[AtletaResumo])': (CursorPage[AtletaResumo], _resumo_validado, _resumo_projetado),
+    'list[AtletaOut]': (list[AtletaOut], _completo_validado, _completo_projetado),
+}
+
+
+async def _padrao(campo, conteudo) -> bytes:
+    # O que o FastAPI faz com o retorno do endpoint quando há response_model
+    return JSONResponse(await serialize_response(field=campo, response_content=conteudo)).body
+
+
+async def _medir(tipo, validar, projetar_linhas, linhas, repeticoes: int) -> dict:
+    campo = create_response_field(name='resposta', type_=tipo)
+    variantes = {
+        # model_validate por linha + response_model (implementação anterior)
+        'validado': lambda: _padrao(campo, validar(linhas)),
+        # dados projetados + response_model (FAST_SERIALIZATION_ROUTERS sem o router)
+        'desligado': lambda: _padrao(campo, projetar_linhas(linhas)),
+        # dados projetados direto para bytes (FAST_SERIALIZATION_ROUTERS com o router)
+        'rapido': lambda: _rapido(projetar_linhas(linhas)),
+    }
+    tempos = {variante: [] for variante in variantes}
+    corpos = {}
+
+    for _ in range(repeticoes):
+        for variante, executar in variantes.items():
+            inicio = time.perf_counter()
+            corpos[variante] = await executar()
+            tempos[variante].append((time.perf_counter() - inicio) * 1000)
+
+    esperado = json.loads(corpos['validado'])
+    assert all(json.loads(corpo) == esperado for corpo in corpos.values()), 'As variantes devem gerar o mesmo JSON'
+
+    resultado = {
+        variante: {'p50_ms': round(percentil(valores, 50), 2), 'p95_ms': round(percentil(valores, 95), 2)}
+        for variante, valores in tempos.items()
+    }
+    resultado['ganho_p50'] = round(resultado['validado']['p50_ms'] / resultado['rapido']['p50_ms'], 2)
+    return resultado
+
+
+async def _rapido(conteudo) -> bytes:
+    return RespostaJson(conteudo).body
+
+
+async def main(args) -> None:
+    for tamanho in args.tamanhos:
+        linhas = _linhas(tamanho)
+        for nome, (tipo, validar, projetar_linhas) in CENARIOS.items():
+            resultado = await _medir(tipo, validar, projetar_linhas, linhas, args.repeticoes)
+            print(json.dumps({'cenario': nome, 'itens': tamanho, **resultado}))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[1_000, 10_000])
+    parser.add_argument('--repeticoes', type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,70 @@
+import asyncio
+import json
+import os
+import tempfile
+
+import httpx
+import pytest
+
+# Antes de qualquer import de workout_api: as configurações e a engine são lidas na importação
+DIRETORIO = tempfile.mkdtemp(prefix='workout_api_testes_')
+os.environ['DB_URL'] = f'sqlite+aiosqlite:///{os.path.join(DIRETORIO, "primario.db")}'
+os.environ['DB_REPLICA_URLS'] = '[]'
+os.environ['RATE_LIMIT_ENABLED'] = 'false'
+os.environ['MAX_IN_FLIGHT'] = '0'
+os.environ['CACHE_BACKEND'] = 'memory'
+os.environ['JOBS_DIR'] = os.path.join(DIRETORIO, 'jobs')
+
+
+@pytest.fixture
+def banco():
+    """Schema recriado no primário e cache em memória vazio; devolve a engine."""
+    from workout_api.configs import database
+    from workout_api.contrib.cache import cache
+    from workout_api.contrib.models import BaseModel
+    from workout_api.contrib.repository import models  # noqa: F401 (registra as tabelas)
+
+    async def recriar():
+        async with database.engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.drop_all)
+            await conn.run_sync(BaseModel.metadata.create_all)
+
+    asyncio.run(recriar())
+    cache._itens.clear()
+    yield database.engine
+    asyncio.run(database.engine.dispose())
+
+
+def cliente() -> httpx.AsyncClient:
+    """Cliente HTTP da API, sem servidor (o lifespan não roda: sem fila de jobs nem placares)."""
+    from workout_api.main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://teste')
+
+
+async def cadastrar(
+    api: httpx.AsyncClient, nomes: list[str], categoria: str = 'Scale', centro: str = 'CT King', cpf_inicial: int = 0
+) -> list[str]:
+    """Cria a categoria e o centro (se preciso) e um atleta por nome; devolve os ids, na ordem."""
+    await api.post('/categorias/', json={'nome': categoria})
+    await api.post('/centros_treinamento/', json={'nome': centro, 'endereco': 'Rua X', 'proprietario': 'Marcos'})
+    ids = []
+    for numero, nome in enumerate(nomes, start=cpf_inicial):
+        resposta = await api.post('/atletas/', json={
+            'nome': nome, 'cpf': f'{numero:011d}', 'idade': 25, 'peso': 75.5, 'altura': 1.7, 'sexo': 'M',
+            'categoria': {'nome': categoria}, 'centro_treinamento': {'nome': centro},
+        })
+        assert resposta.status_code == 201, resposta.text
+        ids.append(resposta.json()['id'])
+    return ids
+
+
+def ndjson(cpfs: list[str], categoria: str = 'Scale', centro: str = 'CT King') -> bytes:
+    """Corpo de importação (POST /atletas/bulk e jobs) com um atleta por CPF."""
+    return b''.join(
+        json.dumps({
+            'nome': f'Atleta {cpf}', 'cpf': cpf, 'idade': 25, 'peso': 75.5, 'altura': 1.7, 'sexo': 'M',
+            'categoria': categoria, 'centro_treinamento': centro,
+        }).encode() + b'\n'
+        for cpf in cpfs
+    )
@@ -0,0 +1,194 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from workout_api.configs.settings import settings
+from workout_api.contrib import admissao
+from workout_api.contrib.admissao import AdmissaoMiddleware, LimiteConcorrencia, LimitesMemoria, LimitesRedis
+
+CHAVE = 'chave-registrada'
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 1000.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    relogio = Relogio()
+    monkeypatch.setattr(admissao.time, 'monotonic', relogio)
+    return relogio
+
+
+@pytest.fixture
+def configuracao(monkeypatch):
+    """Balde geral de 2 fichas (1/s) e balde de 1 ficha em GET /atletas/, com os baldes em memória."""
+    monkeypatch.setattr(settings, 'RATE_LIMIT_RPS', 1)
+    monkeypatch.setattr(settings, 'RATE_LIMIT_BURST_SECONDS', 2)
+    monkeypatch.setattr(settings, 'RATE_LIMIT_ROUTES', {'GET /atletas/': 0.5})
+    monkeypatch.setattr(settings, 'RATE_LIMIT_EXEMPT_PATHS', ['/health'])
+    monkeypatch.setattr(settings, 'RATE_LIMIT_API_KEYS', [CHAVE])
+    monkeypatch.setattr(admissao, 'limites', LimitesMemoria())
+    monkeypatch.setattr(admissao, 'concorrencia', None)
+
+
+def _criar_app(liberar: asyncio.Event | None = None) -> FastAPI:
+    # O middleware é montado na primeira requisição, depois das configurações do teste
+    app = FastAPI()
+    app.add_middleware(AdmissaoMiddleware)
+
+    @app.get('/atletas/')
+    async def atletas():
+        return []
+
+    @app.get('/categorias/')
+    async def categorias():
+        if liberar is not None:
+            await liberar.wait()
+        return []
+
+    @app.get('/health')
+    async def health():
+        return {'status': 'ok'}
+
+    return app
+
+
+def _cliente(app: FastAPI, ip: str = '10.0.0.1') -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=app, client=(ip, 1234))
+    return httpx.AsyncClient(transport=transport, base_url='http://teste')
+
+
+def test_balde_do_cliente_vazio_recebe_429(configuracao, relogio):
+    async def executar():
+        async with _cliente(_criar_app()) as cliente:
+            assert (await cliente.get('/categorias/')).status_code == 200
+            assert (await cliente.get('/categorias/')).status_code == 200
+            resposta = await cliente.get('/categorias/')
+            assert resposta.status_code == 429
+            assert resposta.headers['retry-after'] == '1'
+
+            relogio.agora += 1
+            assert (await cliente.get('/categorias/')).status_code == 200
+
+    asyncio.run(executar())
+
+
+def test_balde_da_rota_vazio_recebe_429(configuracao, relogio):
+    async def executar():
+        async with _cliente(_criar_app()) as cliente:
+            assert (await cliente.get('/atletas/')).status_code == 200
+            resposta = await cliente.get('/atletas/')
+            assert resposta.status_code == 429
+            # Uma ficha a 0,5/s: 2 segundos
+            assert resposta.headers['retry-after'] == '2'
+            # O balde geral ainda tem ficha para as demais rotas
+            assert (await cliente.get('/categorias/')).status_code == 200
+
+    asyncio.run(executar())
+
+
+def test_chave_registrada_e_ip_tem_baldes_separados(configuracao, relogio):
+    async def executar():
+        async with _cliente(_criar_app()) as cliente:
+            for _ in range(2):
+                assert (await cliente.get('/categorias/')).status_code == 200
+            assert (await cliente.get('/categorias/')).status_code == 429
+
+            # Chave não registrada: o cliente continua sendo o IP
+            resposta = await cliente.get('/categorias/', headers={'X-API-Key': 'qualquer'})
+            assert resposta.status_code == 429
+
+            for _ in range(2):
+                resposta = await cliente.get('/categorias/', headers={'X-API-Key': CHAVE})
+                assert resposta.status_code == 200
+            assert (await cliente.get('/categorias/', headers={'X-API-Key': CHAVE})).status_code == 429
+
+        # Outro IP, outro balde
+        async with _cliente(_criar_app(), ip='10.0.0.2') as cliente:
+            assert (await cliente.get('/categorias/')).status_code == 200
+
+    asyncio.run(executar())
+
+
+def test_caminhos_isentos_nao_consomem_fichas(configuracao, relogio):
+    async def executar():
+        async with _cliente(_criar_app()) as cliente:
+            for _ in range(5):
+                assert (await cliente.get('/health')).status_code == 200
+            assert (await cliente.get('/categorias/')).status_code == 200
+
+    asyncio.run(executar())
+
+
+def test_falha_do_backend_admite_a_requisicao(configuracao, monkeypatch):
+    class Indisponivel(LimitesMemoria):
+        async def consumir(self, baldes):
+            raise ConnectionError('redis fora do ar')
+
+    monkeypatch.setattr(admissao, 'limites', Indisponivel())
+
+    async def executar():
+        async with _cliente(_criar_app()) as cliente:
+            for _ in range(5):
+                assert (await cliente.get('/categorias/')).status_code == 200
+
+    asyncio.run(executar())
+
+
+def test_teto_e_fila_cheios_recebem_503(configuracao, monkeypatch):
+    monkeypatch.setattr(admissao, 'limites', None)
+    monkeypatch.setattr(settings, 'MAX_IN_FLIGHT_WAIT_SECONDS', 5)
+    concorrencia = LimiteConcorrencia(maximo=1, fila=1, espera=5)
+    monkeypatch.setattr(admissao, 'concorrencia', concorrencia)
+
+    async def executar():
+        liberar = asyncio.Event()
+        async with _cliente(_criar_app(liberar)) as cliente:
+            em_andamento = asyncio.create_task(cliente.get('/categorias/'))
+            while concorrencia.em_andamento < 1:
+                await asyncio.sleep(0.01)
+            na_fila = asyncio.create_task(cliente.get('/categorias/'))
+            while concorrencia.aguardando < 1:
+                await asyncio.sleep(0.01)
+
+            resposta = await cliente.get('/categorias/')
+            assert resposta.status_code == 503
+            assert resposta.headers['retry-after'] == '5'
+
+            liberar.set()
+            assert (await em_andamento).status_code == 200
+            assert (await na_fila).status_code == 200
+            assert concorrencia.em_andamento == 0
+
+    asyncio.run(executar())
+
+
+def test_redis_com_fakeredis():
+    aioredis = pytest.importorskip('fakeredis.aioredis')
+    pytest.importorskip('lupa')
+
+    async def executar():
+        cliente = aioredis.FakeRedis()
+        limites = LimitesRedis(client=cliente)
+        geral = ('limite:{ip:1}', 3, 1)
+        rota = ('limite:{ip:1}:GET /atletas/', 1, 0.5)
+
+        assert await limites.consumir([geral, rota]) == 0
+        espera = await limites.consumir([geral, rota])
+        assert 1.9 < espera <= 2
+        # Recusada pelo balde da rota, a requisição não consome do balde geral
+        assert float(await cliente.hget('limite:{ip:1}', 'f')) == pytest.approx(2, abs=0.01)
+
+        assert await limites.consumir([geral]) == 0
+        assert await limites.consumir([geral]) == 0
+        assert await limites.consumir([geral]) > 0
+        assert 0 < await cliente.pttl('limite:{ip:1}') <= 4000
+
+    asyncio.run(executar())
@@ -0,0 +1,140 @@
+import asyncio
+import uuid
+
+from conftest import cadastrar, cliente
+from workout_api.atleta import atleta_crud
+from workout_api.configs.settings import settings
+
+
+def test_patch_com_if_match(banco):
+    async def executar():
+        async with cliente() as api:
+            [id] = await cadastrar(api, ['Ana'])
+
+            resposta = await api.get(f'/atletas/{id}')
+            assert resposta.status_code == 200
+            etag = resposta.headers['etag']
+            assert not etag.startswith('W/')
+
+            resposta = await api.patch(f'/atletas/{id}', json={'idade': 30}, headers={'If-Match': etag})
+            assert resposta.status_code == 200
+            assert resposta.json()['idade'] == 30
+            nova = resposta.headers['etag']
+            assert nova != etag
+            assert (await api.get(f'/atletas/{id}')).headers['etag'] == nova
+
+            # Outra requisição já alterou o atleta: o ETag anterior não vale mais, e nada é alterado
+            resposta = await api.patch(f'/atletas/{id}', json={'idade': 31}, headers={'If-Match': etag})
+            assert resposta.status_code == 412
+            assert (await api.get(f'/atletas/{id}')).json()['idade'] == 30
+
+            # ETag fraco (ex.: de uma resposta comprimida): a comparação forte recusa
+            resposta = await api.patch(f'/atletas/{id}', json={'idade': 31}, headers={'If-Match': f'W/{nova}'})
+            assert resposta.status_code == 412
+
+            resposta = await api.patch(f'/atletas/{uuid.uuid4()}', json={'idade': 31}, headers={'If-Match': nova})
+            assert resposta.status_code == 404
+
+            # Sem If-Match (ou com '*') a edição não é condicionada
+            resposta = await api.patch(f'/atletas/{id}', json={'idade': 32}, headers={'If-Match': '*'})
+            assert resposta.status_code == 200
+            resposta = await api.patch(f'/atletas/{id}', json={'idade': 33})
+            assert resposta.status_code == 200
+            assert resposta.headers['etag'] != nova
+
+    asyncio.run(executar())
+
+
+async def _nomes(api) -> list[str]:
+    return sorted(item['nome'] for item in (await api.get('/atletas/', params={'size': 100})).json()['items'])
+
+
+async def _idades(api, ids: list[str]) -> list[int]:
+    return [(await api.get(f'/atletas/{id}')).json()['idade'] for id in ids]
+
+
+def test_lote_dry_run_conta_sem_alterar(banco):
+    async def executar():
+        async with cliente() as api:
+            ids = await cadastrar(api, ['João 1', 'João 2', 'Maria'])
+
+            resposta = await api.request('DELETE', '/atletas/?dry_run=true', json={'nome': 'joão'})
+            assert resposta.json() == {'afetados': 2, 'dry_run': True}
+            resposta = await api.patch('/atletas/?dry_run=true', json={'nome': 'joão', 'alteracao': {'idade': 40}})
+            assert resposta.json() == {'afetados': 2, 'dry_run': True}
+
+            assert await _nomes(api) == ['João 1', 'João 2', 'Maria']
+            assert await _idades(api, ids) == [25, 25, 25]
+
+            resposta = await api.request('DELETE', '/atletas/', json={'nome': 'joão'})
+            assert resposta.json() == {'afetados': 2, 'dry_run': False}
+            assert await _nomes(api) == ['Maria']
+
+    asyncio.run(executar())
+
+
+def test_lote_sem_ids_nem_filtro_e_recusado(banco):
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, ['Ana'])
+
+            resposta = await api.request('DELETE', '/atletas/', json={})
+            assert resposta.status_code == 400
+            resposta = await api.patch('/atletas/', json={'alteracao': {'idade': 40}})
+            assert resposta.status_code == 400
+            assert await _nomes(api) == ['Ana']
+
+    asyncio.run(executar())
+
+
+def test_lote_acima_do_limite_e_recusado_e_desfeito(banco, monkeypatch):
+    monkeypatch.setattr(settings, 'ATLETAS_LOTE_MAX', 2)
+
+    async def executar():
+        async with cliente() as api:
+            ids = await cadastrar(api, ['João 1', 'João 2', 'João 3', 'Maria'])
+
+            resposta = await api.request('DELETE', '/atletas/', json={'nome': 'joão'})
+            assert resposta.status_code == 400
+            assert await _nomes(api) == ['João 1', 'João 2', 'João 3', 'Maria']
+
+            # A contagem passa (2), mas outra transação grava um terceiro João antes do comando:
+            # o limite vale para as linhas que o comando alterou, e tudo é desfeito
+            await api.request('DELETE', '/atletas/', json={'nome': 'João 3'})
+            executar_com_estatisticas = atleta_crud.executar_com_estatisticas
+            concorrentes = ['João 4']
+
+            async def com_insercao_concorrente(*args, **kwargs):
+                # O POST concorrente também passa por aqui: só o primeiro comando o dispara
+                if concorrentes:
+                    await cadastrar(api, [concorrentes.pop()], cpf_inicial=4)
+                return await executar_com_estatisticas(*args, **kwargs)
+
+            monkeypatch.setattr(atleta_crud, 'executar_com_estatisticas', com_insercao_concorrente)
+            resposta = await api.patch('/atletas/', json={'nome': 'joão', 'alteracao': {'idade': 40}})
+            monkeypatch.setattr(atleta_crud, 'executar_com_estatisticas', executar_com_estatisticas)
+
+            assert resposta.status_code == 400
+            assert '3 atletas' in resposta.json()['detail']
+            assert await _nomes(api) == ['João 1', 'João 2', 'João 4', 'Maria']
+            assert await _idades(api, [ids[0], ids[1], ids[3]]) == [25, 25, 25]
+
+    asyncio.run(executar())
+
+
+def test_lote_troca_de_categoria_atualiza_as_estatisticas(banco):
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, ['João 1', 'João 2', 'Maria'])
+            await api.post('/categorias/', json={'nome': 'RX'})
+            await api.patch('/atletas/', json={'nome': 'Maria', 'alteracao': {'idade': 31}})
+
+            resposta = await api.patch('/atletas/', json={'nome': 'joão', 'alteracao': {'categoria': 'RX'}})
+            assert resposta.json() == {'afetados': 2, 'dry_run': False}
+
+            estatisticas = (await api.get('/atletas/stats', params={'dimensoes': 'categoria'})).json()
+            assert [(item['categoria'], item['quantidade'], item['idade_media']) for item in estatisticas] == [
+                ('RX', 2, 25), ('Scale', 1, 31)
+            ]
+
+    asyncio.run(executar())
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from workout_api.contrib import cache as modulo_cache
+from workout_api.contrib.cache import CacheBackend, MemoryCache, RedisCache
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 1000.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    relogio = Relogio()
+    monkeypatch.setattr(modulo_cache.time, 'monotonic', relogio)
+    return relogio
+
+
+def test_backend_incompleto_falha_ao_ser_instanciado():
+    class SemInvalidar(CacheBackend):
+        nome = 'incompleto'
+
+        async def _get(self, chave):
+            return None
+
+        async def _set(self, chave, valor, ttl):
+            pass
+
+    with pytest.raises(TypeError):
+        SemInvalidar(ttl=1)
+
+
+def test_memoria_expira_pelo_ttl(relogio):
+    async def executar():
+        cache = MemoryCache(ttl=10, max_itens=100)
+        await cache.set('categorias:a', {'nome': 'Scale'})
+        await cache.set('categorias:b', 1, ttl=30)
+
+        relogio.agora += 9
+        assert await cache.get('categorias:a') == {'nome': 'Scale'}
+        relogio.agora += 2
+        assert await cache.get('categorias:a') is None
+        assert await cache.get('categorias:b') == 1
+        assert cache.estatisticas()['hits'] == 2
+        assert cache.estatisticas()['misses'] == 1
+
+    asyncio.run(executar())
+
+
+def test_memoria_descarta_o_menos_recente(relogio):
+    async def executar():
+        cache = MemoryCache(ttl=10, max_itens=2)
+        await cache.set('categorias:a', 'a')
+        await cache.set('categorias:b', 'b')
+        # A leitura torna 'a' o mais recente: 'b' é o descartado
+        assert await cache.get('categorias:a') == 'a'
+        await cache.set('categorias:c', 'c')
+
+        assert await cache.get_many(['categorias:a', 'categorias:b', 'categorias:c']) == ['a', None, 'c']
+        assert cache.estatisticas()['evictions'] == 1
+
+    asyncio.run(executar())
+
+
+def test_memoria_invalida_apenas_o_namespace(relogio):
+    async def executar():
+        cache = MemoryCache(ttl=10, max_itens=100)
+        await cache.set('categorias:a', 'a')
+        await cache.set('centros_treinamento:a', 'a')
+        await cache.invalidar('categorias')
+
+        assert await cache.get('categorias:a') is None
+        assert await cache.get('centros_treinamento:a') == 'a'
+
+    asyncio.run(executar())
+
+
+def test_redis_com_fakeredis():
+    aioredis = pytest.importorskip('fakeredis.aioredis')
+
+    async def executar():
+        cliente = aioredis.FakeRedis()
+        cache = RedisCache(ttl=10, client=cliente)
+        await cache.set('categorias:a', {'nome': 'Scale'})
+        await cache.set('categorias:b', [1, 2], ttl=0.5)
+        await cache.set('centros_treinamento:a', 'a')
+
+        assert await cache.get('categorias:a') == {'nome': 'Scale'}
+        assert 0 < await cliente.pttl('categorias:a') <= 10_000
+        assert await cache.get_many(['categorias:b', 'categorias:c']) == [[1, 2], None]
+
+        await cache.invalidar('categorias')
+        assert await cache.get_many(['categorias:a', 'categorias:b']) == [None, None]
+        assert await cache.get('centros_treinamento:a') == 'a'
+        assert cache.estatisticas() == {'backend': 'redis', 'hits': 3, 'misses': 3}
+
+    asyncio.run(executar())
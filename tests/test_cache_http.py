@@ -0,0 +1,63 @@
+import asyncio
+
+from sqlalchemy import event
+
+from conftest import cliente
+from workout_api.configs.settings import settings
+
+
+def test_if_none_match_antes_e_depois_de_criar_categoria(banco):
+    conexoes = {'checkouts': 0}
+
+    @event.listens_for(banco.sync_engine, 'checkout')
+    def _contar(*_):
+        conexoes['checkouts'] += 1
+
+    async def executar():
+        async with cliente() as api:
+            resposta = await api.get('/categorias/')
+            assert resposta.status_code == 200
+            etag = resposta.headers['etag']
+            assert not etag.startswith('W/')
+            assert resposta.headers['cache-control'] == f'public, max-age={settings.HTTP_CACHE_MAX_AGE}'
+
+            # Versão no cache: o 304 sai sem usar uma conexão do banco
+            conexoes['checkouts'] = 0
+            resposta = await api.get('/categorias/', headers={'If-None-Match': etag})
+            assert resposta.status_code == 304
+            assert resposta.headers['etag'] == etag
+            assert resposta.content == b''
+            assert conexoes['checkouts'] == 0
+
+            assert (await api.post('/categorias/', json={'nome': 'Scale'})).status_code == 201
+
+            resposta = await api.get('/categorias/', headers={'If-None-Match': etag})
+            assert resposta.status_code == 200
+            assert resposta.headers['etag'] != etag
+            assert [item['nome'] for item in resposta.json()['items']] == ['Scale']
+
+            nova = resposta.headers['etag']
+            conexoes['checkouts'] = 0
+            resposta = await api.get('/categorias/', headers={'If-None-Match': f'"outra", {nova}'})
+            assert resposta.status_code == 304
+            assert conexoes['checkouts'] == 0
+
+    asyncio.run(executar())
+
+
+def test_versao_fora_do_cache_e_lida_do_banco(banco):
+    from workout_api.contrib.cache import cache
+
+    async def executar():
+        async with cliente() as api:
+            assert (await api.post('/centros_treinamento/', json={
+                'nome': 'CT King', 'endereco': 'Rua X', 'proprietario': 'Marcos'
+            })).status_code == 201
+            etag = (await api.get('/centros_treinamento/')).headers['etag']
+
+            # Outro worker (ou o TTL) sem a versão no cache: o banco dá a mesma versão
+            await cache.invalidar('centros_treinamento')
+            resposta = await api.get('/centros_treinamento/', headers={'If-None-Match': etag})
+            assert resposta.status_code == 304
+
+    asyncio.run(executar())
@@ -0,0 +1,75 @@
+import asyncio
+
+from conftest import cadastrar, cliente
+from workout_api.atleta import atleta_crud
+from workout_api.contrib.coalescencia import coalescencia
+
+
+def _contadores() -> tuple[int, int]:
+    return coalescencia.executadas['atletas'], coalescencia.coalescidas['atletas']
+
+
+def test_leituras_concorrentes_iguais_executam_uma_vez(banco, monkeypatch):
+    paginar_por_cursor = atleta_crud.paginar_por_cursor
+    chegou, liberar = asyncio.Event(), asyncio.Event()
+
+    async def paginar_retido(*args, **kwargs):
+        # Segura a primeira execução até as demais requisições estarem aguardando por ela
+        chegou.set()
+        await liberar.wait()
+        return await paginar_por_cursor(*args, **kwargs)
+
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, ['Ana', 'Bia'])
+            executadas, coalescidas = _contadores()
+            monkeypatch.setattr(atleta_crud, 'paginar_por_cursor', paginar_retido)
+
+            leituras = [asyncio.create_task(api.get('/atletas/', params={'total': 'exact'})) for _ in range(5)]
+            await chegou.wait()
+            await asyncio.sleep(0.2)
+            liberar.set()
+            respostas = await asyncio.gather(*leituras)
+
+            assert {resposta.status_code for resposta in respostas} == {200}
+            assert all(resposta.json() == respostas[0].json() for resposta in respostas)
+            assert respostas[0].json()['total'] == 2
+            assert _contadores() == (executadas + 1, coalescidas + 4)
+
+    asyncio.run(executar())
+
+
+def test_escrita_esquece_a_leitura_em_andamento(banco, monkeypatch):
+    paginar_por_cursor = atleta_crud.paginar_por_cursor
+    chegou, liberar = asyncio.Event(), asyncio.Event()
+    retidas = [True]
+
+    async def paginar_retido(*args, **kwargs):
+        # Só a primeira leitura fica retida: ela começou antes da escrita
+        if retidas and retidas.pop():
+            chegou.set()
+            await liberar.wait()
+        return await paginar_por_cursor(*args, **kwargs)
+
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, ['Ana'])
+            monkeypatch.setattr(atleta_crud, 'paginar_por_cursor', paginar_retido)
+
+            antiga = asyncio.create_task(api.get('/atletas/'))
+            await chegou.wait()
+            assert any(chave.startswith('atletas:') for chave in coalescencia._em_andamento)
+
+            await cadastrar(api, ['Bia'], cpf_inicial=1)
+            assert not any(chave.startswith('atletas:') for chave in coalescencia._em_andamento)
+
+            # A leitura seguinte não aguarda a anterior: vai ao banco e já vê o atleta novo
+            executadas, coalescidas = _contadores()
+            resposta = await asyncio.wait_for(api.get('/atletas/'), timeout=5)
+            assert [item['nome'] for item in resposta.json()['items']] == ['Ana', 'Bia']
+            assert _contadores() == (executadas + 1, coalescidas)
+
+            liberar.set()
+            assert (await antiga).status_code == 200
+
+    asyncio.run(executar())
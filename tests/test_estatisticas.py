@@ -0,0 +1,124 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from conftest import cliente
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs import database
+from workout_api.contrib.models import BaseModel
+
+ATLETAS = [
+    # nome, sexo, idade, peso, altura, categoria, centro
+    ('Ana', 'F', 22, 58.5, 1.62, 'Scale', 'CT King'),
+    ('Bia', 'F', 31, 64.0, 1.70, 'Scale', 'CT King'),
+    ('Caio', 'M', 27, 82.3, 1.81, 'Scale', 'CT Queen'),
+    ('Duda', 'F', 35, 70.1, 1.75, 'RX', 'CT King'),
+    ('Enzo', 'M', 41, 90.0, 1.88, 'RX', 'CT Queen'),
+    ('Fábio', 'M', 19, 68.7, 1.69, 'RX', 'CT Queen'),
+]
+
+
+@pytest.fixture(params=['sqlite', 'postgresql'])
+def engine(request, banco, monkeypatch):
+    """
+    Os agregados são mantidos por caminhos diferentes no SQLite e no Postgres: o segundo roda
+    quando TESTS_POSTGRES_URL aponta para um banco de testes (o schema é recriado).
+    """
+    if request.param == 'sqlite':
+        yield banco
+        return
+
+    url = os.environ.get('TESTS_POSTGRES_URL')
+    if not url:
+        pytest.skip('TESTS_POSTGRES_URL não definida')
+    engine = create_async_engine(url)
+
+    async def recriar():
+        async with engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.drop_all)
+            await conn.run_sync(BaseModel.metadata.create_all)
+
+    asyncio.run(recriar())
+    monkeypatch.setattr(database, 'async_session', sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+async def _group_by(engine) -> list[tuple]:
+    """As estatísticas calculadas do zero, com GROUP BY sobre atletas."""
+    a = AtletaModel
+    async with engine.connect() as conn:
+        linhas = (await conn.execute(
+            select(
+                CategoriaModel.nome, CentroTreinamentoModel.nome, a.sexo, func.count(),
+                func.avg(a.idade), func.avg(a.peso), func.avg(a.altura), func.avg(a.peso / (a.altura * a.altura)),
+            )
+            .join(CategoriaModel, CategoriaModel.pk_id == a.categoria_id)
+            .join(CentroTreinamentoModel, CentroTreinamentoModel.pk_id == a.centro_treinamento_id)
+            .group_by(CategoriaModel.nome, CentroTreinamentoModel.nome, a.sexo)
+            .order_by(CategoriaModel.nome, CentroTreinamentoModel.nome, a.sexo)
+        )).all()
+    return [(*linha[:4], *(round(float(media), 2) for media in linha[4:])) for linha in linhas]
+
+
+async def _conferir(api, engine) -> None:
+    resposta = await api.get('/atletas/stats', params={'dimensoes': 'categoria,centro_treinamento,sexo'})
+    assert resposta.status_code == 200
+    medias = ('idade_media', 'peso_medio', 'altura_media', 'imc_medio')
+    api_linhas = [
+        (
+            item['categoria'], item['centro_treinamento'], item['sexo'], item['quantidade'],
+            *(pytest.approx(item[media], abs=0.011) for media in medias),
+        )
+        for item in resposta.json()
+    ]
+    assert await _group_by(engine) == api_linhas
+
+
+def test_estatisticas_acompanham_as_escritas(engine):
+    async def executar():
+        async with cliente() as api:
+            for categoria in ('Scale', 'RX'):
+                await api.post('/categorias/', json={'nome': categoria})
+            for centro in ('CT King', 'CT Queen'):
+                await api.post('/centros_treinamento/', json={'nome': centro, 'endereco': 'Rua X', 'proprietario': 'M'})
+
+            ids = {}
+            for numero, (nome, sexo, idade, peso, altura, categoria, centro) in enumerate(ATLETAS):
+                resposta = await api.post('/atletas/', json={
+                    'nome': nome, 'cpf': f'{numero:011d}', 'sexo': sexo, 'idade': idade, 'peso': peso, 'altura': altura,
+                    'categoria': {'nome': categoria}, 'centro_treinamento': {'nome': centro},
+                })
+                assert resposta.status_code == 201
+                ids[nome] = resposta.json()['id']
+            await _conferir(api, engine)
+
+            assert (await api.patch(f"/atletas/{ids['Ana']}", json={'idade': 23})).status_code == 200
+            assert (await api.patch(f"/atletas/{ids['Bia']}", json={'nome': 'Beatriz'})).status_code == 200
+            await _conferir(api, engine)
+
+            # Troca de categoria e centro (e de idade) em lote: os atletas mudam de grupo
+            resposta = await api.patch('/atletas/', json={
+                'ids': [ids['Ana'], ids['Enzo']],
+                'alteracao': {'categoria': 'RX', 'centro_treinamento': 'CT King', 'idade': 30},
+            })
+            assert resposta.json()['afetados'] == 2
+            await _conferir(api, engine)
+
+            assert (await api.delete(f"/atletas/{ids['Caio']}")).status_code == 204
+            await _conferir(api, engine)
+
+            resposta = await api.request('DELETE', '/atletas/', json={'ids': [ids['Duda'], ids['Fábio']]})
+            assert resposta.json()['afetados'] == 2
+            await _conferir(api, engine)
+
+            restantes = (await api.get('/atletas/stats', params={'dimensoes': ''})).json()
+            assert restantes[0]['quantidade'] == 3
+
+    asyncio.run(executar())
@@ -0,0 +1,86 @@
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+
+from conftest import cadastrar, cliente
+from workout_api.atleta import atleta_crud
+
+COLUNAS_IMPORTACAO = ('nome', 'cpf', 'idade', 'peso', 'altura', 'sexo', 'categoria', 'centro_treinamento')
+
+
+def _ler(formato: str, corpo: bytes) -> list[dict]:
+    texto = corpo.decode()
+    if formato == 'csv':
+        return list(csv.DictReader(io.StringIO(texto)))
+    return [json.loads(linha) for linha in texto.splitlines()]
+
+
+def _escrever(formato: str, registros: list[dict]) -> bytes:
+    # Reimportação: sem id e created_at, que o POST /atletas/bulk não aceita
+    registros = [{coluna: registro[coluna] for coluna in COLUNAS_IMPORTACAO} for registro in registros]
+    if formato == 'csv':
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, COLUNAS_IMPORTACAO)
+        writer.writeheader()
+        writer.writerows(registros)
+        return buffer.getvalue().encode()
+    return ''.join(json.dumps(registro, ensure_ascii=False) + '\n' for registro in registros).encode()
+
+
+@pytest.mark.parametrize('formato', ['ndjson', 'csv'])
+def test_exportacao_e_reimportacao(banco, monkeypatch, formato):
+    # Blocos de 2 linhas: a exportação atravessa várias partições do cursor
+    monkeypatch.setattr(atleta_crud, 'TAMANHO_LOTE_EXPORTACAO', 2)
+    tipo = 'text/csv' if formato == 'csv' else 'application/x-ndjson'
+
+    async def executar():
+        async with cliente() as api:
+            ids = await cadastrar(api, ['Zoë', 'João, "o Forte"', 'Ana'])
+            ids += await cadastrar(api, ['Caio'], categoria='RX', centro='CT Queen', cpf_inicial=3)
+            originais = [(await api.get(f'/atletas/{id}')).json() for id in ids]
+
+            resposta = await api.get('/atletas/export', params={'formato': formato})
+            assert resposta.status_code == 200
+            assert resposta.headers['content-type'].startswith(tipo)
+            assert resposta.headers['content-disposition'] == f'attachment; filename="atletas.{formato}"'
+            exportados = _ler(formato, resposta.content)
+
+            assert [registro['id'] for registro in exportados] == ids
+            for registro, original in zip(exportados, originais):
+                assert registro['nome'] == original['nome']
+                assert registro['cpf'] == original['cpf']
+                assert float(registro['peso']) == original['peso']
+                assert registro['categoria'] == original['categoria']['nome']
+                assert registro['centro_treinamento'] == original['centro_treinamento']['nome']
+
+            resposta = await api.get('/atletas/export', params={'formato': formato, 'nome': 'jo'})
+            filtrados = _ler(formato, resposta.content)
+            assert [registro['nome'] for registro in filtrados] == ['João, "o Forte"']
+
+            # Apaga todos e reimporta o arquivo: a nova exportação traz os mesmos dados
+            assert (await api.request('DELETE', '/atletas/', json={'ids': ids})).json()['afetados'] == 4
+            resposta = await api.post(
+                '/atletas/bulk', content=_escrever(formato, exportados), headers={'Content-Type': tipo}
+            )
+            assert resposta.json()['inseridos'] == 4
+
+            reexportados = _ler(formato, (await api.get('/atletas/export', params={'formato': formato})).content)
+            assert [{coluna: registro[coluna] for coluna in COLUNAS_IMPORTACAO} for registro in reexportados] == [
+                {coluna: registro[coluna] for coluna in COLUNAS_IMPORTACAO} for registro in exportados
+            ]
+
+    asyncio.run(executar())
+
+
+def test_exportacao_vazia(banco):
+    async def executar():
+        async with cliente() as api:
+            assert (await api.get('/atletas/export')).content == b''
+            resposta = await api.get('/atletas/export', params={'formato': 'csv'})
+            assert _ler('csv', resposta.content) == []
+            assert resposta.text.splitlines() == [','.join(atleta_crud.COLUNAS_EXPORTACAO)]
+
+    asyncio.run(executar())
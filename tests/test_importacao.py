@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from conftest import cadastrar, cliente, ndjson
+from workout_api.atleta import atleta_crud
+
+
+async def _importar(api, corpo: bytes, tipo: str) -> dict:
+    resposta = await api.post('/atletas/bulk', content=corpo, headers={'Content-Type': tipo})
+    assert resposta.status_code == 200, resposta.text
+    return resposta.json()
+
+
+def _falhas(resultado: dict) -> list[tuple]:
+    return [(falha['linha'], falha['cpf'], falha['status']) for falha in resultado['falhas']]
+
+
+@pytest.mark.parametrize('tamanho_lote', [1000, 2])
+def test_importacao_ndjson_relata_conflitos_e_linhas_invalidas(banco, monkeypatch, tamanho_lote):
+    # Com lotes de 2 linhas, o CPF repetido no arquivo chega em outro lote e o banco o recusa
+    monkeypatch.setattr(atleta_crud, 'TAMANHO_LOTE_IMPORTACAO', tamanho_lote)
+
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, ['Já cadastrado'])
+            corpo = b''.join([
+                ndjson(['10', '11']),
+                ndjson(['10']),                                   # 3: repetido no arquivo
+                ndjson(['00000000000']),                          # 4: já cadastrado
+                b'{"nome": "Jos\xe9", "cpf": "12"}\n',            # 5: latin-1, não UTF-8
+                b'\n',                                            # 6: vazia, ignorada
+                b'{"nome": \n',                                   # 7: JSON inválido
+                ndjson(['13'], categoria='Elite'),                # 8: categoria inexistente
+                ndjson(['14']),
+            ])
+            resultado = await _importar(api, corpo, 'application/x-ndjson')
+
+            assert {chave: resultado[chave] for chave in ('total', 'inseridos', 'conflitos', 'invalidos')} == {
+                'total': 8, 'inseridos': 3, 'conflitos': 2, 'invalidos': 3
+            }
+            assert _falhas(resultado) == [
+                (3, '10', 'conflito'), (4, '00000000000', 'conflito'),
+                (5, None, 'invalido'), (7, None, 'invalido'), (8, '13', 'invalido'),
+            ]
+            detalhes = {falha['linha']: falha['detalhe'] for falha in resultado['falhas']}
+            assert 'UTF-8' in detalhes[5]
+            assert 'Elite não foi encontrada' in detalhes[8]
+
+            nomes = [item['nome'] for item in (await api.get('/atletas/', params={'size': 100})).json()['items']]
+            assert nomes == ['Já cadastrado', 'Atleta 10', 'Atleta 11', 'Atleta 14']
+
+    asyncio.run(executar())
+
+
+def test_importacao_csv_relata_conflitos_e_linhas_invalidas(banco):
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, ['Já cadastrado'])
+            cabecalho = 'nome,cpf,idade,peso,altura,sexo,categoria,centro_treinamento\n'
+            corpo = b''.join([
+                cabecalho.encode(),
+                'Zoë,20,30,61.5,1.65,F,Scale,CT King\n'.encode(),
+                'Zoë de novo,20,30,61.5,1.65,F,Scale,CT King\n'.encode(),   # 3: repetido no arquivo
+                b'Antigo,00000000000,30,61.5,1.65,F,Scale,CT King\n',        # 4: já cadastrado
+                b'Jos\xe9,21,30,61.5,1.65,M,Scale,CT King\n',                # 5: latin-1, não UTF-8
+                b'Faltando,22,30\n',                                         # 6: colunas a menos
+                b'Idade errada,23,trinta,61.5,1.65,M,Scale,CT King\n',       # 7
+            ])
+            resultado = await _importar(api, corpo, 'text/csv')
+
+            assert {chave: resultado[chave] for chave in ('total', 'inseridos', 'conflitos', 'invalidos')} == {
+                'total': 6, 'inseridos': 1, 'conflitos': 2, 'invalidos': 3
+            }
+            assert _falhas(resultado) == [
+                (3, '20', 'conflito'), (4, '00000000000', 'conflito'),
+                (5, None, 'invalido'), (6, None, 'invalido'), (7, '23', 'invalido'),
+            ]
+            assert 'UTF-8' in resultado['falhas'][2]['detalhe']
+
+            resposta = await api.get('/atletas/', params={'cpf': '20'})
+            assert [item['nome'] for item in resposta.json()['items']] == ['Zoë']
+
+    asyncio.run(executar())
+
+
+def test_importacao_com_corpo_vazio(banco):
+    async def executar():
+        async with cliente() as api:
+            resultado = await _importar(api, b'', 'application/x-ndjson')
+            assert resultado == {'total': 0, 'inseridos': 0, 'conflitos': 0, 'invalidos': 0, 'falhas': []}
+            assert (await api.get('/atletas/')).json()['items'] == []
+
+    asyncio.run(executar())
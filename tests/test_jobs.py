@@ -0,0 +1,211 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from conftest import cadastrar, cliente, ndjson
+from workout_api.atleta import atleta_crud
+from workout_api.atleta import jobs as atleta_jobs
+from workout_api.atleta.models import AtletaModel
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.jobs.fila import ContextoJob, expurgar, fila
+from workout_api.jobs.models import JobModel
+
+
+# Jobs de teste: um que devolve os parâmetros e um que só termina quando cancelado
+@fila.tarefa('testes.eco')
+async def eco(contexto: ContextoJob) -> dict:
+    return {'eco': contexto.parametros['valor']}
+
+
+@fila.tarefa('testes.espera')
+async def espera(contexto: ContextoJob) -> None:
+    await asyncio.Event().wait()
+
+
+@pytest.fixture
+def fila_rapida(banco, monkeypatch):
+    monkeypatch.setattr(settings, 'JOBS_POLL_SECONDS', 0.05)
+    monkeypatch.setattr(settings, 'JOBS_LEASE_SECONDS', 3)
+
+
+async def _aguardar(api, id: str, condicao, prazo: float = 10) -> dict:
+    limite = asyncio.get_running_loop().time() + prazo
+    while True:
+        job = (await api.get(f'/jobs/{id}')).json()
+        if condicao(job):
+            return job
+        assert asyncio.get_running_loop().time() < limite, job
+        await asyncio.sleep(0.02)
+
+
+async def _contar_atletas() -> int:
+    async with async_session() as db_session:
+        return (await db_session.execute(select(func.count()).select_from(AtletaModel))).scalar_one()
+
+
+async def _arquivo(nome: str) -> str:
+    os.makedirs(settings.JOBS_DIR, exist_ok=True)
+    caminho = os.path.join(settings.JOBS_DIR, nome)
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(b'{}')
+    return caminho
+
+
+def test_importacao_submetida_executada_e_concluida(fila_rapida):
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, [])
+            os.makedirs(settings.JOBS_DIR, exist_ok=True)
+            anteriores = set(os.listdir(settings.JOBS_DIR))
+            resposta = await api.post(
+                '/atletas/jobs/importacao', content=ndjson(['1', '2', '1']),
+                headers={'Content-Type': 'application/x-ndjson'},
+            )
+            assert resposta.status_code == 202
+            job = resposta.json()
+            assert job['status'] == 'pendente'
+            [arquivo] = set(os.listdir(settings.JOBS_DIR)) - anteriores
+
+            # Sem a fila ativa na submissão, a varredura encontra o job
+            await fila.iniciar()
+            try:
+                job = await _aguardar(api, job['id'], lambda job: job['status'] == 'concluido')
+            finally:
+                await fila.parar()
+
+            assert job['tentativas'] == 1
+            assert {chave: job['resultado'][chave] for chave in ('total', 'inseridos', 'conflitos')} == {
+                'total': 3, 'inseridos': 2, 'conflitos': 1
+            }
+            assert arquivo not in os.listdir(settings.JOBS_DIR)
+
+    asyncio.run(executar())
+
+
+def test_importacao_retomada_apos_reinicio_nao_repete_linhas(fila_rapida, monkeypatch):
+    monkeypatch.setattr(atleta_crud, 'TAMANHO_LOTE_IMPORTACAO', 2)
+    ler_arquivo = atleta_jobs._ler_arquivo
+    execucoes = []
+
+    async def ler_e_parar(caminho):
+        # Primeira execução: o processo "cai" depois de ler a terceira linha (o primeiro lote já foi confirmado)
+        execucoes.append(caminho)
+        if len(execucoes) > 1:
+            async for bloco in ler_arquivo(caminho):
+                yield bloco
+            return
+        with open(caminho, 'rb') as arquivo:
+            for linha in arquivo.readlines()[:3]:
+                yield linha
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(atleta_jobs, '_ler_arquivo', ler_e_parar)
+
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, [])
+            job = (await api.post(
+                '/atletas/jobs/importacao', content=ndjson(['1', '2', '3', '4', '5']),
+                headers={'Content-Type': 'application/x-ndjson'},
+            )).json()
+
+            await fila.iniciar()
+            job = await _aguardar(api, job['id'], lambda job: (job['progresso'] or {}).get('total') == 2)
+            await fila.parar()
+
+            job = (await api.get(f"/jobs/{job['id']}")).json()
+            assert job['status'] == 'pendente'
+            assert await _contar_atletas() == 2
+
+            await fila.iniciar()
+            try:
+                job = await _aguardar(api, job['id'], lambda job: job['status'] == 'concluido')
+            finally:
+                await fila.parar()
+
+            assert job['tentativas'] == 2
+            assert job['resultado'] == {'total': 5, 'inseridos': 5, 'conflitos': 0, 'invalidos': 0, 'falhas': []}
+            assert await _contar_atletas() == 5
+
+    asyncio.run(executar())
+
+
+def test_cancelamento_de_job_pendente_e_em_execucao_remove_o_arquivo(fila_rapida):
+    async def executar():
+        async with cliente() as api, async_session() as db_session:
+            pendente = await fila.submeter(db_session, 'testes.espera', {'arquivo': await _arquivo('pendente.ndjson')})
+            resposta = await api.post(f'/jobs/{pendente.id}/cancelar')
+            assert resposta.status_code == 202
+            assert resposta.json()['status'] == 'cancelado'
+            assert not os.path.exists(pendente.parametros['arquivo'])
+
+            await fila.iniciar()
+            try:
+                job = await fila.submeter(db_session, 'testes.espera', {'arquivo': await _arquivo('executando.ndjson')})
+                await _aguardar(api, str(job.id), lambda job: job['status'] == 'executando')
+                assert (await api.post(f'/jobs/{job.id}/cancelar')).status_code == 202
+                await _aguardar(api, str(job.id), lambda job: job['status'] == 'cancelado')
+            finally:
+                await fila.parar()
+            assert not os.path.exists(job.parametros['arquivo'])
+
+            assert (await api.post(f'/jobs/{job.id}/cancelar')).status_code == 409
+
+    asyncio.run(executar())
+
+
+def test_job_com_lease_vencido_volta_a_fila(fila_rapida):
+    async def executar():
+        agora = datetime.now()
+        async with async_session() as db_session:
+            ids = (await db_session.execute(
+                insert(JobModel).returning(JobModel.id),
+                [
+                    # O processo que executava o primeiro caiu; o segundo ainda está com o lease em dia
+                    {'tipo': 'testes.eco', 'status': 'executando', 'parametros': {'valor': valor}, 'tentativas': 1,
+                     'cancelamento_solicitado': False, 'created_at': agora, 'lease_ate': lease}
+                    for valor, lease in ((1, agora - timedelta(seconds=1)), (2, agora + timedelta(minutes=5)))
+                ],
+            )).scalars().all()
+            await db_session.commit()
+
+        async with cliente() as api:
+            await fila.iniciar()
+            try:
+                vencido = await _aguardar(api, str(ids[0]), lambda job: job['status'] == 'concluido')
+            finally:
+                await fila.parar()
+            em_dia = (await api.get(f'/jobs/{ids[1]}')).json()
+
+        assert (vencido['tentativas'], vencido['resultado']) == (2, {'eco': 1})
+        assert (em_dia['status'], em_dia['tentativas']) == ('executando', 1)
+
+    asyncio.run(executar())
+
+
+def test_expurgo_apaga_jobs_terminados_e_seus_arquivos(fila_rapida):
+    async def executar():
+        agora = datetime.now()
+        antigo = agora - timedelta(days=2)
+        arquivos = [await _arquivo(f'{nome}.ndjson') for nome in ('antigo', 'recente', 'pendente')]
+        async with async_session() as db_session:
+            await db_session.execute(insert(JobModel), [
+                {'tipo': 'testes.eco', 'status': status, 'parametros': {'arquivo': arquivo}, 'tentativas': 1,
+                 'cancelamento_solicitado': False, 'created_at': antigo, 'concluido_em': concluido_em}
+                for status, arquivo, concluido_em in (
+                    ('concluido', arquivos[0], antigo), ('falhou', arquivos[1], agora), ('pendente', arquivos[2], None)
+                )
+            ])
+            await db_session.commit()
+
+        assert await expurgar(agora - timedelta(days=1)) == 1
+        assert [os.path.exists(arquivo) for arquivo in arquivos] == [False, True, True]
+        async with async_session() as db_session:
+            restantes = (await db_session.execute(select(JobModel.status).order_by(JobModel.pk_id))).scalars().all()
+        assert restantes == ['falhou', 'pendente']
+
+    asyncio.run(executar())
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from conftest import cadastrar, cliente
+from workout_api.leaderboard.placares import placares
+
+
+@pytest.fixture
+def placares_vazios(banco):
+    # Os placares do processo são montados do banco na primeira consulta
+    placares.__init__()
+    yield
+    placares.__init__()
+
+
+def _forca(atleta: str, carga: float, dia: int = 1) -> dict:
+    return {
+        'atleta_id': atleta, 'tipo': 'forca', 'exercicio': 'Back Squat', 'realizado_em': f'2026-10-{dia:02d}T07:30:00',
+        'series': 5, 'repeticoes': 5, 'carga': carga,
+    }
+
+
+def _fran(atleta: str, segundos: float) -> dict:
+    return {
+        'atleta_id': atleta, 'tipo': 'wod', 'exercicio': 'Fran', 'realizado_em': '2026-10-02T07:30:00',
+        'pontuacao': segundos,
+    }
+
+
+def test_topo_e_posicao_depois_de_registrar_treinos(placares_vazios):
+    async def executar():
+        async with cliente() as api:
+            ana, bia, caio = await cadastrar(api, ['Ana', 'Bia', 'Caio'])
+            [duda] = await cadastrar(api, ['Duda'], centro='CT Queen', cpf_inicial=3)
+            for treino in [
+                _forca(ana, 100), _forca(ana, 120, dia=2), _forca(bia, 110), _forca(caio, 90), _forca(duda, 130),
+                _fran(ana, 300), _fran(bia, 250),
+            ]:
+                assert (await api.post('/treinos/', json=treino)).status_code == 201
+
+            resposta = await api.get('/leaderboard/', params={'categoria': 'Scale', 'exercicio': 'Back Squat', 'n': 2})
+            assert resposta.status_code == 200
+            placar = resposta.json()
+            assert placar['total'] == 4
+            assert [(item['posicao'], item['nome'], item['valor']) for item in placar['items']] == [
+                (1, 'Duda', 130), (2, 'Ana', 120)
+            ]
+
+            resposta = await api.get('/leaderboard/', params={
+                'categoria': 'Scale', 'exercicio': 'Back Squat', 'centro_treinamento': 'CT King'
+            })
+            assert [item['nome'] for item in resposta.json()['items']] == ['Ana', 'Bia', 'Caio']
+
+            # Por tempo: o menor resultado é o melhor
+            resposta = await api.get('/leaderboard/', params={'categoria': 'Scale', 'exercicio': 'Fran'})
+            assert [(item['nome'], item['valor']) for item in resposta.json()['items']] == [('Bia', 250), ('Ana', 300)]
+
+            resposta = await api.get(f'/leaderboard/atletas/{caio}', params={'exercicio': 'Back Squat'})
+            assert resposta.json() == {'exercicio': 'Back Squat', 'posicao': 3, 'total': 3, 'valor': 90}
+            resposta = await api.get(
+                f'/leaderboard/atletas/{caio}', params={'exercicio': 'Back Squat', 'por_centro': False}
+            )
+            assert (resposta.json()['posicao'], resposta.json()['total']) == (4, 4)
+
+            # Com os placares montados, um novo recorde entra sem reconstrução
+            assert (await api.post('/treinos/', json=_forca(caio, 150, dia=3))).status_code == 201
+            resposta = await api.get(f'/leaderboard/atletas/{caio}', params={'exercicio': 'Back Squat'})
+            assert (resposta.json()['posicao'], resposta.json()['valor']) == (1, 150)
+
+            resposta = await api.get(f'/leaderboard/atletas/{caio}', params={'exercicio': 'Fran'})
+            assert resposta.status_code == 404
+
+    asyncio.run(executar())
@@ -0,0 +1,76 @@
+import asyncio
+
+from sqlalchemy import func, select
+
+from conftest import cadastrar, cliente, ndjson
+from workout_api.atleta.estatisticas import contar_atletas
+from workout_api.atleta.models import AtletaModel
+from workout_api.configs.database import async_session
+from workout_api.contrib.cache import cache
+
+
+async def _total(api, total: str, **filtros) -> tuple:
+    resposta = await api.get('/atletas/', params={'total': total, 'size': 1, **filtros})
+    assert resposta.status_code == 200, resposta.text
+    pagina = resposta.json()
+    return pagina['total'], pagina['total_estimado']
+
+
+async def _contagens() -> tuple[int, int]:
+    """O count(*) da tabela e o total mantido nas escritas."""
+    async with async_session() as db_session:
+        tabela = (await db_session.execute(select(func.count()).select_from(AtletaModel))).scalar_one()
+        return tabela, await contar_atletas(db_session)
+
+
+def test_modos_do_total(banco):
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, ['João 1', 'João 2', 'Maria'])
+
+            # Sem filtros o total é o contador, exato em qualquer modo
+            for modo in ('exact', 'estimate', 'true'):
+                assert await _total(api, modo) == (3, False)
+            for modo in ('none', 'false'):
+                assert await _total(api, modo) == (None, None)
+            assert (await api.get('/atletas/', params={'total': 'talvez'})).status_code == 422
+
+            # Com filtros: 'exact' conta e guarda o resultado, que 'estimate' reaproveita enquanto valer
+            assert await _total(api, 'exact', nome='joão') == (2, False)
+            await cadastrar(api, ['João 3'], cpf_inicial=3)
+            assert await _total(api, 'estimate', nome='joão') == (2, True)
+            assert await _total(api, 'true', nome='joão') == (3, False)
+            assert await _total(api, 'none', nome='joão') == (None, None)
+
+            # No SQLite, sem count(*) guardado, 'estimate' conta (e o total sai exato)
+            await cache.invalidar('contagens')
+            assert await _total(api, 'estimate', nome='maria') == (1, False)
+            assert await _total(api, 'estimate', nome='maria') == (1, True)
+
+    asyncio.run(executar())
+
+
+def test_total_exato_sem_filtros_acompanha_o_contador(banco):
+    async def executar():
+        async with cliente() as api:
+            ids = await cadastrar(api, ['Ana', 'Bia'])
+            assert await _total(api, 'exact') == (2, False)
+
+            resposta = await api.post(
+                '/atletas/bulk', content=ndjson(['10', '11', '12', '10']),
+                headers={'Content-Type': 'application/x-ndjson'},
+            )
+            assert resposta.json()['inseridos'] == 3
+            assert await _contagens() == (5, 5)
+            assert await _total(api, 'exact') == (5, False)
+
+            assert (await api.delete(f'/atletas/{ids[0]}')).status_code == 204
+            assert await _contagens() == (4, 4)
+            assert await _total(api, 'exact') == (4, False)
+
+            resposta = await api.request('DELETE', '/atletas/', json={'nome': 'atleta 1'})
+            assert resposta.json()['afetados'] == 3
+            assert await _contagens() == (1, 1)
+            assert await _total(api, 'exact') == (1, False)
+
+    asyncio.run(executar())
@@ -0,0 +1,85 @@
+import asyncio
+import gzip
+
+import msgpack
+
+from conftest import cadastrar, cliente
+from workout_api.configs.settings import settings
+
+JSON = {'Accept': 'application/json', 'Accept-Encoding': 'identity'}
+MSGPACK = {'Accept': 'application/msgpack', 'Accept-Encoding': 'identity'}
+
+
+def test_msgpack_traz_os_mesmos_dados_do_json(banco):
+    async def executar():
+        async with cliente() as api:
+            [id] = await cadastrar(api, ['Zoë'])
+
+            # Rotas com serialização rápida (MessagePack direto) e com resposta JSON convertida
+            for caminho in ('/atletas/', f'/atletas/{id}', '/atletas/stats', '/categorias/'):
+                como_json = await api.get(caminho, headers=JSON)
+                como_msgpack = await api.get(caminho, headers=MSGPACK)
+                assert como_json.headers['content-type'].startswith('application/json')
+                assert como_msgpack.headers['content-type'] == 'application/msgpack'
+                assert msgpack.unpackb(como_msgpack.content) == como_json.json()
+                assert como_msgpack.headers['vary'] == 'Accept, Accept-Encoding'
+
+            # JSON preferido pelo cliente, ou msgpack recusado com q=0: a resposta continua JSON
+            resposta = await api.get('/atletas/', headers={
+                'Accept': 'application/msgpack;q=0.5, application/json', 'Accept-Encoding': 'identity'
+            })
+            assert resposta.headers['content-type'].startswith('application/json')
+            resposta = await api.get('/atletas/', headers={'Accept': 'application/msgpack;q=0'})
+            assert resposta.headers['content-type'].startswith('application/json')
+
+    asyncio.run(executar())
+
+
+def test_gzip_a_partir_do_tamanho_minimo(banco, monkeypatch):
+    async def executar():
+        async with cliente() as api:
+            await cadastrar(api, [f'Atleta {numero}' for numero in range(5)])
+            corpo = (await api.get('/atletas/', headers=JSON)).content
+
+            monkeypatch.setattr(settings, 'COMPRESSION_MIN_BYTES', len(corpo))
+            resposta = await api.get('/atletas/', headers={'Accept-Encoding': 'gzip'})
+            assert resposta.headers['content-encoding'] == 'gzip'
+            assert resposta.headers['vary'] == 'Accept, Accept-Encoding'
+            # O httpx já descomprime o corpo; o Content-Length é o dos bytes comprimidos
+            assert resposta.content == corpo
+            assert int(resposta.headers['content-length']) == len(gzip.compress(corpo, compresslevel=6))
+
+            monkeypatch.setattr(settings, 'COMPRESSION_MIN_BYTES', len(corpo) + 1)
+            resposta = await api.get('/atletas/', headers={'Accept-Encoding': 'gzip'})
+            assert 'content-encoding' not in resposta.headers
+            assert resposta.content == corpo
+
+            # Streaming passa sem compressão, qualquer que seja o tamanho
+            monkeypatch.setattr(settings, 'COMPRESSION_MIN_BYTES', 0)
+            resposta = await api.get('/atletas/export', headers={'Accept-Encoding': 'gzip'})
+            assert 'content-encoding' not in resposta.headers
+            assert len(resposta.text.splitlines()) == 5
+
+    asyncio.run(executar())
+
+
+def test_etag_fica_fraco_quando_a_representacao_muda(banco, monkeypatch):
+    monkeypatch.setattr(settings, 'COMPRESSION_MIN_BYTES', 0)
+
+    async def executar():
+        async with cliente() as api:
+            [id] = await cadastrar(api, ['Ana'])
+
+            forte = (await api.get(f'/atletas/{id}', headers=JSON)).headers['etag']
+            assert not forte.startswith('W/')
+
+            for cabecalhos in (MSGPACK, {'Accept': 'application/json', 'Accept-Encoding': 'gzip'}):
+                assert (await api.get(f'/atletas/{id}', headers=cabecalhos)).headers['etag'] == f'W/{forte}'
+
+            # O mesmo vale para o ETag das listagens (versão da tabela) e para o 304
+            etag = (await api.get('/categorias/', headers=JSON)).headers['etag']
+            resposta = await api.get('/categorias/', headers={**MSGPACK, 'If-None-Match': etag})
+            assert resposta.status_code == 304
+            assert resposta.headers['etag'] == f'W/{etag}'
+
+    asyncio.run(executar())
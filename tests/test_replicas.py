@@ -0,0 +1,89 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+from sqlalchemy import event, insert
+
+from conftest import DIRETORIO
+from workout_api.categorias.models import CategoriaModel
+from workout_api.configs import database
+from workout_api.contrib.cache import cache
+from workout_api.contrib.models import BaseModel
+from workout_api.main import app
+
+
+def _contar_comandos(engine) -> dict:
+    contagem = {'comandos': 0}
+
+    @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+    def _contar(*_):
+        contagem['comandos'] += 1
+
+    return contagem
+
+
+@pytest.fixture
+def roteador(monkeypatch):
+    """Primário e réplica em dois arquivos SQLite, com o schema criado nos dois."""
+    url = f'sqlite+aiosqlite:///{os.path.join(DIRETORIO, "replica.db")}'
+    roteador = database.RoteadorLeitura([url], 'round_robin')
+    monkeypatch.setattr(database, 'roteador', roteador)
+
+    async def criar():
+        for engine in (database.engine, roteador.engines[0]):
+            async with engine.begin() as conn:
+                await conn.run_sync(BaseModel.metadata.drop_all)
+                await conn.run_sync(BaseModel.metadata.create_all)
+
+    asyncio.run(criar())
+    yield roteador
+    asyncio.run(roteador.engines[0].dispose())
+    asyncio.run(database.engine.dispose())
+
+
+def test_leituras_vao_para_a_replica_e_apos_escrita_para_o_primario(roteador):
+    primario = _contar_comandos(database.engine)
+    replica = _contar_comandos(roteador.engines[0])
+
+    async def executar():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://teste') as cliente:
+            # Sem o cache de dados (e das versões), toda leitura de /categorias/ chega a um banco
+            cache._itens.clear()
+            resposta = await cliente.get('/categorias/')
+            assert resposta.status_code == 200
+            assert replica['comandos'] > 0 and primario['comandos'] == 0
+
+            resposta = await cliente.post('/categorias/', json={'nome': 'Scale'})
+            assert resposta.status_code == 201
+            assert database.COOKIE_ESCRITA in resposta.cookies
+
+            # Dentro da janela, o mesmo cliente lê do primário e vê a própria escrita
+            primario['comandos'] = replica['comandos'] = 0
+            cache._itens.clear()
+            resposta = await cliente.get('/categorias/')
+            assert [item['nome'] for item in resposta.json()['items']] == ['Scale']
+            assert primario['comandos'] > 0 and replica['comandos'] == 0
+
+            # Outro cliente (sem o cookie) continua na réplica, que não recebeu a escrita
+            cliente.cookies.clear()
+            primario['comandos'] = replica['comandos'] = 0
+            cache._itens.clear()
+            resposta = await cliente.get('/categorias/')
+            assert resposta.status_code == 200
+            assert replica['comandos'] > 0 and primario['comandos'] == 0
+
+    asyncio.run(executar())
+
+
+def test_sessao_da_replica_recusa_escritas(roteador):
+    async def executar():
+        async with roteador.sessao() as sessao:
+            with pytest.raises(database.EscritaEmReplica):
+                await sessao.execute(insert(CategoriaModel).values(nome='Scale'))
+            sessao.add(CategoriaModel(nome='RX'))
+            with pytest.raises(database.EscritaEmReplica):
+                await sessao.flush()
+
+    asyncio.run(executar())
@@ -1,3 +0,0 @@
-from workout_api.categorias.models import CategoriaModel
-from workout_api.centro_treinamento.models import CentroTreinamentoModel
-from workout_api.atleta.models import AtletaModel
\ No newline at end of file
@@ -1,138 +1,687 @@
+import csv
+import io
+import json
 from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable
 from uuid import uuid4, UUID
 from fastapi import HTTPException, status
-from workout_api.atleta.schemas import AtletaIn, AtletaOut, AtletaUpdate
+from pydantic import ValidationError
+from workout_api.atleta.schemas import (
+    AtletaImportacaoFalha,
+    AtletaImportacaoOut,
+    AtletaIn,
+    AtletaLoteOut,
+    AtletaOut,
+    AtletaPatchLote,
+    AtletaResumo,
+    AtletaSelecaoLote,
+    AtletaUpdate,
+)
 from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.busca import filtro_nome
+from workout_api.atleta.estatisticas import (
+    colunas_rotuladas,
+    contar_atletas,
+    deltas,
+    executar_com_estatisticas,
+    upsert_estatisticas,
+)
+from workout_api.categorias.categoria_crud import pks_categorias_por_nome
 from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.centro_treinamento_crud import pks_centros_treinamento_por_nome
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Delete, Update, delete, func, literal, true, update
 from sqlalchemy.future import select
+from sqlalchemy.sql import ColumnElement, Select
+from workout_api.configs.database import dialeto
+from workout_api.configs.settings import settings
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.coalescencia import coalescencia
+from workout_api.contrib.contagem import contar_total
+from workout_api.contrib.ingestao import LinhaInvalida, em_lotes, pular
+from workout_api.contrib.pagination import CursorPage, CursorParams, paginar_por_cursor
+from workout_api.contrib.serializacao import projetar
+from workout_api.leaderboard.placares import placares
+from workout_api.treino.recordes import tocar_recordes
+
+
+# Namespace das leituras coalescidas (ver contrib.coalescencia)
+COALESCENCIA_NAMESPACE = 'atletas'
+
+# Colunas de atletas gravadas a partir do payload (as FKs vêm do INSERT ... SELECT)
+COLUNAS_CRIACAO = ('id', 'nome', 'cpf', 'idade', 'peso', 'altura', 'sexo', 'created_at')
+
+
+def _insert_resolvendo_referencias(
+    db_session: DatabaseDependency,
+    atleta_out: AtletaOut
+):
+    # INSERT ... SELECT: os pk_ids de categoria e centro são resolvidos pelo próprio comando.
+    # Se algum dos nomes não existir, o SELECT não gera linha e nada é inserido.
+    colunas = AtletaModel.__table__.c
+    origem = (
+        select(
+            *(literal(getattr(atleta_out, coluna), colunas[coluna].type) for coluna in COLUNAS_CRIACAO),
+            CategoriaModel.pk_id,
+            CentroTreinamentoModel.pk_id,
+        )
+        .select_from(CategoriaModel)
+        # Produto cartesiano intencional: cada lado tem no máximo uma linha (nomes únicos)
+        .join(CentroTreinamentoModel, true())
+        .where(CategoriaModel.nome == atleta_out.categoria.nome)
+        .where(CentroTreinamentoModel.nome == atleta_out.centro_treinamento.nome)
+    )
+    return (
+        _insert_ignorando_cpf_duplicado(db_session)
+        .from_select([*COLUNAS_CRIACAO, 'categoria_id', 'centro_treinamento_id'], origem)
+        .returning(AtletaModel.pk_id)
+    )
 
 
 async def criar_atleta(
     db_session: DatabaseDependency, 
     atleta_in: AtletaIn
 ) -> AtletaOut:
-    # Verifica se a categoria existe
-    categoria = (await db_session.execute(
-        select(CategoriaModel).filter_by(nome=atleta_in.categoria.nome))
-    ).scalars().first()
-    
-    if not categoria:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, 
-            detail=f'A categoria {atleta_in.categoria.nome} não foi encontrada.'
-        )
+    """
+    Cria o atleta em um único comando SQL. O resultado diz o motivo de uma falha
+    (categoria inexistente, centro inexistente ou CPF duplicado), sem depender de exceções.
+    """
+    categoria_nome = atleta_in.categoria.nome
+    centro_treinamento_nome = atleta_in.centro_treinamento.nome
 
-    # Verifica se o centro de treinamento existe
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).filter_by(nome=atleta_in.centro_treinamento.nome))
-    ).scalars().first()
+    # Os campos já foram validados em AtletaIn: monta a saída sem revalidar nem serializar
+    atleta_out = AtletaOut.model_construct(id=uuid4(), created_at=datetime.now(), **dict(atleta_in))
+    categoria_id = select(CategoriaModel.pk_id).where(CategoriaModel.nome == categoria_nome).scalar_subquery()
+    centro_treinamento_id = (
+        select(CentroTreinamentoModel.pk_id)
+        .where(CentroTreinamentoModel.nome == centro_treinamento_nome)
+        .scalar_subquery()
+    )
+    inserir = _insert_resolvendo_referencias(db_session, atleta_out)
 
-    if not centro_treinamento:
+    try:
+        if dialeto(db_session) == 'postgresql':
+            # O INSERT roda como CTE e o SELECT final devolve, na mesma ida ao banco,
+            # as referências encontradas e o pk_id inserido (NULL quando algo falhou); o
+            # atleta entra nas estatísticas por outra CTE do mesmo comando
+            novo = inserir.returning(*colunas_rotuladas(AtletaModel.__table__, 'atual_')).cte('novo')
+            estatisticas = upsert_estatisticas(db_session, deltas(novo, 1, 'atual_')).cte('estatisticas')
+            resultado = (await db_session.execute(
+                select(categoria_id, centro_treinamento_id, select(novo.c.pk_id).scalar_subquery())
+                .add_cte(estatisticas)
+            )).one()
+        else:
+            # O SQLite não aceita INSERT em CTE: a consulta de diagnóstico só roda quando nada foi inserido
+            linhas = await executar_com_estatisticas(db_session, inserir)
+            if linhas:
+                resultado = (True, True, linhas[0]['pk_id'])
+            else:
+                resultado = (*(await db_session.execute(select(categoria_id, centro_treinamento_id))).one(), None)
+
+        categoria_encontrada, centro_encontrado, pk_id = resultado
+        if pk_id is not None:
+            await db_session.commit()
+            coalescencia.esquecer(COALESCENCIA_NAMESPACE)
+    except Exception:
+        await db_session.rollback()
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, 
-            detail=f'O centro de treinamento {atleta_in.centro_treinamento.nome} não foi encontrado.'
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Ocorreu um erro ao inserir os dados no banco"
         )
-    
-    try:
-        # Cria o AtletaOut e sua modelagem SQL
-        atleta_out = AtletaOut(id=uuid4(), created_at=datetime.now(), **atleta_in.model_dump())
-        atleta_model = AtletaModel(**atleta_out.model_dump(exclude={'categoria', 'centro_treinamento'}))
-        
-        # Relaciona o atleta com a categoria e o centro de treinamento
-        atleta_model.categoria_id = categoria.pk_id
-        atleta_model.centro_treinamento_id = centro_treinamento.pk_id
-        
-        db_session.add(atleta_model)
-        await db_session.commit()
 
+    if pk_id is not None:
         return atleta_out
 
-    except IntegrityError:
-        await db_session.rollback()
+    await db_session.rollback()
+    if categoria_encontrada is None:
         raise HTTPException(
-            status_code=status.HTTP_303_SEE_OTHER,
-            detail=f"Já existe um atleta cadastrado com o CPF: {atleta_in.cpf}"
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail=f'A categoria {categoria_nome} não foi encontrada.'
         )
-    except Exception:
-        await db_session.rollback()
+    if centro_encontrado is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Ocorreu um erro ao inserir os dados no banco"
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail=f'O centro de treinamento {centro_treinamento_nome} não foi encontrado.'
         )
+    raise HTTPException(
+        status_code=status.HTTP_303_SEE_OTHER,
+        detail=f"Já existe um atleta cadastrado com o CPF: {atleta_in.cpf}"
+    )
 
 
-async def listar_atletas(
+def _consulta_resumo():
+    # Projeção apenas das colunas exibidas na listagem, com os nomes vindos de JOINs:
+    # uma única consulta, sem objetos ORM nem os SELECTs extras do lazy='selectin'
+    return (
+        select(
+            AtletaModel.pk_id,
+            AtletaModel.nome,
+            CentroTreinamentoModel.nome.label('centro_treinamento'),
+            CategoriaModel.nome.label('categoria'),
+        )
+        .join(AtletaModel.categoria)
+        .join(AtletaModel.centro_treinamento)
+    )
+
+
+def _filtrar_atletas(
     db_session: DatabaseDependency,
+    query: Select,
     nome: str | None = None,
     cpf: str | None = None
-) -> list[dict]:
-    query = select(AtletaModel).join(CategoriaModel).join(CentroTreinamentoModel)
+) -> Select:
+    return query.filter(*_criterios_atletas(db_session, nome, cpf))
 
-    # Adiciona filtros opcionais
+
+def _criterios_atletas(
+    db_session: DatabaseDependency,
+    nome: str | None = None,
+    cpf: str | None = None
+) -> list[ColumnElement]:
+    # Filtros opcionais, compartilhados pela listagem, exportação e operações em lote
+    criterios = []
     if nome:
-        query = query.filter(AtletaModel.nome.ilike(f"%{nome}%"))
+        criterios.append(filtro_nome(db_session, nome))
     if cpf:
-        query = query.filter(AtletaModel.cpf == cpf)
+        criterios.append(AtletaModel.cpf == cpf)
+    return criterios
 
-    atletas = (await db_session.execute(query)).scalars().all()
 
-    # Personaliza a resposta
-    return [
-        {
-            "nome": atleta.nome,
-            "centro_treinamento": atleta.centro_treinamento.nome,
-            "categoria": atleta.categoria.nome
-        }
-        for atleta in atletas
-    ]
+async def listar_atletas(
+    db_session: DatabaseDependency,
+    params: CursorParams,
+    nome: str | None = None,
+    cpf: str | None = None
+) -> CursorPage[dict]:
+    query = _filtrar_atletas(db_session, _consulta_resumo(), nome, cpf)
+    chave = f'{COALESCENCIA_NAMESPACE}:pagina:{params.cursor}:{params.size}:{params.total}:{nome}:{cpf}'
+
+    filtrada = bool(nome or cpf)
+
+    return await coalescencia.executar(db_session, chave, lambda: paginar_por_cursor(
+        db_session,
+        query,
+        AtletaModel.pk_id,
+        params,
+        transform=lambda linha: projetar(AtletaResumo, linha),
+        escalar=False,
+        # Sem filtros, o total sai dos agregados de estatísticas em vez de um count(*) da tabela
+        contagem=lambda modo: contar_total(
+            db_session,
+            modo,
+            query,
+            f'atletas:{nome}:{cpf}',
+            exato=None if filtrada else lambda: contar_atletas(db_session),
+        ),
+    ))
+
+
+# Linhas trazidas do cursor do servidor (e gravadas na resposta) por vez
+TAMANHO_LOTE_EXPORTACAO = 1000
+
+COLUNAS_EXPORTACAO = (
+    'id', 'nome', 'cpf', 'idade', 'peso', 'altura', 'sexo', 'created_at', 'categoria', 'centro_treinamento'
+)
+
+
+def _valor_exportacao(valor):
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    if isinstance(valor, UUID):
+        return str(valor)
+    return valor
+
+
+async def exportar_atletas(
+    db_session: DatabaseDependency,
+    formato: str = 'ndjson',
+    nome: str | None = None,
+    cpf: str | None = None
+) -> AsyncIterator[bytes]:
+    """
+    Gera o cadastro de atletas em NDJSON ou CSV, em blocos de TAMANHO_LOTE_EXPORTACAO linhas
+    lidas de um cursor do lado do servidor: a memória usada não depende do total de atletas.
+    """
+    query = _filtrar_atletas(
+        db_session,
+        select(
+            AtletaModel.id,
+            AtletaModel.nome,
+            AtletaModel.cpf,
+            AtletaModel.idade,
+            AtletaModel.peso,
+            AtletaModel.altura,
+            AtletaModel.sexo,
+            AtletaModel.created_at,
+            CategoriaModel.nome.label('categoria'),
+            CentroTreinamentoModel.nome.label('centro_treinamento'),
+        )
+        .join(AtletaModel.categoria)
+        .join(AtletaModel.centro_treinamento)
+        .order_by(AtletaModel.pk_id),
+        nome,
+        cpf,
+    )
+
+    if formato == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(COLUNAS_EXPORTACAO)
+        yield buffer.getvalue().encode()
 
+    result = await db_session.stream(query.execution_options(yield_per=TAMANHO_LOTE_EXPORTACAO))
+    async for linhas in result.partitions():
+        if formato == 'csv':
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_valor_exportacao(valor) for valor in linha] for linha in linhas)
+            yield buffer.getvalue().encode()
+        else:
+            yield ''.join(
+                json.dumps(
+                    {coluna: _valor_exportacao(valor) for coluna, valor in zip(COLUNAS_EXPORTACAO, linha)},
+                    ensure_ascii=False,
+                ) + '\n'
+                for linha in linhas
+            ).encode()
 
-async def buscar_atleta_por_id(db_session: DatabaseDependency, id: UUID) -> AtletaOut:
-    atleta_model = (await db_session.execute(select(AtletaModel).filter_by(id=id))).scalars().first()
 
-    if not atleta_model:
+def _colunas_atleta_out() -> tuple:
+    # Colunas de AtletaOut, com os nomes de categoria e centro por subconsulta: o SQLite
+    # só aceita no RETURNING colunas da tabela alterada (ou subconsultas sobre as demais)
+    atletas = AtletaModel.__table__.c
+    return (
+        *(atletas[coluna] for coluna in COLUNAS_CRIACAO),
+        select(CategoriaModel.nome)
+        .where(CategoriaModel.pk_id == atletas.categoria_id)
+        .scalar_subquery()
+        .label('categoria'),
+        select(CentroTreinamentoModel.nome)
+        .where(CentroTreinamentoModel.pk_id == atletas.centro_treinamento_id)
+        .scalar_subquery()
+        .label('centro_treinamento'),
+        atletas.versao,
+    )
+
+
+def _atleta_out(linha) -> tuple[dict, int]:
+    # Linha de _colunas_atleta_out() -> (dados de AtletaOut, versão), sem validar dados vindos do banco
+    atleta = projetar(AtletaOut, linha)
+    atleta['categoria'] = {'nome': linha['categoria']}
+    atleta['centro_treinamento'] = {'nome': linha['centro_treinamento']}
+    # O SQLite devolve REAL sem parte fracionária como inteiro
+    atleta['peso'], atleta['altura'] = float(linha['peso']), float(linha['altura'])
+    return atleta, linha['versao']
+
+
+async def buscar_atleta_por_id(db_session: DatabaseDependency, id: UUID) -> tuple[dict, int]:
+    """Retorna o atleta e a versão atual da linha (usada como ETag), com uma única consulta."""
+    chave = f'{COALESCENCIA_NAMESPACE}:id:{id}'
+    return await coalescencia.executar(db_session, chave, lambda: _carregar_atleta(db_session, id))
+
+
+async def _carregar_atleta(db_session: DatabaseDependency, id: UUID) -> tuple[dict, int]:
+    atletas = AtletaModel.__table__
+    linha = (await db_session.execute(
+        select(*_colunas_atleta_out()).where(atletas.c.id == id)
+    )).mappings().first()
+
+    if not linha:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail=f'Atleta não encontrado no id: {id}'
         )
     
-    return AtletaOut.model_validate(atleta_model)
+    return _atleta_out(linha)
+
+
+async def pks_atletas_por_id(db_session: DatabaseDependency, ids: set[UUID]) -> dict[UUID, int]:
+    """Mapa id -> pk_id dos atletas existentes entre `ids`, em uma consulta."""
+    if not ids:
+        return {}
+    linhas = (await db_session.execute(
+        select(AtletaModel.id, AtletaModel.pk_id).where(AtletaModel.id.in_(ids)))
+    ).tuples().all()
+    return dict(linhas)
 
 
 async def atualizar_atleta(
     db_session: DatabaseDependency, 
     id: UUID, 
-    atleta_update: AtletaUpdate
-) -> AtletaOut:
-    atleta = (await db_session.execute(select(AtletaModel).filter_by(id=id))).scalars().first()
-
-    if not atleta:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
-            detail=f'Atleta não encontrado no id: {id}'
-        )
+    atleta_update: AtletaUpdate,
+    versao_esperada: int | None = None
+) -> tuple[dict, int]:
+    """
+    Atualiza o atleta com um único UPDATE ... RETURNING e retorna (atleta, nova versão).
+    Com `versao_esperada` (If-Match), a linha só é alterada se ainda estiver nessa versão;
+    do contrário a resposta é 412, sem sobrescrever a edição concorrente.
+    """
+    # UPDATE sobre a tabela (Core): o RETURNING monta a resposta sem carregar objetos ORM
+    atletas = AtletaModel.__table__
+    valores = atleta_update.model_dump(exclude_unset=True)
+    if valores:
+        valores['versao'] = atletas.c.versao + 1
 
-    atleta_data = atleta_update.model_dump(exclude_unset=True)
-    for key, value in atleta_data.items():
-        setattr(atleta, key, value)
+    query = update(atletas).where(atletas.c.id == id)
+    if versao_esperada is not None:
+        query = query.where(atletas.c.versao == versao_esperada)
+    # PATCH sem campos não altera a linha nem a versão, mas ainda devolve o atleta
+    query = query.values(valores or {'versao': atletas.c.versao})
 
+    if 'idade' in valores:
+        # Das colunas editáveis só a idade entra nas estatísticas
+        linhas = await executar_com_estatisticas(db_session, query, *_colunas_atleta_out())
+    else:
+        linhas = (await db_session.execute(query.returning(*_colunas_atleta_out()))).mappings().all()
+    linha = linhas[0] if linhas else None
     await db_session.commit()
-    await db_session.refresh(atleta)
+    coalescencia.esquecer(COALESCENCIA_NAMESPACE)
 
-    return AtletaOut.model_validate(atleta)
+    if linha is None:
+        # Só no caminho de falha: distingue atleta inexistente de versão desatualizada
+        existe = (await db_session.execute(select(AtletaModel.pk_id).filter_by(id=id))).first()
+        if not existe:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, 
+                detail=f'Atleta não encontrado no id: {id}'
+            )
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail='O atleta foi alterado por outra requisição; consulte-o novamente antes de editar.'
+        )
+
+    return _atleta_out(linha)
 
 
 async def deletar_atleta(db_session: DatabaseDependency, id: UUID) -> None:
-    atleta = (await db_session.execute(select(AtletaModel).filter_by(id=id))).scalars().first()
+    atletas = AtletaModel.__table__
+    removidos = await executar_com_estatisticas(db_session, delete(atletas).where(atletas.c.id == id), atletas.c.pk_id)
 
-    if not atleta:
+    if not removidos:
+        await db_session.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail=f'Atleta não encontrado no id: {id}'
         )
     
-    await db_session.delete(atleta)
-    await db_session.commit()
\ No newline at end of file
+    await db_session.commit()
+    coalescencia.esquecer(COALESCENCIA_NAMESPACE)
+    placares.remover_atletas(linha['pk_id'] for linha in removidos)
+
+
+def _criterios_lote(db_session: DatabaseDependency, selecao: AtletaSelecaoLote) -> list[ColumnElement]:
+    if selecao.ids is None and not selecao.nome and not selecao.cpf:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Informe os ids ou ao menos um filtro (nome, cpf).'
+        )
+    if selecao.ids is not None and len(selecao.ids) > settings.ATLETAS_LOTE_MAX:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'No máximo {settings.ATLETAS_LOTE_MAX} ids por requisição.'
+        )
+
+    criterios = _criterios_atletas(db_session, selecao.nome, selecao.cpf)
+    if selecao.ids is not None:
+        criterios.append(AtletaModel.id.in_(selecao.ids))
+    return criterios
+
+
+def _recusar_lote(afetados: int) -> None:
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f'A seleção alcança {afetados} atletas; o máximo por requisição é {settings.ATLETAS_LOTE_MAX}.'
+    )
+
+
+async def _executar_lote(
+    db_session: DatabaseDependency,
+    comando: Update | Delete,
+    criterios: list[ColumnElement],
+    dry_run: bool,
+    muda_grupo: bool = False
+) -> AtletaLoteOut:
+    # A contagem é a resposta do dry_run e recusa cedo as seleções grandes demais, sem
+    # executar o comando
+    afetados = (await db_session.execute(
+        select(func.count()).select_from(AtletaModel).where(*criterios)
+    )).scalar_one()
+
+    if dry_run:
+        await db_session.rollback()
+        return AtletaLoteOut(afetados=afetados, dry_run=True)
+
+    if afetados > settings.ATLETAS_LOTE_MAX:
+        await db_session.rollback()
+        _recusar_lote(afetados)
+
+    try:
+        atletas = AtletaModel.__table__
+        alterados = await executar_com_estatisticas(db_session, comando.where(*criterios), atletas.c.pk_id)
+    except SQLAlchemyError:
+        await db_session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Ocorreu um erro ao alterar os dados no banco"
+        )
+
+    # O limite vale para as linhas de fato alteradas (RETURNING): linhas confirmadas por outras
+    # transações entre a contagem e o comando podem ter aumentado a seleção
+    if len(alterados) > settings.ATLETAS_LOTE_MAX:
+        await db_session.rollback()
+        _recusar_lote(len(alterados))
+
+    try:
+        pks = [linha['pk_id'] for linha in alterados]
+        if muda_grupo:
+            # Mudança de categoria ou centro: os placares dos demais processos relêem esses recordes
+            await tocar_recordes(db_session, pks)
+        await db_session.commit()
+        coalescencia.esquecer(COALESCENCIA_NAMESPACE)
+    except SQLAlchemyError:
+        await db_session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Ocorreu um erro ao alterar os dados no banco"
+        )
+
+    if isinstance(comando, Delete):
+        placares.remover_atletas(pks)
+    return AtletaLoteOut(afetados=len(alterados), dry_run=False)
+
+
+async def deletar_atletas_em_lote(
+    db_session: DatabaseDependency,
+    selecao: AtletaSelecaoLote,
+    dry_run: bool = False
+) -> AtletaLoteOut:
+    """Remove, com um único DELETE, os atletas selecionados por ids e/ou filtros."""
+    criterios = _criterios_lote(db_session, selecao)
+    return await _executar_lote(db_session, delete(AtletaModel.__table__), criterios, dry_run)
+
+
+async def atualizar_atletas_em_lote(
+    db_session: DatabaseDependency,
+    patch: AtletaPatchLote,
+    dry_run: bool = False
+) -> AtletaLoteOut:
+    """Aplica a mesma alteração, com um único UPDATE, a todos os atletas selecionados."""
+    criterios = _criterios_lote(db_session, patch)
+    alteracao = patch.alteracao
+
+    valores = {}
+    if alteracao.idade is not None:
+        valores['idade'] = alteracao.idade
+    if alteracao.categoria is not None:
+        valores['categoria_id'] = (
+            await pks_categorias_por_nome(db_session, {alteracao.categoria})
+        ).get(alteracao.categoria)
+        if not valores['categoria_id']:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, 
+                detail=f'A categoria {alteracao.categoria} não foi encontrada.'
+            )
+    if alteracao.centro_treinamento is not None:
+        valores['centro_treinamento_id'] = (
+            await pks_centros_treinamento_por_nome(db_session, {alteracao.centro_treinamento})
+        ).get(alteracao.centro_treinamento)
+        if not valores['centro_treinamento_id']:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, 
+                detail=f'O centro de treinamento {alteracao.centro_treinamento} não foi encontrado.'
+            )
+
+    if not valores:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Informe ao menos um campo em alteracao.'
+        )
+
+    # Cada linha alterada ganha nova versão, invalidando os ETags já entregues
+    atletas = AtletaModel.__table__
+    comando = update(atletas).values(**valores, versao=atletas.c.versao + 1)
+    muda_grupo = bool(valores.keys() & {'categoria_id', 'centro_treinamento_id'})
+    return await _executar_lote(db_session, comando, criterios, dry_run, muda_grupo)
+
+
+# 1000 linhas x 11 colunas fica abaixo do limite de parâmetros do asyncpg e do SQLite
+TAMANHO_LOTE_IMPORTACAO = 1000
+
+
+def _aninhar_referencias(dados: dict) -> dict:
+    # No CSV (e opcionalmente no NDJSON) categoria e centro chegam apenas pelo nome
+    for campo in ('categoria', 'centro_treinamento'):
+        if isinstance(dados.get(campo), str):
+            dados = {**dados, campo: {'nome': dados[campo]}}
+    return dados
+
+
+def _resumir_erros(erro: ValidationError) -> str:
+    return '; '.join(
+        f"{'.'.join(str(parte) for parte in e['loc'])}: {e['msg']}" for e in erro.errors()
+    )
+
+
+def _insert_ignorando_cpf_duplicado(db_session: DatabaseDependency):
+    insert = postgresql.insert if dialeto(db_session) == 'postgresql' else sqlite.insert
+    return insert(AtletaModel.__table__).on_conflict_do_nothing(index_elements=['cpf'])
+
+
+async def importar_atletas(
+    db_session: DatabaseDependency,
+    registros: AsyncIterator[tuple[int, dict | LinhaInvalida]],
+    ao_confirmar_lote: Callable[[DatabaseDependency, AtletaImportacaoOut], Awaitable[None]] | None = None,
+    anterior: AtletaImportacaoOut | None = None
+) -> AtletaImportacaoOut:
+    """
+    Importa atletas em lotes: resolve os nomes de categoria e centro uma vez por lote,
+    grava cada lote com um único INSERT multi-linha e confirma lote a lote, de modo que
+    linhas inválidas ou com CPF repetido não abortam o restante da importação.
+
+    `ao_confirmar_lote(db_session, parcial)` roda na transação de cada lote, antes do commit,
+    com o resultado acumulado até ele. Com `anterior` (o parcial de uma execução interrompida),
+    as `anterior.total` primeiras linhas são puladas e o resultado continua a partir dele.
+    """
+    categorias: dict[str, int | None] = {}
+    centros_treinamento: dict[str, int | None] = {}
+    falhas: list[AtletaImportacaoFalha] = []
+    total = inseridos = 0
+    if anterior is not None:
+        falhas = list(anterior.falhas)
+        total, inseridos = anterior.total, anterior.inseridos
+        registros = pular(registros, anterior.total)
+
+    def falhar(linha: int, cpf: str | None, status_linha: str, detalhe: str) -> None:
+        falhas.append(AtletaImportacaoFalha(linha=linha, cpf=cpf, status=status_linha, detalhe=detalhe))
+
+    async for lote in em_lotes(registros, TAMANHO_LOTE_IMPORTACAO):
+        total += len(lote)
+
+        # Valida as linhas com o mesmo schema do POST /atletas
+        validos: list[tuple[int, AtletaIn]] = []
+        for numero, dados in lote:
+            if isinstance(dados, LinhaInvalida):
+                falhar(numero, None, 'invalido', str(dados))
+                continue
+            try:
+                validos.append((numero, AtletaIn.model_validate(_aninhar_referencias(dados))))
+            except ValidationError as erro:
+                cpf = dados.get('cpf')
+                falhar(numero, cpf if isinstance(cpf, str) else None, 'invalido', _resumir_erros(erro))
+
+        # Resolve apenas os nomes ainda não vistos nesta importação; inexistentes ficam como None
+        nomes = {a.categoria.nome for _, a in validos} - categorias.keys()
+        categorias.update(dict.fromkeys(nomes))
+        categorias.update(await pks_categorias_por_nome(db_session, nomes))
+
+        nomes = {a.centro_treinamento.nome for _, a in validos} - centros_treinamento.keys()
+        centros_treinamento.update(dict.fromkeys(nomes))
+        centros_treinamento.update(await pks_centros_treinamento_por_nome(db_session, nomes))
+
+        agora = datetime.now()
+        linhas: dict[str, tuple[int, dict]] = {}
+        for numero, atleta in validos:
+            categoria_id = categorias[atleta.categoria.nome]
+            centro_treinamento_id = centros_treinamento[atleta.centro_treinamento.nome]
+
+            if categoria_id is None:
+                falhar(numero, atleta.cpf, 'invalido', f'A categoria {atleta.categoria.nome} não foi encontrada.')
+            elif centro_treinamento_id is None:
+                falhar(
+                    numero, atleta.cpf, 'invalido',
+                    f'O centro de treinamento {atleta.centro_treinamento.nome} não foi encontrado.'
+                )
+            elif atleta.cpf in linhas:
+                falhar(numero, atleta.cpf, 'conflito', f'CPF {atleta.cpf} repetido no arquivo.')
+            else:
+                linhas[atleta.cpf] = (numero, {
+                    **atleta.model_dump(exclude={'categoria', 'centro_treinamento'}),
+                    'id': uuid4(),
+                    'created_at': agora,
+                    'categoria_id': categoria_id,
+                    'centro_treinamento_id': centro_treinamento_id,
+                })
+
+        try:
+            criados: set[str] = set()
+            if linhas:
+                # CPFs já cadastrados são ignorados pelo ON CONFLICT e não voltam no RETURNING
+                query = _insert_ignorando_cpf_duplicado(db_session).values([linha for _, linha in linhas.values()])
+                criados = {
+                    linha['cpf'] for linha in await executar_com_estatisticas(db_session, query, AtletaModel.cpf)
+                }
+            conflitos = [
+                AtletaImportacaoFalha(
+                    linha=numero, cpf=cpf, status='conflito', detalhe=f'Já existe um atleta cadastrado com o CPF: {cpf}'
+                )
+                for cpf, (numero, _) in linhas.items()
+                if cpf not in criados
+            ]
+            if ao_confirmar_lote is not None:
+                parcial = _resultado_importacao(total, inseridos + len(criados), falhas + conflitos)
+                await ao_confirmar_lote(db_session, parcial)
+            await db_session.commit()
+        except SQLAlchemyError:
+            await db_session.rollback()
+            for cpf, (numero, _) in linhas.items():
+                falhar(numero, cpf, 'invalido', 'Ocorreu um erro ao inserir os dados no banco')
+            continue
+
+        if criados:
+            coalescencia.esquecer(COALESCENCIA_NAMESPACE)
+        inseridos += len(criados)
+        falhas.extend(conflitos)
+
+    return _resultado_importacao(total, inseridos, falhas)
+
+
+def _resultado_importacao(total: int, inseridos: int, falhas: list[AtletaImportacaoFalha]) -> AtletaImportacaoOut:
+    return AtletaImportacaoOut(
+        total=total,
+        inseridos=inseridos,
+        conflitos=sum(1 for falha in falhas if falha.status == 'conflito'),
+        invalidos=sum(1 for falha in falhas if falha.status == 'invalido'),
+        falhas=sorted(falhas, key=lambda falha: falha.linha),
+    )
@@ -0,0 +1,146 @@
+import re
+
+from sqlalchemy import Float, Integer, String, func, literal, or_, select, text
+from sqlalchemy.sql import ColumnElement, Select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletaBusca, AtletaSugestao
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs.database import dialeto, sem_acentos
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.serializacao import projetar
+
+
+def _normalizado(expressao) -> ColumnElement:
+    # Mesma expressão do índice ix_atletas_nome_trgm: minúscula e sem acentos
+    return func.f_unaccent(func.lower(expressao))
+
+
+def _parametro(valor: str) -> ColumnElement:
+    return literal(valor, String)
+
+
+def _escapar_like(valor: str) -> str:
+    return valor.replace('!', '!!').replace('%', '!%').replace('_', '!_')
+
+
+def _contem(coluna: ColumnElement, valor: str) -> ColumnElement:
+    padrao = func.concat('%', _normalizado(_parametro(_escapar_like(valor))), '%')
+    return coluna.like(padrao, escape='!')
+
+
+def _expressao_fts(termo: str) -> str | None:
+    # Cada palavra vira um prefixo entre aspas para o MATCH do FTS5: "joao"* "silv"*
+    palavras = re.findall(r'\w+', termo)
+    if not palavras:
+        return None
+    return ' '.join(f'"{palavra}"*' for palavra in palavras)
+
+
+def _fts(expressao: str):
+    return (
+        text(
+            'SELECT rowid, bm25(atletas_fts) AS rank '
+            'FROM atletas_fts WHERE atletas_fts MATCH :expressao'
+        )
+        .bindparams(expressao=expressao)
+        .columns(rowid=Integer, rank=Float)
+        .subquery('fts')
+    )
+
+
+def _colunas_busca(relevancia: ColumnElement) -> Select:
+    return (
+        select(
+            AtletaModel.id,
+            AtletaModel.nome,
+            CategoriaModel.nome.label('categoria'),
+            CentroTreinamentoModel.nome.label('centro_treinamento'),
+            relevancia.label('relevancia'),
+        )
+        .select_from(AtletaModel)
+        .join(AtletaModel.categoria)
+        .join(AtletaModel.centro_treinamento)
+    )
+
+
+def filtro_nome(db_session: DatabaseDependency, nome: str) -> ColumnElement:
+    """
+    Filtro "contém" por nome que ignora acentos e maiúsculas. No Postgres usa o índice trigram;
+    no SQLite, a f_unaccent registrada em cada conexão, com o padrão normalizado aqui mesmo.
+    """
+    if dialeto(db_session) == 'postgresql':
+        return _contem(_normalizado(AtletaModel.nome), nome)
+
+    return _normalizado(AtletaModel.nome).like(f'%{sem_acentos(_escapar_like(nome))}%', escape='!')
+
+
+async def buscar_atletas(
+    db_session: DatabaseDependency,
+    termo: str,
+    limite: int = 20
+) -> list[dict]:
+    if dialeto(db_session) == 'postgresql':
+        # Similaridade por palavra (pg_trgm) tolera erros de digitação; o "contém" garante
+        # que trechos exatos sempre apareçam. Ambos usam o índice GIN trigram.
+        coluna = _normalizado(AtletaModel.nome)
+        alvo = _normalizado(_parametro(termo))
+        relevancia = func.word_similarity(alvo, coluna)
+
+        query = (
+            _colunas_busca(relevancia)
+            .where(or_(_contem(coluna, termo), alvo.op('<%', is_comparison=True)(coluna)))
+            .order_by(relevancia.desc(), AtletaModel.nome)
+        )
+    else:
+        expressao = _expressao_fts(termo)
+        if not expressao:
+            return []
+
+        fts = _fts(expressao)
+        query = (
+            _colunas_busca(-fts.c.rank)
+            .join(fts, fts.c.rowid == AtletaModel.pk_id)
+            .order_by(fts.c.rank, AtletaModel.nome)
+        )
+
+    linhas = (await db_session.execute(query.limit(limite))).all()
+
+    return [projetar(AtletaBusca, linha) for linha in linhas]
+
+
+async def autocompletar_atletas(
+    db_session: DatabaseDependency,
+    prefixo: str,
+    limite: int = 10
+) -> list[dict]:
+    query = select(AtletaModel.id, AtletaModel.nome)
+
+    if dialeto(db_session) == 'postgresql':
+        # Casa o início do nome ou o início de qualquer sobrenome, priorizando o primeiro caso
+        coluna = _normalizado(AtletaModel.nome)
+        alvo = _normalizado(_parametro(_escapar_like(prefixo)))
+        inicio_nome = coluna.like(func.concat(alvo, '%'), escape='!')
+        inicio_palavra = coluna.like(func.concat('% ', alvo, '%'), escape='!')
+
+        query = (
+            query
+            .where(or_(inicio_nome, inicio_palavra))
+            .order_by(inicio_nome.desc(), AtletaModel.nome)
+        )
+    else:
+        expressao = _expressao_fts(prefixo)
+        if not expressao:
+            return []
+
+        fts = _fts(expressao)
+        query = (
+            query
+            .join(fts, fts.c.rowid == AtletaModel.pk_id)
+            .order_by(fts.c.rank, AtletaModel.nome)
+        )
+
+    linhas = (await db_session.execute(query.limit(limite))).all()
+
+    return [projetar(AtletaSugestao, linha) for linha in linhas]
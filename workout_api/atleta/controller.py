@@ -1,17 +1,44 @@
+from typing import Literal
 from uuid import UUID
-from fastapi import APIRouter, Depends, Body, status
-from fastapi_pagination import Page, paginate
-from workout_api.atleta.schemas import AtletaIn, AtletaOut, AtletaUpdate
+from fastapi import APIRouter, Depends, Body, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from workout_api.atleta.schemas import (
+    AtletaBusca,
+    AtletaEstatistica,
+    AtletaImportacaoOut,
+    AtletaIn,
+    AtletaLoteOut,
+    AtletaOut,
+    AtletaPatchLote,
+    AtletaResumo,
+    AtletaSelecaoLote,
+    AtletaSugestao,
+    AtletaUpdate,
+)
+from workout_api.atleta.busca import autocompletar_atletas, buscar_atletas
+from workout_api.atleta.estatisticas import DIMENSOES, consultar_estatisticas
+from workout_api.atleta.jobs import caminho_arquivo, salvar_corpo
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.etag import formatar_etag, ler_etags
+from workout_api.contrib.ingestao import ler_csv, ler_ndjson
+from workout_api.contrib.pagination import CursorPage, CursorParams
+from workout_api.contrib.serializacao import SerializacaoRapida
+from workout_api.jobs.fila import fila
+from workout_api.jobs.schemas import JobOut
 from workout_api.atleta.atleta_crud import (
     criar_atleta,
+    exportar_atletas,
+    importar_atletas,
     listar_atletas,
     buscar_atleta_por_id,
     atualizar_atleta,
-    deletar_atleta
+    atualizar_atletas_em_lote,
+    deletar_atleta,
+    deletar_atletas_em_lote
 )
 
 router = APIRouter()
+responder = SerializacaoRapida('atletas')
 
 @router.post(
     '/', 
@@ -20,25 +47,209 @@ router = APIRouter()
     response_model=AtletaOut
 )
 async def post(
-    db_session: DatabaseDependency = Depends(),
+    db_session: DatabaseDependency,
     atleta_in: AtletaIn = Body(...)
 ):
     return await criar_atleta(db_session, atleta_in)
 
 
+@router.post(
+    '/bulk',
+    summary='Importar atletas em lote (NDJSON ou CSV)',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaImportacaoOut,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/x-ndjson': {'schema': {'type': 'string'}},
+                'text/csv': {'schema': {'type': 'string'}},
+            },
+        }
+    },
+)
+async def bulk(
+    request: Request,
+    db_session: DatabaseDependency
+):
+    # O corpo é lido em streaming; CSV usa as colunas de AtletaIn com categoria e
+    # centro_treinamento informados pelo nome
+    if 'csv' in request.headers.get('content-type', ''):
+        registros = ler_csv(request.stream())
+    else:
+        registros = ler_ndjson(request.stream())
+
+    return await importar_atletas(db_session, registros)
+
+
+@router.post(
+    '/jobs/importacao',
+    summary='Importar atletas em lote (NDJSON ou CSV) em segundo plano',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobOut,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/x-ndjson': {'schema': {'type': 'string'}},
+                'text/csv': {'schema': {'type': 'string'}},
+            },
+        }
+    },
+)
+async def job_importacao(
+    request: Request,
+    db_session: DatabaseDependency
+):
+    # Mesmo formato de POST /atletas/bulk; o resultado fica no job (GET /jobs/{id})
+    formato = 'csv' if 'csv' in request.headers.get('content-type', '') else 'ndjson'
+    arquivo = await salvar_corpo(request.stream(), formato)
+    return await fila.submeter(db_session, 'atletas.importar', {'arquivo': arquivo, 'formato': formato})
+
+
+@router.post(
+    '/jobs/exportacao',
+    summary='Exportar os Atletas em NDJSON ou CSV em segundo plano',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobOut,
+)
+async def job_exportacao(
+    db_session: DatabaseDependency,
+    formato: Literal['ndjson', 'csv'] = 'ndjson',
+    nome: str | None = None,
+    cpf: str | None = None
+):
+    # O arquivo gerado é baixado por GET /jobs/{id}/arquivo
+    parametros = {'arquivo': caminho_arquivo(formato), 'formato': formato, 'nome': nome, 'cpf': cpf}
+    return await fila.submeter(db_session, 'atletas.exportar', parametros)
+
+
+@router.post(
+    '/jobs/estatisticas',
+    summary='Recalcular as estatísticas dos Atletas em segundo plano',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobOut,
+)
+async def job_estatisticas(
+    db_session: DatabaseDependency
+):
+    return await fila.submeter(db_session, 'atletas.estatisticas', {})
+
+
 @router.get(
     '/', 
     summary='Consultar todos os Atletas',
     status_code=status.HTTP_200_OK,
-    response_model=Page[dict],
+    response_model=CursorPage[AtletaResumo],
 )
 async def query(
-    db_session: DatabaseDependency = Depends(),
+    db_session: DatabaseDependency,
+    params: CursorParams = Depends(),
     nome: str | None = None,
     cpf: str | None = None
 ):
-    atletas = await listar_atletas(db_session, nome, cpf)
-    return paginate(atletas)
+    return responder(await listar_atletas(db_session, params, nome, cpf))
+
+
+@router.delete(
+    '/',
+    summary='Deletar Atletas em lote, por ids e/ou filtros',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaLoteOut,
+)
+async def delete_lote(
+    db_session: DatabaseDependency,
+    selecao: AtletaSelecaoLote = Body(...),
+    dry_run: bool = Query(False, description='Apenas conta os atletas selecionados, sem remover')
+) -> AtletaLoteOut:
+    return await deletar_atletas_em_lote(db_session, selecao, dry_run)
+
+
+@router.patch(
+    '/',
+    summary='Editar Atletas em lote, por ids e/ou filtros',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaLoteOut,
+)
+async def patch_lote(
+    db_session: DatabaseDependency,
+    patch: AtletaPatchLote = Body(...),
+    dry_run: bool = Query(False, description='Apenas conta os atletas selecionados, sem alterar')
+) -> AtletaLoteOut:
+    return await atualizar_atletas_em_lote(db_session, patch, dry_run)
+
+
+@router.get(
+    '/search',
+    summary='Buscar Atletas pelo nome (resultados ordenados por relevância)',
+    status_code=status.HTTP_200_OK,
+    response_model=list[AtletaBusca],
+)
+async def search(
+    db_session: DatabaseDependency,
+    termo: str = Query(..., min_length=2, max_length=50),
+    limite: int = Query(20, ge=1, le=100)
+):
+    return responder(await buscar_atletas(db_session, termo, limite))
+
+
+@router.get(
+    '/search/autocomplete',
+    summary='Sugerir Atletas cujo nome ou sobrenome começa com o prefixo',
+    status_code=status.HTTP_200_OK,
+    response_model=list[AtletaSugestao],
+)
+async def autocomplete(
+    db_session: DatabaseDependency,
+    prefixo: str = Query(..., min_length=1, max_length=50),
+    limite: int = Query(10, ge=1, le=50)
+):
+    return responder(await autocompletar_atletas(db_session, prefixo, limite))
+
+
+@router.get(
+    '/stats',
+    summary='Estatísticas dos Atletas agrupadas por categoria, centro de treinamento e/ou sexo',
+    status_code=status.HTTP_200_OK,
+    response_model=list[AtletaEstatistica],
+    response_model_exclude_none=True,
+)
+async def stats(
+    db_session: DatabaseDependency,
+    dimensoes: str = Query(
+        'categoria',
+        description=f"Dimensões separadas por vírgula ({', '.join(DIMENSOES)}); vazio agrega todos os atletas"
+    )
+):
+    selecionadas = [dimensao.strip() for dimensao in dimensoes.split(',') if dimensao.strip()]
+    invalidas = [dimensao for dimensao in selecionadas if dimensao not in DIMENSOES]
+    if invalidas:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Dimensões inválidas: {', '.join(invalidas)}. Use {', '.join(DIMENSOES)}."
+        )
+
+    return responder(await consultar_estatisticas(db_session, list(dict.fromkeys(selecionadas))))
+
+
+@router.get(
+    '/export',
+    summary='Exportar os Atletas em NDJSON ou CSV (streaming)',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export(
+    db_session: DatabaseDependency,
+    formato: Literal['ndjson', 'csv'] = 'ndjson',
+    nome: str | None = None,
+    cpf: str | None = None
+):
+    media_type = 'text/csv' if formato == 'csv' else 'application/x-ndjson'
+    return StreamingResponse(
+        exportar_atletas(db_session, formato, nome, cpf),
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="atletas.{formato}"'},
+    )
 
 
 @router.get(
@@ -49,9 +260,12 @@ async def query(
 )
 async def get(
     id: UUID,
-    db_session: DatabaseDependency = Depends()
+    db_session: DatabaseDependency,
+    response: Response
 ):
-    return await buscar_atleta_por_id(db_session, id)
+    atleta, versao = await buscar_atleta_por_id(db_session, id)
+    response.headers['ETag'] = formatar_etag(versao)
+    return responder(atleta, response)
 
 
 @router.patch(
@@ -59,13 +273,35 @@ async def get(
     summary='Editar um Atleta pelo id',
     status_code=status.HTTP_200_OK,
     response_model=AtletaOut,
+    responses={status.HTTP_412_PRECONDITION_FAILED: {'description': 'If-Match não corresponde à versão atual'}},
 )
 async def patch(
     id: UUID,
-    db_session: DatabaseDependency = Depends(),
-    atleta_update: AtletaUpdate = Body(...)
+    db_session: DatabaseDependency,
+    response: Response,
+    atleta_update: AtletaUpdate = Body(...),
+    if_match: str | None = Header(None, description='ETag obtido em GET /atletas/{id}')
 ):
-    return await atualizar_atleta(db_session, id, atleta_update)
+    # Sem If-Match (ou com '*') a edição não é condicionada à versão
+    etags = [etag for etag in ler_etags(if_match, fortes=True) if etag != '*']
+    versao_esperada = None
+    if any(etag.startswith('W/') for etag in etags):
+        # If-Match usa comparação forte: o ETag fraco de uma resposta em MessagePack ou comprimida não vale
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail='If-Match exige um ETag forte, como o de GET /atletas/{id} em JSON sem compressão.'
+        )
+    if etags:
+        if len(etags) > 1 or not etags[0].isdigit():
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail='If-Match deve conter o ETag retornado pela API.'
+            )
+        versao_esperada = int(etags[0])
+
+    atleta, versao = await atualizar_atleta(db_session, id, atleta_update, versao_esperada)
+    response.headers['ETag'] = formatar_etag(versao)
+    return atleta
 
 
 @router.delete(
@@ -75,6 +311,6 @@ async def patch(
 )
 async def delete(
     id: UUID,
-    db_session: DatabaseDependency = Depends()
+    db_session: DatabaseDependency
 ):
     return await deletar_atleta(db_session, id)
\ No newline at end of file
@@ -0,0 +1,192 @@
+from typing import Sequence
+
+from sqlalchemy import Delete, Insert, Update, delete, func, literal, select, true, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.sql import ColumnElement, FromClause, Select
+
+from workout_api.atleta.models import AtletaEstatisticaModel, AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.configs.database import dialeto
+from workout_api.contrib.dependencies import DatabaseDependency
+
+# Colunas de atletas que entram nos agregados: as dimensões e as medidas
+COLUNAS = ('categoria_id', 'centro_treinamento_id', 'sexo', 'idade', 'peso', 'altura')
+CHAVE = ('categoria_id', 'centro_treinamento_id', 'sexo')
+SOMAS = ('quantidade', 'soma_idade', 'soma_peso', 'soma_altura', 'soma_imc')
+
+DIMENSOES = {
+    'categoria': CategoriaModel.nome,
+    'centro_treinamento': CentroTreinamentoModel.nome,
+    'sexo': AtletaEstatisticaModel.sexo,
+}
+
+
+def colunas_rotuladas(tabela: FromClause, prefixo: str) -> list[ColumnElement]:
+    """COLUNAS de `tabela` com prefixo, para ir no RETURNING ao lado das colunas da resposta."""
+    return [tabela.c[coluna].label(f'{prefixo}{coluna}') for coluna in COLUNAS]
+
+
+def deltas(origem: FromClause, sinal: int, prefixo: str = '') -> Select:
+    """Contribuição de cada linha de `origem` (atletas ou um RETURNING) aos agregados: +1 entra, -1 sai."""
+    c = {coluna: origem.c[f'{prefixo}{coluna}'] for coluna in COLUNAS}
+    return select(
+        *(c[coluna].label(coluna) for coluna in CHAVE),
+        literal(sinal).label('quantidade'),
+        (c['idade'] * sinal).label('soma_idade'),
+        (c['peso'] * sinal).label('soma_peso'),
+        (c['altura'] * sinal).label('soma_altura'),
+        (c['peso'] / (c['altura'] * c['altura']) * sinal).label('soma_imc'),
+    )
+
+
+def upsert_estatisticas(db_session: DatabaseDependency, *variacoes: Select) -> Insert:
+    """
+    INSERT ... ON CONFLICT que soma as variações aos agregados. Elas são agrupadas pela
+    chave antes, pois o Postgres não aceita alterar a mesma linha duas vezes no comando;
+    grupos sem variação líquida (ex.: a idade voltou ao mesmo valor) não são gravados.
+    """
+    origem = (variacoes[0] if len(variacoes) == 1 else union_all(*variacoes)).subquery()
+    agregado = (
+        select(*(origem.c[coluna] for coluna in CHAVE), *(func.sum(origem.c[soma]) for soma in SOMAS))
+        # O SQLite exige WHERE no SELECT de um INSERT com ON CONFLICT
+        .where(true())
+        .group_by(*(origem.c[coluna] for coluna in CHAVE))
+        .having((func.sum(origem.c.quantidade) != 0) | (func.sum(origem.c.soma_idade) != 0))
+    )
+
+    insert = postgresql.insert if dialeto(db_session) == 'postgresql' else sqlite.insert
+    tabela = AtletaEstatisticaModel.__table__
+    comando = insert(tabela).from_select([*CHAVE, *SOMAS], agregado)
+    return comando.on_conflict_do_update(
+        index_elements=list(CHAVE),
+        set_={soma: tabela.c[soma] + comando.excluded[soma] for soma in SOMAS},
+    )
+
+
+async def executar_com_estatisticas(
+    db_session: DatabaseDependency,
+    comando: Insert | Update | Delete,
+    *retorno: ColumnElement
+) -> Sequence[RowMapping]:
+    """
+    Executa um INSERT/UPDATE/DELETE em atletas e aplica seu efeito aos agregados na mesma
+    transação, devolvendo as linhas de `retorno` (RETURNING). Não confirma a transação.
+
+    No Postgres é um único comando: o DML roda como CTE e o upsert lê o RETURNING, que no
+    UPDATE traz também os valores anteriores (das linhas travadas antes da alteração). No
+    SQLite, que não aceita DML em CTE, as linhas afetadas saem dos agregados antes do comando
+    e voltam depois dele. tests/test_estatisticas.py cobre os dois caminhos.
+    """
+    atletas = AtletaModel.__table__
+    remove = not isinstance(comando, Insert)
+    soma = not isinstance(comando, Delete)
+
+    if dialeto(db_session) == 'postgresql':
+        rotuladas = []
+        if isinstance(comando, Update):
+            # O SELECT ... FOR UPDATE espera as escritas concorrentes nas mesmas linhas e devolve
+            # a versão mais recente delas, já travada: é dela que sai o valor anterior. Uma
+            # autojunção leria o snapshot do comando, e os agregados perderiam a escrita concorrente.
+            travados = (
+                select(atletas.c.pk_id, *colunas_rotuladas(atletas, 'anterior_'))
+                .where(comando.whereclause)
+                .with_for_update(of=atletas)
+                .cte('travados')
+            )
+            comando = comando.where(travados.c.pk_id == atletas.c.pk_id)
+            rotuladas += [travados.c[f'anterior_{coluna}'] for coluna in COLUNAS]
+        elif remove:
+            rotuladas += colunas_rotuladas(atletas, 'anterior_')
+        if soma:
+            rotuladas += colunas_rotuladas(atletas, 'atual_')
+
+        alterados = comando.returning(*retorno, *rotuladas).cte('alterados')
+        variacoes = []
+        if remove:
+            variacoes.append(deltas(alterados, -1, 'anterior_'))
+        if soma:
+            variacoes.append(deltas(alterados, 1, 'atual_'))
+        query = (
+            select(*(alterados.c[coluna.key] for coluna in retorno))
+            .add_cte(upsert_estatisticas(db_session, *variacoes).cte('estatisticas'))
+        )
+        return (await db_session.execute(query)).mappings().all()
+
+    if remove:
+        selecionados = select(atletas).where(comando.whereclause).subquery()
+        await db_session.execute(upsert_estatisticas(db_session, deltas(selecionados, -1)))
+
+    linhas = (await db_session.execute(comando.returning(*retorno, atletas.c.pk_id.label('_pk_id')))).mappings().all()
+
+    if soma and linhas:
+        pk_ids = [linha['_pk_id'] for linha in linhas]
+        alterados = select(atletas).where(atletas.c.pk_id.in_(pk_ids)).subquery()
+        await db_session.execute(upsert_estatisticas(db_session, deltas(alterados, 1)))
+    return linhas
+
+
+async def recalcular_estatisticas(conexao) -> None:
+    """
+    Refaz os agregados a partir de atletas (sessão ou conexão; não confirma a transação).
+    Para cargas feitas fora da API ou para corrigir o acúmulo de arredondamento das somas.
+    """
+    atletas = AtletaModel.__table__
+    imc = atletas.c.peso / (atletas.c.altura * atletas.c.altura)
+    await conexao.execute(delete(AtletaEstatisticaModel))
+    await conexao.execute(
+        AtletaEstatisticaModel.__table__.insert().from_select(
+            [*CHAVE, *SOMAS],
+            select(
+                *(atletas.c[coluna] for coluna in CHAVE),
+                func.count(),
+                func.sum(atletas.c.idade),
+                func.sum(atletas.c.peso),
+                func.sum(atletas.c.altura),
+                func.sum(imc),
+            ).group_by(*(atletas.c[coluna] for coluna in CHAVE))
+        )
+    )
+
+
+async def contar_atletas(db_session: DatabaseDependency) -> int:
+    """
+    Total exato de atletas, somado dos agregados: eles já são mantidos em cada escrita, e a
+    soma lê uma linha por grupo, sem concentrar as escritas concorrentes em um único contador.
+    """
+    return (await db_session.execute(select(func.coalesce(func.sum(AtletaEstatisticaModel.quantidade), 0)))).scalar_one()
+
+
+async def consultar_estatisticas(db_session: DatabaseDependency, dimensoes: list[str]) -> list[dict]:
+    """
+    Médias e contagens agrupadas pelas `dimensoes`, lidas da tabela de agregados: o custo
+    depende do número de combinações categoria x centro x sexo, não do número de atletas.
+    """
+    e = AtletaEstatisticaModel
+    quantidade = func.sum(e.quantidade)
+    colunas = [DIMENSOES[dimensao].label(dimensao) for dimensao in dimensoes]
+    query = (
+        select(
+            *colunas,
+            quantidade.label('quantidade'),
+            (func.sum(e.soma_idade) * 1.0 / quantidade).label('idade_media'),
+            (func.sum(e.soma_peso) / quantidade).label('peso_medio'),
+            (func.sum(e.soma_altura) / quantidade).label('altura_media'),
+            (func.sum(e.soma_imc) / quantidade).label('imc_medio'),
+        )
+        .select_from(e)
+        .join(CategoriaModel, CategoriaModel.pk_id == e.categoria_id)
+        .join(CentroTreinamentoModel, CentroTreinamentoModel.pk_id == e.centro_treinamento_id)
+        .group_by(*colunas)
+        .having(quantidade > 0)
+        .order_by(*colunas)
+    )
+
+    estatisticas = []
+    for linha in (await db_session.execute(query)).mappings():
+        estatistica = dict(linha)
+        for media in ('idade_media', 'peso_medio', 'altura_media', 'imc_medio'):
+            estatistica[media] = round(float(estatistica[media]), 2)
+        estatisticas.append(estatistica)
+    return estatisticas
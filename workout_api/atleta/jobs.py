@@ -0,0 +1,85 @@
+"""
+Operações pesadas de atletas executadas pela fila de jobs, fora das requisições.
+Após um reinício, a importação continua da primeira linha ainda não confirmada (o progresso
+é gravado na transação de cada lote); a exportação reescreve o arquivo e o recálculo das
+estatísticas refaz a tabela inteira.
+"""
+import asyncio
+import os
+from typing import AsyncIterator
+from uuid import uuid4
+
+from pydantic_core import to_jsonable_python
+
+from workout_api.atleta.atleta_crud import exportar_atletas, importar_atletas
+from workout_api.atleta.estatisticas import recalcular_estatisticas
+from workout_api.atleta.schemas import AtletaImportacaoOut
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.ingestao import ler_csv, ler_ndjson
+from workout_api.jobs.fila import ContextoJob, fila
+
+TAMANHO_BLOCO = 64 * 1024
+
+
+def caminho_arquivo(extensao: str) -> str:
+    os.makedirs(settings.JOBS_DIR, exist_ok=True)
+    return os.path.join(settings.JOBS_DIR, f'{uuid4()}.{extensao}')
+
+
+async def salvar_corpo(stream: AsyncIterator[bytes], extensao: str) -> str:
+    """Grava o corpo da requisição em JOBS_DIR, sem carregá-lo inteiro em memória."""
+    caminho = caminho_arquivo(extensao)
+    with open(caminho, 'wb') as arquivo:
+        async for bloco in stream:
+            await asyncio.to_thread(arquivo.write, bloco)
+    return caminho
+
+
+async def _ler_arquivo(caminho: str) -> AsyncIterator[bytes]:
+    with open(caminho, 'rb') as arquivo:
+        while bloco := await asyncio.to_thread(arquivo.read, TAMANHO_BLOCO):
+            yield bloco
+
+
+@fila.tarefa('atletas.importar', concorrencia=2)
+async def importar(contexto: ContextoJob) -> dict:
+    caminho = contexto.parametros['arquivo']
+    leitor = ler_csv if contexto.parametros['formato'] == 'csv' else ler_ndjson
+    # O progresso é o resultado parcial até o último lote confirmado
+    anterior = AtletaImportacaoOut.model_validate(contexto.progresso) if contexto.progresso else None
+
+    async def progresso(db_session, parcial: AtletaImportacaoOut) -> None:
+        await contexto.reportar_na_transacao(db_session, **parcial.model_dump())
+
+    async with async_session() as db_session:
+        resultado = await importar_atletas(db_session, leitor(_ler_arquivo(caminho)), progresso, anterior)
+
+    # Falhas e cancelamentos removem o arquivo na fila; reinícios o mantêm para a nova execução
+    os.remove(caminho)
+    return to_jsonable_python(resultado)
+
+
+@fila.tarefa('atletas.exportar', concorrencia=2)
+async def exportar(contexto: ContextoJob) -> dict:
+    parametros = contexto.parametros
+    caminho = parametros['arquivo']
+    escritos = 0
+
+    async with async_session() as db_session:
+        with open(caminho, 'wb') as arquivo:
+            async for bloco in exportar_atletas(
+                db_session, parametros['formato'], parametros.get('nome'), parametros.get('cpf')
+            ):
+                await asyncio.to_thread(arquivo.write, bloco)
+                escritos += len(bloco)
+                await contexto.reportar(bytes=escritos)
+
+    return {'arquivo': caminho, 'bytes': escritos}
+
+
+@fila.tarefa('atletas.estatisticas', concorrencia=1)
+async def estatisticas(contexto: ContextoJob) -> None:
+    async with async_session() as db_session:
+        await recalcular_estatisticas(db_session)
+        await db_session.commit()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Float
+from sqlalchemy import DDL, BigInteger, DateTime, ForeignKey, Integer, String, Float, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from workout_api.contrib.models import BaseModel
 
@@ -15,7 +15,59 @@ class AtletaModel(BaseModel):
     altura: Mapped[float] = mapped_column(Float, nullable=False)
     sexo: Mapped[str] = mapped_column(String(1), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Incrementada a cada alteração; exposta como ETag para o controle de concorrência otimista
+    versao: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default='1')
     categoria: Mapped['CategoriaModel'] = relationship(back_populates="atleta", lazy='selectin')
     categoria_id: Mapped[int] = mapped_column(ForeignKey("categorias.pk_id"))
     centro_treinamento: Mapped['CentroTreinamentoModel'] = relationship(back_populates="atleta", lazy='selectin')
-    centro_treinamento_id: Mapped[int] = mapped_column(ForeignKey("centros_treinamento.pk_id"))
\ No newline at end of file
+    centro_treinamento_id: Mapped[int] = mapped_column(ForeignKey("centros_treinamento.pk_id"))
+
+
+class AtletaEstatisticaModel(BaseModel):
+    # Agregados de atletas por categoria, centro e sexo, mantidos na mesma transação de
+    # cada escrita em atletas (ver atleta/estatisticas.py)
+    __tablename__ = 'atletas_estatisticas'
+
+    # A linha é identificada pelas dimensões: dispensa o id (UUID) comum às demais tabelas
+    id = None
+    categoria_id: Mapped[int] = mapped_column(ForeignKey("categorias.pk_id"), primary_key=True)
+    centro_treinamento_id: Mapped[int] = mapped_column(ForeignKey("centros_treinamento.pk_id"), primary_key=True)
+    sexo: Mapped[str] = mapped_column(String(1), primary_key=True)
+    quantidade: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    soma_idade: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    soma_peso: Mapped[float] = mapped_column(Float, nullable=False)
+    soma_altura: Mapped[float] = mapped_column(Float, nullable=False)
+    soma_imc: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+# Estruturas de busca por nome criadas junto com a tabela (metadata.create_all).
+# Em produção (Postgres) elas vêm da migration de busca trigram.
+BUSCA_POSTGRES = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text "
+    "AS $$ SELECT public.unaccent('public.unaccent', $1) $$ "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT",
+    "CREATE INDEX IF NOT EXISTS ix_atletas_nome_trgm ON atletas "
+    "USING gin (f_unaccent(lower(nome)) gin_trgm_ops)",
+)
+
+BUSCA_SQLITE = (
+    "CREATE VIRTUAL TABLE atletas_fts USING fts5("
+    "nome, content='atletas', content_rowid='pk_id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER atletas_fts_ai AFTER INSERT ON atletas BEGIN "
+    "INSERT INTO atletas_fts(rowid, nome) VALUES (new.pk_id, new.nome); END",
+    "CREATE TRIGGER atletas_fts_ad AFTER DELETE ON atletas BEGIN "
+    "INSERT INTO atletas_fts(atletas_fts, rowid, nome) VALUES ('delete', old.pk_id, old.nome); END",
+    "CREATE TRIGGER atletas_fts_au AFTER UPDATE OF nome ON atletas BEGIN "
+    "INSERT INTO atletas_fts(atletas_fts, rowid, nome) VALUES ('delete', old.pk_id, old.nome); "
+    "INSERT INTO atletas_fts(rowid, nome) VALUES (new.pk_id, new.nome); END",
+)
+
+for ddl in BUSCA_POSTGRES:
+    event.listen(AtletaModel.__table__, 'after_create', DDL(ddl).execute_if(dialect='postgresql'))
+for ddl in BUSCA_SQLITE:
+    event.listen(AtletaModel.__table__, 'after_create', DDL(ddl).execute_if(dialect='sqlite'))
+event.listen(
+    AtletaModel.__table__, 'before_drop', DDL('DROP TABLE IF EXISTS atletas_fts').execute_if(dialect='sqlite')
+)
\ No newline at end of file
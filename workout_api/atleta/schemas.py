@@ -1,5 +1,5 @@
-from typing import Annotated, Optional
-from pydantic import Field, PositiveFloat
+from typing import Annotated, Literal, Optional
+from pydantic import UUID4, Field, PositiveFloat
 from workout_api.categorias.schemas import CategoriaIn
 from workout_api.centro_treinamento.schemas import CentroTreinamentoAtleta
 
@@ -48,4 +48,81 @@ class AtletaUpdate(BaseSchema):
             description="Idade do atleta",
             json_schema_extra={"example": 25},
         ),
-    ]
\ No newline at end of file
+    ]
+
+class AtletaResumo(BaseSchema):
+    nome: Annotated[str, Field(description="Nome do atleta", json_schema_extra={"example": "Joao"})]
+    centro_treinamento: Annotated[str, Field(description="Nome do centro de treinamento do atleta")]
+    categoria: Annotated[str, Field(description="Nome da categoria do atleta")]
+
+
+class AtletaBusca(BaseSchema):
+    id: Annotated[UUID4, Field(description="Identificador do atleta")]
+    nome: Annotated[str, Field(description="Nome do atleta", json_schema_extra={"example": "João"})]
+    categoria: Annotated[str, Field(description="Nome da categoria do atleta")]
+    centro_treinamento: Annotated[str, Field(description="Nome do centro de treinamento do atleta")]
+    relevancia: Annotated[float, Field(description="Relevância do resultado (maior é melhor)")]
+
+
+class AtletaSugestao(BaseSchema):
+    id: Annotated[UUID4, Field(description="Identificador do atleta")]
+    nome: Annotated[str, Field(description="Nome do atleta", json_schema_extra={"example": "João"})]
+
+
+class AtletaImportacaoFalha(BaseSchema):
+    linha: Annotated[int, Field(description="Número da linha no arquivo enviado")]
+    cpf: Annotated[Optional[str], Field(None, description="CPF informado na linha, quando disponível")]
+    status: Annotated[
+        Literal['conflito', 'invalido'],
+        Field(description="'conflito' para CPF já cadastrado, 'invalido' para dados rejeitados")
+    ]
+    detalhe: Annotated[str, Field(description="Motivo da rejeição da linha")]
+
+
+class AtletaImportacaoOut(BaseSchema):
+    total: Annotated[int, Field(description="Linhas processadas")]
+    inseridos: Annotated[int, Field(description="Atletas criados")]
+    conflitos: Annotated[int, Field(description="Linhas rejeitadas por CPF já cadastrado")]
+    invalidos: Annotated[int, Field(description="Linhas rejeitadas por dados inválidos")]
+    falhas: Annotated[list[AtletaImportacaoFalha], Field(description="Resultado de cada linha não inserida")]
+
+
+class AtletaSelecaoLote(BaseSchema):
+    ids: Annotated[
+        Optional[list[UUID4]], Field(None, description="Ids dos atletas; combinado com os filtros por E")]
+    nome: Annotated[
+        Optional[str], Field(None, description="Filtro por nome, como em GET /atletas")]
+    cpf: Annotated[
+        Optional[str], Field(None, max_length=11, description="Filtro por CPF, como em GET /atletas")]
+
+
+class AtletaAlteracaoLote(BaseSchema):
+    idade: Annotated[
+        Optional[int], Field(None, description="Nova idade", json_schema_extra={"example": 25})]
+    categoria: Annotated[
+        Optional[str], Field(None, description="Nome da nova categoria", json_schema_extra={"example": "Scale"})]
+    centro_treinamento: Annotated[
+        Optional[str], Field(None, description="Nome do novo centro de treinamento")]
+
+
+class AtletaPatchLote(AtletaSelecaoLote):
+    alteracao: Annotated[AtletaAlteracaoLote, Field(description="Campos alterados em todos os atletas selecionados")]
+
+
+class AtletaLoteOut(BaseSchema):
+    afetados: Annotated[int, Field(description="Atletas alterados/removidos (ou que seriam, em dry_run)")]
+    dry_run: Annotated[bool, Field(description="Se verdadeiro, nada foi gravado")]
+
+
+class AtletaEstatistica(BaseSchema):
+    categoria: Annotated[
+        Optional[str], Field(None, description="Categoria do grupo (ausente se não for dimensão)")]
+    centro_treinamento: Annotated[
+        Optional[str], Field(None, description="Centro de treinamento do grupo (ausente se não for dimensão)")]
+    sexo: Annotated[
+        Optional[str], Field(None, description="Sexo do grupo (ausente se não for dimensão)")]
+    quantidade: Annotated[int, Field(description="Atletas no grupo")]
+    idade_media: Annotated[float, Field(description="Idade média")]
+    peso_medio: Annotated[float, Field(description="Peso médio")]
+    altura_media: Annotated[float, Field(description="Altura média")]
+    imc_medio: Annotated[float, Field(description="Média do IMC (peso / altura²) dos atletas")]
@@ -1,11 +1,19 @@
 from uuid import UUID, uuid4
 from fastapi import HTTPException, status
+from pydantic_core import to_jsonable_python
 from sqlalchemy.exc import IntegrityError
 from workout_api.categorias.models import CategoriaModel
 from workout_api.categorias.schemas import CategoriaIn, CategoriaOut
+from workout_api.contrib.cache import cache
+from workout_api.contrib.coalescencia import coalescencia
+from workout_api.contrib.contagem import ajustar_contagem, contar_total, ler_contagem, ler_versao, publicar_versoes
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.pagination import CursorParams, paginar_por_cursor
+from workout_api.contrib.serializacao import projetar
 from sqlalchemy.future import select
 
+CACHE_NAMESPACE = 'categorias'
+
 
 async def criar_categoria(
     db_session: DatabaseDependency, 
@@ -29,7 +37,11 @@ async def criar_categoria(
     try:
         # Adiciona ao banco de dados
         db_session.add(categoria_model)
+        await ajustar_contagem(db_session, CategoriaModel.__tablename__, 1)
         await db_session.commit()
+        coalescencia.esquecer(CACHE_NAMESPACE)
+        await cache.invalidar(CACHE_NAMESPACE)
+        await publicar_versoes(db_session)
         return categoria_out
     except IntegrityError:
         # Rollback no caso de erro de integridade
@@ -41,19 +53,52 @@ async def criar_categoria(
 
 
 async def listar_categorias(
-    db_session: DatabaseDependency
-) -> list[CategoriaOut]:
-    # Recupera todas as categorias do banco de dados
-    categoria_models = (await db_session.execute(select(CategoriaModel))).scalars().all()
+    db_session: DatabaseDependency,
+    params: CursorParams
+) -> dict:
+    """Página em formato JSON, a mesma guardada no cache (ver contrib.serializacao)."""
+    # A versão da tabela (ETag) na chave: outro worker que já viu uma escrita não recebe uma página anterior a ela
+    versao = await ler_versao(db_session, CACHE_NAMESPACE)
+    chave = f'{CACHE_NAMESPACE}:pagina:{versao}:{params.cursor}:{params.size}:{params.total}'
+    if (pagina := await cache.get(chave)) is not None:
+        return pagina
+
+    # Requisições simultâneas pela mesma página (ex.: cache recém-invalidado) fazem uma só consulta
+    return await coalescencia.executar(db_session, chave, lambda: _carregar_pagina(db_session, params, chave))
+
+
+async def _carregar_pagina(db_session: DatabaseDependency, params: CursorParams, chave: str) -> dict:
+    # Recupera apenas a página solicitada, convertendo os modelos para o esquema de saída
+    pagina = await paginar_por_cursor(
+        db_session,
+        select(CategoriaModel),
+        CategoriaModel.pk_id,
+        params,
+        # A listagem não tem filtros: o total é sempre o contador da tabela
+        contagem=lambda modo: contar_total(
+            db_session, modo, select(CategoriaModel), CategoriaModel.__tablename__,
+            exato=lambda: ler_contagem(db_session, CategoriaModel.__tablename__),
+        ),
+        transform=lambda modelo: projetar(CategoriaOut, modelo),
+    )
+    pagina = to_jsonable_python(pagina)
+    await cache.set(chave, pagina)
 
-    # Converte os modelos para o esquema de saída
-    return [CategoriaOut.model_validate(c) for c in categoria_models]
+    return pagina
 
 
 async def buscar_categoria_por_id(
     db_session: DatabaseDependency, 
     id: UUID
-) -> CategoriaOut:
+) -> dict:
+    chave = f'{CACHE_NAMESPACE}:id:{await ler_versao(db_session, CACHE_NAMESPACE)}:{id}'
+    if (categoria := await cache.get(chave)) is not None:
+        return categoria
+
+    return await coalescencia.executar(db_session, chave, lambda: _carregar_categoria(db_session, id, chave))
+
+
+async def _carregar_categoria(db_session: DatabaseDependency, id: UUID, chave: str) -> dict:
     # Busca uma categoria pelo ID
     categoria_model = (await db_session.execute(
         select(CategoriaModel).filter_by(id=id))
@@ -66,4 +111,32 @@ async def buscar_categoria_por_id(
         )
 
     # Converte o modelo para o esquema de saída
-    return CategoriaOut.model_validate(categoria_model)
\ No newline at end of file
+    categoria_out = to_jsonable_python(projetar(CategoriaOut, categoria_model))
+    await cache.set(chave, categoria_out)
+
+    return categoria_out
+
+
+async def pks_categorias_por_nome(
+    db_session: DatabaseDependency,
+    nomes: set[str]
+) -> dict[str, int]:
+    """Mapa nome -> pk_id das categorias existentes; só vai ao banco pelos nomes fora do cache."""
+    nomes = list(nomes)
+    pks = {
+        nome: pk_id
+        for nome, pk_id in zip(nomes, await cache.get_many([f'{CACHE_NAMESPACE}:nome:{nome}' for nome in nomes]))
+        if pk_id is not None
+    }
+
+    faltantes = set(nomes) - pks.keys()
+    if faltantes:
+        linhas = (await db_session.execute(
+            select(CategoriaModel.nome, CategoriaModel.pk_id).where(CategoriaModel.nome.in_(faltantes)))
+        ).tuples().all()
+
+        for nome, pk_id in linhas:
+            pks[nome] = pk_id
+            await cache.set(f'{CACHE_NAMESPACE}:nome:{nome}', pk_id)
+
+    return pks
\ No newline at end of file
@@ -1,16 +1,21 @@
 from uuid import UUID
-from fastapi import APIRouter, Body, Depends, status
-from fastapi_pagination import Page, paginate
+from fastapi import APIRouter, Body, Depends, Response, status
 from workout_api.categorias.schemas import CategoriaIn, CategoriaOut
+from workout_api.contrib.cache_http import CacheHttp
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.pagination import CursorPage, CursorParams
+from workout_api.contrib.serializacao import SerializacaoRapida
 
 from workout_api.categorias.categoria_crud import (
+    CACHE_NAMESPACE,
     criar_categoria,
     listar_categorias,
     buscar_categoria_por_id,
 )
 
 router = APIRouter()
+cache_http = CacheHttp(CACHE_NAMESPACE)
+responder = SerializacaoRapida('categorias')
 
 @router.post(
     '/', 
@@ -19,7 +24,7 @@ router = APIRouter()
     response_model=CategoriaOut,
 )
 async def post(
-    db_session: DatabaseDependency = Depends(), 
+    db_session: DatabaseDependency, 
     categoria_in: CategoriaIn = Body(...)
 ) -> CategoriaOut:
     return await criar_categoria(db_session, categoria_in)
@@ -29,23 +34,27 @@ async def post(
     '/', 
     summary='Consultar todas as Categorias',
     status_code=status.HTTP_200_OK,
-    response_model=Page[CategoriaOut],
+    dependencies=[Depends(cache_http)],
+    response_model=CursorPage[CategoriaOut],
 )
 async def query(
-    db_session: DatabaseDependency = Depends(),
-) -> Page[CategoriaOut]:
-    categorias = await listar_categorias(db_session)
-    return paginate(categorias)
+    db_session: DatabaseDependency,
+    response: Response,
+    params: CursorParams = Depends(),
+) -> CursorPage[CategoriaOut]:
+    return responder(await listar_categorias(db_session, params), response)
 
 
 @router.get(
     '/{id}', 
     summary='Consulta uma Categoria pelo id',
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_http)],
     response_model=CategoriaOut,
 )
 async def get(
     id: UUID, 
-    db_session: DatabaseDependency = Depends(),
+    db_session: DatabaseDependency,
+    response: Response,
 ) -> CategoriaOut:
-    return await buscar_categoria_por_id(db_session, id)
\ No newline at end of file
+    return responder(await buscar_categoria_por_id(db_session, id), response)
\ No newline at end of file
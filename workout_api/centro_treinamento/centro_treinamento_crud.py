@@ -1,12 +1,20 @@
 from uuid import UUID, uuid4
 from fastapi import HTTPException, status
+from pydantic_core import to_jsonable_python
 from workout_api.centro_treinamento.schemas import CentroTreinamentoIn, CentroTreinamentoOut
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
 
+from workout_api.contrib.cache import cache
+from workout_api.contrib.coalescencia import coalescencia
+from workout_api.contrib.contagem import ajustar_contagem, contar_total, ler_contagem, ler_versao, publicar_versoes
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.pagination import CursorParams, paginar_por_cursor
+from workout_api.contrib.serializacao import projetar
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 
+CACHE_NAMESPACE = 'centros_treinamento'
+
 
 async def criar_centro_treinamento(
     db_session: DatabaseDependency, 
@@ -30,7 +38,11 @@ async def criar_centro_treinamento(
     try:
         # Adiciona ao banco de dados
         db_session.add(centro_treinamento_model)
+        await ajustar_contagem(db_session, CentroTreinamentoModel.__tablename__, 1)
         await db_session.commit()
+        coalescencia.esquecer(CACHE_NAMESPACE)
+        await cache.invalidar(CACHE_NAMESPACE)
+        await publicar_versoes(db_session)
         return centro_treinamento_out
     except IntegrityError:
         # Rollback no caso de erro de integridade
@@ -42,23 +54,52 @@ async def criar_centro_treinamento(
 
 
 async def listar_centros_treinamento(
-    db_session: DatabaseDependency
-) -> list[CentroTreinamentoOut]:
-    # Recupera todos os centros de treinamento
-    centros_treinamento_models = (
-        await db_session.execute(select(CentroTreinamentoModel))
-    ).scalars().all()
+    db_session: DatabaseDependency,
+    params: CursorParams
+) -> dict:
+    """Página em formato JSON, a mesma guardada no cache (ver contrib.serializacao)."""
+    # A versão da tabela (ETag) na chave: outro worker que já viu uma escrita não recebe uma página anterior a ela
+    versao = await ler_versao(db_session, CACHE_NAMESPACE)
+    chave = f'{CACHE_NAMESPACE}:pagina:{versao}:{params.cursor}:{params.size}:{params.total}'
+    if (pagina := await cache.get(chave)) is not None:
+        return pagina
+
+    # Requisições simultâneas pela mesma página (ex.: cache recém-invalidado) fazem uma só consulta
+    return await coalescencia.executar(db_session, chave, lambda: _carregar_pagina(db_session, params, chave))
+
+
+async def _carregar_pagina(db_session: DatabaseDependency, params: CursorParams, chave: str) -> dict:
+    # Recupera apenas a página solicitada e converte para a saída desejada
+    pagina = await paginar_por_cursor(
+        db_session,
+        select(CentroTreinamentoModel),
+        CentroTreinamentoModel.pk_id,
+        params,
+        # A listagem não tem filtros: o total é sempre o contador da tabela
+        contagem=lambda modo: contar_total(
+            db_session, modo, select(CentroTreinamentoModel), CentroTreinamentoModel.__tablename__,
+            exato=lambda: ler_contagem(db_session, CentroTreinamentoModel.__tablename__),
+        ),
+        transform=lambda modelo: projetar(CentroTreinamentoOut, modelo),
+    )
+    pagina = to_jsonable_python(pagina)
+    await cache.set(chave, pagina)
 
-    # Converte os dados para a saída desejada
-    return [
-        CentroTreinamentoOut.model_validate(model) for model in centros_treinamento_models
-    ]
+    return pagina
 
 
 async def buscar_centro_treinamento_por_id(
     db_session: DatabaseDependency, 
     id: UUID
-) -> CentroTreinamentoOut:
+) -> dict:
+    chave = f'{CACHE_NAMESPACE}:id:{await ler_versao(db_session, CACHE_NAMESPACE)}:{id}'
+    if (centro_treinamento := await cache.get(chave)) is not None:
+        return centro_treinamento
+
+    return await coalescencia.executar(db_session, chave, lambda: _carregar_centro_treinamento(db_session, id, chave))
+
+
+async def _carregar_centro_treinamento(db_session: DatabaseDependency, id: UUID, chave: str) -> dict:
     # Busca o centro de treinamento pelo ID
     centro_treinamento_model = (
         await db_session.execute(select(CentroTreinamentoModel).filter_by(id=id))
@@ -71,4 +112,33 @@ async def buscar_centro_treinamento_por_id(
         )
 
     # Converte o modelo SQLAlchemy para o esquema de saída
-    return CentroTreinamentoOut.model_validate(centro_treinamento_model)
\ No newline at end of file
+    centro_treinamento_out = to_jsonable_python(projetar(CentroTreinamentoOut, centro_treinamento_model))
+    await cache.set(chave, centro_treinamento_out)
+
+    return centro_treinamento_out
+
+
+async def pks_centros_treinamento_por_nome(
+    db_session: DatabaseDependency,
+    nomes: set[str]
+) -> dict[str, int]:
+    """Mapa nome -> pk_id dos centros existentes; só vai ao banco pelos nomes fora do cache."""
+    nomes = list(nomes)
+    pks = {
+        nome: pk_id
+        for nome, pk_id in zip(nomes, await cache.get_many([f'{CACHE_NAMESPACE}:nome:{nome}' for nome in nomes]))
+        if pk_id is not None
+    }
+
+    faltantes = set(nomes) - pks.keys()
+    if faltantes:
+        linhas = (await db_session.execute(
+            select(CentroTreinamentoModel.nome, CentroTreinamentoModel.pk_id)
+            .where(CentroTreinamentoModel.nome.in_(faltantes)))
+        ).tuples().all()
+
+        for nome, pk_id in linhas:
+            pks[nome] = pk_id
+            await cache.set(f'{CACHE_NAMESPACE}:nome:{nome}', pk_id)
+
+    return pks
\ No newline at end of file
@@ -1,16 +1,21 @@
 from uuid import UUID
-from fastapi import APIRouter, Body, Depends, status
-from fastapi_pagination import Page, paginate
+from fastapi import APIRouter, Body, Depends, Response, status
 from workout_api.centro_treinamento.schemas import CentroTreinamentoIn, CentroTreinamentoOut
+from workout_api.contrib.cache_http import CacheHttp
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.pagination import CursorPage, CursorParams
+from workout_api.contrib.serializacao import SerializacaoRapida
 
 from workout_api.centro_treinamento.centro_treinamento_crud import (
+    CACHE_NAMESPACE,
     criar_centro_treinamento,
     listar_centros_treinamento,
     buscar_centro_treinamento_por_id,
 )
 
 router = APIRouter()
+cache_http = CacheHttp(CACHE_NAMESPACE)
+responder = SerializacaoRapida('centros_treinamento')
 
 @router.post(
     '/', 
@@ -19,7 +24,7 @@ router = APIRouter()
     response_model=CentroTreinamentoOut,
 )
 async def post(
-    db_session: DatabaseDependency = Depends(), 
+    db_session: DatabaseDependency, 
     centro_treinamento_in: CentroTreinamentoIn = Body(...)
 ) -> CentroTreinamentoOut:
     return await criar_centro_treinamento(db_session, centro_treinamento_in)
@@ -29,23 +34,27 @@ async def post(
     '/', 
     summary='Consultar todos os centros de treinamento',
     status_code=status.HTTP_200_OK,
-    response_model=Page[CentroTreinamentoOut],
+    dependencies=[Depends(cache_http)],
+    response_model=CursorPage[CentroTreinamentoOut],
 )
 async def query(
-    db_session: DatabaseDependency = Depends(),
-) -> Page[CentroTreinamentoOut]:
-    centros_treinamento_out = await listar_centros_treinamento(db_session)
-    return paginate(centros_treinamento_out)
+    db_session: DatabaseDependency,
+    response: Response,
+    params: CursorParams = Depends(),
+) -> CursorPage[CentroTreinamentoOut]:
+    return responder(await listar_centros_treinamento(db_session, params), response)
 
 
 @router.get(
     '/{id}', 
     summary='Consulta um centro de treinamento pelo id',
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_http)],
     response_model=CentroTreinamentoOut,
 )
 async def get(
     id: UUID, 
-    db_session: DatabaseDependency = Depends(),
+    db_session: DatabaseDependency,
+    response: Response,
 ) -> CentroTreinamentoOut:
-    return await buscar_centro_treinamento_por_id(db_session, id)
\ No newline at end of file
+    return responder(await buscar_centro_treinamento_por_id(db_session, id), response)
\ No newline at end of file
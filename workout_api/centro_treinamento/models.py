@@ -1,7 +1,10 @@
+from typing import TYPE_CHECKING
 from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from workout_api.contrib.models import BaseModel
-from workout_api.atleta.models import AtletaModel
+
+if TYPE_CHECKING:
+    from workout_api.atleta.models import AtletaModel
 
 
 class CentroTreinamentoModel(BaseModel):
@@ -1,15 +1,197 @@
-from typing import AsyncGenerator
+import itertools
+import math
+import time
+import unicodedata
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 from workout_api.configs.settings import settings
 
 
-engine = create_async_engine(settings.DB_URL, echo=False)
+def engine_kwargs(url: str) -> dict:
+    kwargs = {'echo': False, 'pool_pre_ping': settings.DB_POOL_PRE_PING}
+    url = make_url(url)
+
+    # O SQLite usa NullPool/StaticPool, que não aceitam parâmetros de dimensionamento
+    if url.get_backend_name() == 'sqlite':
+        return kwargs
+
+    kwargs.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
+    if url.get_driver_name() == 'asyncpg':
+        connect_args = {
+            'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+            'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+        }
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            connect_args['server_settings'] = {'statement_timeout': str(settings.DB_STATEMENT_TIMEOUT_MS)}
+        kwargs['connect_args'] = connect_args
+
+    return kwargs
+
+
+def sem_acentos(texto: Optional[str]) -> Optional[str]:
+    """Minúsculas sem acentos: a f_unaccent(lower(...)) do Postgres, registrada também no SQLite."""
+    if texto is None:
+        return None
+    return ''.join(c for c in unicodedata.normalize('NFKD', texto) if not unicodedata.combining(c)).lower()
+
+
+def _configurar_sqlite(engine: AsyncEngine) -> None:
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine.sync_engine, 'connect')
+    def _conectar(dbapi_connection, connection_record) -> None:
+        # Com WAL, leituras longas (ex.: exportação em um job) não bloqueiam as escritas
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.close()
+        # O lower() do SQLite só conhece ASCII: a função já devolve o texto em minúsculas
+        dbapi_connection.create_function('f_unaccent', 1, sem_acentos, deterministic=True)
+
+
+engine = create_async_engine(settings.DB_URL, **engine_kwargs(settings.DB_URL))
+_configurar_sqlite(engine)
+
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
-async def get_session() -> AsyncGenerator:
+
+class EscritaEmReplica(RuntimeError):
+    """Tentativa de escrita por uma sessão ligada a uma réplica de leitura."""
+
+
+class SessaoSomenteLeitura(Session):
+    """Sessão das réplicas: recusa INSERT/UPDATE/DELETE e flush antes que cheguem ao banco."""
+
+
+@event.listens_for(SessaoSomenteLeitura, 'do_orm_execute')
+def _recusar_dml(estado) -> None:
+    if estado.is_insert or estado.is_update or estado.is_delete:
+        raise EscritaEmReplica('Sessões de leitura (réplicas) não executam escritas.')
+
+
+@event.listens_for(SessaoSomenteLeitura, 'before_flush')
+def _recusar_flush(session, flush_context, instances) -> None:
+    raise EscritaEmReplica('Sessões de leitura (réplicas) não executam escritas.')
+
+
+def _engine_replica(url: str) -> AsyncEngine:
+    replica = create_async_engine(url, **engine_kwargs(url))
+    _configurar_sqlite(replica)
+    if replica.dialect.name == 'postgresql':
+        # Transações READ ONLY: o próprio servidor recusa escritas que escapem das verificações da sessão
+        replica = replica.execution_options(postgresql_readonly=True)
+    return replica
+
+
+class RoteadorLeitura:
+    """
+    Escolhe a réplica de cada sessão de leitura: 'round_robin' alterna entre elas e
+    'least_connections' prefere a que tem menos sessões abertas neste processo.
+    """
+
+    def __init__(self, urls: list[str], estrategia: str):
+        self.engines = [_engine_replica(url) for url in urls]
+        self.estrategia = estrategia
+        self.em_uso = [0] * len(self.engines)
+        self._proxima = itertools.cycle(range(len(self.engines)))
+
+    def escolher(self) -> int:
+        if self.estrategia == 'least_connections':
+            return min(range(len(self.engines)), key=self.em_uso.__getitem__)
+        return next(self._proxima)
+
+    @asynccontextmanager
+    async def sessao(self) -> AsyncIterator[AsyncSession]:
+        indice = self.escolher()
+        self.em_uso[indice] += 1
+        try:
+            async with AsyncSession(
+                self.engines[indice], sync_session_class=SessaoSomenteLeitura, expire_on_commit=False
+            ) as session:
+                yield session
+        finally:
+            self.em_uso[indice] -= 1
+
+
+roteador = RoteadorLeitura(settings.DB_REPLICA_URLS, settings.DB_REPLICA_STRATEGY) if settings.DB_REPLICA_URLS else None
+
+METODOS_LEITURA = ('GET', 'HEAD')
+
+# Cookie com o instante (ms desde a época) da última escrita do cliente
+COOKIE_ESCRITA = 'escrita_em'
+
+
+def _agora_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def _escreveu_recentemente(request: Request) -> bool:
+    try:
+        escrita_em = int(request.cookies.get(COOKIE_ESCRITA, ''))
+    except ValueError:
+        return False
+    return 0 <= _agora_ms() - escrita_em < settings.DB_READ_YOUR_WRITES_SECONDS * 1000
+
+
+async def get_session(request: Request, response: Response) -> AsyncGenerator:
+    """
+    Sessão do banco para a requisição. Sem réplicas configuradas, sempre o primário.
+    Com réplicas, GET/HEAD usam uma réplica (somente leitura), exceto durante
+    DB_READ_YOUR_WRITES_SECONDS após uma escrita do mesmo cliente, para que ele veja
+    as próprias alterações mesmo com atraso de replicação.
+
+    O instante da escrita volta ao cliente no cookie `escrita_em`: vale em qualquer worker,
+    sem estado no servidor. Forjá-lo só leva as leituras do próprio cliente ao primário.
+    """
+    if roteador is not None:
+        if request.method not in METODOS_LEITURA:
+            # Marcado antes da escrita: a janela cobre a resposta e as leituras logo em seguida
+            response.set_cookie(
+                COOKIE_ESCRITA,
+                str(_agora_ms()),
+                max_age=math.ceil(settings.DB_READ_YOUR_WRITES_SECONDS),
+                httponly=True,
+                samesite='lax',
+            )
+        elif not _escreveu_recentemente(request):
+            async with roteador.sessao() as session:
+                yield session
+            return
+
     async with async_session() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+def dialeto(db_session: AsyncSession) -> str:
+    # Nome do dialeto do banco ligado à sessão ('postgresql', 'sqlite', ...)
+    return db_session.get_bind().dialect.name
+
+
+def estado_pool(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    estado = {'classe': type(pool).__name__}
+
+    # Só os pools com fila (QueuePool) expõem contadores de conexões
+    if hasattr(pool, 'checkedout'):
+        estado.update(
+            tamanho=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+
+    return estado
\ No newline at end of file
@@ -0,0 +1,262 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.routing import Match
+
+from workout_api.configs.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Balde de fichas: (chave, capacidade, fichas repostas por segundo)
+Balde = tuple[str, float, float]
+
+MAX_BALDES_MEMORIA = 100_000
+
+
+def identificar_cliente(cabecalhos: Headers, endereco: Optional[tuple]) -> str:
+    """
+    A API key, quando registrada em RATE_LIMIT_API_KEYS, ou o IP do cliente. Uma chave não
+    registrada não conta: trocá-la a cada requisição não pode render baldes novos.
+    """
+    chave = cabecalhos.get('x-api-key')
+    if chave and chave in settings.RATE_LIMIT_API_KEYS:
+        # O hash, e não a chave, vai para os nomes dos baldes (e para o Redis)
+        return f'chave:{hashlib.sha256(chave.encode()).hexdigest()[:16]}'
+    return f"ip:{endereco[0] if endereco else 'anonimo'}"
+
+
+class LimitesBackend(ABC):
+    """
+    Interface dos backends de token bucket. `consumir` retira uma ficha de cada balde somente
+    se todos tiverem ficha (do contrário nenhum é alterado) e devolve 0, ou os segundos até a
+    ficha que falta. Baldes ausentes começam cheios.
+    """
+
+    @abstractmethod
+    async def consumir(self, baldes: list[Balde]) -> float:
+        ...
+
+
+class LimitesMemoria(LimitesBackend):
+    """
+    Baldes locais ao processo. Com vários workers cada um aplica os limites sozinho, e o
+    cliente alcança até N vezes a taxa configurada; use RATE_LIMIT_BACKEND='redis'.
+    """
+    nome = 'memory'
+
+    def __init__(self, max_baldes: int = MAX_BALDES_MEMORIA):
+        self.max_baldes = max_baldes
+        # chave -> (fichas, instante da última atualização)
+        self._baldes: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consumir(self, baldes: list[Balde]) -> float:
+        agora = time.monotonic()
+        fichas = []
+        espera = 0.0
+        for chave, capacidade, taxa in baldes:
+            disponiveis, instante = self._baldes.get(chave, (capacidade, agora))
+            disponiveis = min(capacidade, disponiveis + (agora - instante) * taxa)
+            fichas.append(disponiveis)
+            if disponiveis < 1:
+                espera = max(espera, (1 - disponiveis) / taxa)
+        if espera:
+            return espera
+
+        for (chave, _, _), disponiveis in zip(baldes, fichas):
+            self._baldes[chave] = (disponiveis - 1, agora)
+            self._baldes.move_to_end(chave)
+        while len(self._baldes) > self.max_baldes:
+            # Descartar o balde menos recente só devolve as fichas desse cliente
+            self._baldes.popitem(last=False)
+        return 0.0
+
+
+class LimitesRedis(LimitesBackend):
+    """
+    Baldes compartilhados entre workers em um servidor compatível com Redis (Redis, Valkey,
+    KeyDB). Um script Lua confere e consome todos os baldes da requisição de forma atômica,
+    com o relógio do servidor; as chaves expiram quando o balde estaria cheio de novo.
+    """
+    nome = 'redis'
+
+    SCRIPT = (
+        "local t = redis.call('TIME') "
+        "local agora = tonumber(t[1]) + tonumber(t[2]) / 1000000 "
+        "local fichas, espera = {}, 0 "
+        "for i, chave in ipairs(KEYS) do "
+        "  local capacidade, taxa = tonumber(ARGV[2 * i - 1]), tonumber(ARGV[2 * i]) "
+        "  local estado = redis.call('HMGET', chave, 'f', 't') "
+        "  local f = tonumber(estado[1]) or capacidade "
+        "  local anterior = tonumber(estado[2]) or agora "
+        "  f = math.min(capacidade, f + math.max(agora - anterior, 0) * taxa) "
+        "  fichas[i] = f "
+        "  if f < 1 then espera = math.max(espera, (1 - f) / taxa) end "
+        "end "
+        "if espera > 0 then return tostring(espera) end "
+        "for i, chave in ipairs(KEYS) do "
+        "  local capacidade, taxa = tonumber(ARGV[2 * i - 1]), tonumber(ARGV[2 * i]) "
+        "  redis.call('HSET', chave, 'f', tostring(fichas[i] - 1), 't', tostring(agora)) "
+        "  redis.call('PEXPIRE', chave, math.ceil(capacidade / taxa * 1000) + 1000) "
+        "end "
+        "return '0'"
+    )
+
+    def __init__(self, url: Optional[str] = None, client=None):
+        if client is None:
+            try:
+                from redis import asyncio as redis
+            except ImportError as erro:
+                raise RuntimeError("RATE_LIMIT_BACKEND='redis' requer o pacote `redis` instalado.") from erro
+            client = redis.from_url(url)
+        self.client = client
+        self._consumir = client.register_script(self.SCRIPT)
+
+    async def consumir(self, baldes: list[Balde]) -> float:
+        argumentos = [valor for _, capacidade, taxa in baldes for valor in (capacidade, taxa)]
+        return float(await self._consumir(keys=[chave for chave, _, _ in baldes], args=argumentos))
+
+
+class LimiteConcorrencia:
+    """
+    Teto de requisições em andamento no processo. Acima dele, até `fila` requisições aguardam
+    uma vaga por no máximo `espera` segundos; as demais são recusadas na hora.
+    """
+
+    def __init__(self, maximo: int, fila: int, espera: float):
+        self.maximo = maximo
+        self.fila = fila
+        self.espera = espera
+        self.em_andamento = 0
+        self.aguardando = 0
+        self._semaforo = asyncio.Semaphore(maximo)
+
+    async def entrar(self) -> bool:
+        if not self._semaforo.locked():
+            await self._semaforo.acquire()
+        elif self.aguardando >= self.fila or self.espera <= 0:
+            return False
+        else:
+            self.aguardando += 1
+            try:
+                await asyncio.wait_for(self._semaforo.acquire(), self.espera)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                self.aguardando -= 1
+        self.em_andamento += 1
+        return True
+
+    def sair(self) -> None:
+        self.em_andamento -= 1
+        self._semaforo.release()
+
+
+def criar_limites() -> Optional[LimitesBackend]:
+    if not settings.RATE_LIMIT_ENABLED:
+        return None
+    if settings.RATE_LIMIT_BACKEND == 'redis':
+        return LimitesRedis(settings.REDIS_URL)
+    return LimitesMemoria()
+
+
+def criar_concorrencia() -> Optional[LimiteConcorrencia]:
+    # Sem valor explícito, o teto é o máximo de conexões do pool do processo
+    maximo = settings.MAX_IN_FLIGHT
+    if maximo is None:
+        maximo = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    if maximo <= 0:
+        return None
+    return LimiteConcorrencia(maximo, settings.MAX_IN_FLIGHT_QUEUE, settings.MAX_IN_FLIGHT_WAIT_SECONDS)
+
+
+limites = criar_limites()
+concorrencia = criar_concorrencia()
+# Requisições recusadas, por motivo ('limite': 429, 'sobrecarga': 503)
+recusadas = {'limite': 0, 'sobrecarga': 0}
+
+
+class AdmissaoMiddleware:
+    """
+    Middleware ASGI de controle de admissão, antes de qualquer trabalho da rota:
+
+    - token buckets por cliente (X-API-Key registrada ou IP) e, para as rotas de RATE_LIMIT_ROUTES, por
+      cliente e rota; sem ficha, 429 com Retry-After;
+    - teto de requisições em andamento ligado ao pool do banco (MAX_IN_FLIGHT); com ele e a
+      fila de espera cheios, 503 com Retry-After.
+
+    Os caminhos de RATE_LIMIT_EXEMPT_PATHS (health checks, métricas) não passam por nenhum dos dois.
+    Uma falha do backend dos baldes deixa a requisição passar: o limite protege a API, não a derruba.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.capacidade = max(1.0, settings.RATE_LIMIT_RPS * settings.RATE_LIMIT_BURST_SECONDS)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'].startswith(tuple(settings.RATE_LIMIT_EXEMPT_PATHS)):
+            await self.app(scope, receive, send)
+            return
+
+        if limites is not None:
+            espera = await self._consumir(scope)
+            if espera:
+                recusadas['limite'] += 1
+                await _recusar(scope, receive, send, 429, 'Limite de requisições excedido.', espera)
+                return
+
+        if concorrencia is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await concorrencia.entrar():
+            recusadas['sobrecarga'] += 1
+            await _recusar(
+                scope, receive, send, 503, 'Servidor sobrecarregado.', settings.MAX_IN_FLIGHT_WAIT_SECONDS
+            )
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            concorrencia.sair()
+
+    async def _consumir(self, scope) -> float:
+        cliente = identificar_cliente(Headers(scope=scope), scope.get('client'))
+        # A hash tag {cliente} mantém os baldes do cliente no mesmo slot de um Redis Cluster
+        baldes = [(f'limite:{{{cliente}}}', self.capacidade, settings.RATE_LIMIT_RPS)]
+        rota = self._rota(scope)
+        if rota is not None:
+            chave, taxa = rota
+            baldes.append((f'limite:{{{cliente}}}:{chave}', max(1.0, taxa * settings.RATE_LIMIT_BURST_SECONDS), taxa))
+
+        try:
+            return await limites.consumir(baldes)
+        except Exception:
+            logger.warning('Falha no backend de rate limit; requisição admitida', exc_info=True)
+            return 0.0
+
+    def _rota(self, scope) -> Optional[tuple[str, float]]:
+        if not settings.RATE_LIMIT_ROUTES:
+            return None
+        # Mesma ordem do roteamento: vale a primeira rota que atende o caminho e o método
+        for rota in scope['app'].router.routes:
+            correspondencia, _ = rota.matches(scope)
+            if correspondencia == Match.FULL:
+                chave = f"{scope['method']} {rota.path}"
+                taxa = settings.RATE_LIMIT_ROUTES.get(chave)
+                return None if taxa is None else (chave, taxa)
+        return None
+
+
+async def _recusar(scope, receive, send, status_code: int, detalhe: str, espera: float) -> None:
+    resposta = JSONResponse(
+        {'detail': detalhe}, status_code=status_code, headers={'Retry-After': str(max(1, math.ceil(espera)))}
+    )
+    await resposta(scope, receive, send)
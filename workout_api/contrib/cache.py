@@ -0,0 +1,143 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+from workout_api.configs.settings import settings
+
+
+class CacheBackend(ABC):
+    """
+    Interface dos backends de cache. Os valores precisam ser serializáveis em JSON
+    (dicts, listas, números, strings), para que os backends sejam intercambiáveis.
+    As chaves seguem o formato '<namespace>:<...>', permitindo invalidar um namespace inteiro.
+    Um backend incompleto falha ao ser instanciado, não no primeiro uso.
+    """
+    nome: str
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, chave: str) -> Optional[Any]:
+        valor = await self._get(chave)
+        if valor is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return valor
+
+    async def get_many(self, chaves: list[str]) -> list[Optional[Any]]:
+        valores = await self._get_many(chaves)
+        encontrados = sum(1 for valor in valores if valor is not None)
+        self.hits += encontrados
+        self.misses += len(valores) - encontrados
+        return valores
+
+    async def set(self, chave: str, valor: Any, ttl: Optional[float] = None) -> None:
+        await self._set(chave, valor, self.ttl if ttl is None else ttl)
+
+    @abstractmethod
+    async def invalidar(self, namespace: str) -> None:
+        ...
+
+    @abstractmethod
+    async def _get(self, chave: str) -> Optional[Any]:
+        ...
+
+    async def _get_many(self, chaves: list[str]) -> list[Optional[Any]]:
+        return [await self._get(chave) for chave in chaves]
+
+    @abstractmethod
+    async def _set(self, chave: str, valor: Any, ttl: float) -> None:
+        ...
+
+    def estatisticas(self) -> dict:
+        return {'backend': self.nome, 'hits': self.hits, 'misses': self.misses}
+
+
+class MemoryCache(CacheBackend):
+    """
+    Cache LRU com TTL, local ao processo. Com vários workers, cada um tem o seu:
+    a invalidação só alcança o worker que fez a escrita, e o TTL limita o tempo
+    em que os demais podem servir dados antigos.
+    """
+    nome = 'memory'
+
+    def __init__(self, ttl: float, max_itens: int):
+        super().__init__(ttl)
+        self.max_itens = max_itens
+        self.evictions = 0
+        self._itens: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def _get(self, chave: str) -> Optional[Any]:
+        item = self._itens.get(chave)
+        if item is None:
+            return None
+
+        expira_em, valor = item
+        if expira_em < time.monotonic():
+            del self._itens[chave]
+            return None
+
+        self._itens.move_to_end(chave)
+        return valor
+
+    async def _set(self, chave: str, valor: Any, ttl: float) -> None:
+        self._itens[chave] = (time.monotonic() + ttl, valor)
+        self._itens.move_to_end(chave)
+
+        while len(self._itens) > self.max_itens:
+            self._itens.popitem(last=False)
+            self.evictions += 1
+
+    async def invalidar(self, namespace: str) -> None:
+        prefixo = f'{namespace}:'
+        for chave in [chave for chave in self._itens if chave.startswith(prefixo)]:
+            del self._itens[chave]
+
+    def estatisticas(self) -> dict:
+        return {**super().estatisticas(), 'itens': len(self._itens), 'evictions': self.evictions}
+
+
+class RedisCache(CacheBackend):
+    """Cache compartilhado entre workers; a invalidação vale para todos os processos."""
+    nome = 'redis'
+
+    def __init__(self, ttl: float, url: Optional[str] = None, client=None):
+        super().__init__(ttl)
+        if client is None:
+            try:
+                from redis import asyncio as redis
+            except ImportError as erro:
+                raise RuntimeError("CACHE_BACKEND='redis' requer o pacote `redis` instalado.") from erro
+            client = redis.from_url(url)
+        self.client = client
+
+    async def _get(self, chave: str) -> Optional[Any]:
+        valor = await self.client.get(chave)
+        return None if valor is None else json.loads(valor)
+
+    async def _get_many(self, chaves: list[str]) -> list[Optional[Any]]:
+        if not chaves:
+            return []
+        return [None if valor is None else json.loads(valor) for valor in await self.client.mget(chaves)]
+
+    async def _set(self, chave: str, valor: Any, ttl: float) -> None:
+        await self.client.set(chave, json.dumps(valor), px=int(ttl * 1000))
+
+    async def invalidar(self, namespace: str) -> None:
+        chaves = [chave async for chave in self.client.scan_iter(match=f'{namespace}:*', count=500)]
+        if chaves:
+            await self.client.delete(*chaves)
+
+
+def criar_cache() -> CacheBackend:
+    if settings.CACHE_BACKEND == 'redis':
+        return RedisCache(settings.CACHE_TTL, settings.REDIS_URL)
+    return MemoryCache(settings.CACHE_TTL, settings.CACHE_MAX_ITENS)
+
+
+cache = criar_cache()
@@ -0,0 +1,38 @@
+from fastapi import HTTPException, Request, Response, status
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.contagem import ler_versao
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.etag import formatar_etag, ler_etags
+
+
+class CacheHttp:
+    """
+    Dependência de GETs cujo conteúdo só muda com escritas na tabela `tabela`.
+
+    O ETag (forte) é a versão da tabela em `contagens`, avançada na mesma transação de cada
+    escrita (ver contrib.contagem.ajustar_contagem) e guardada no cache depois do commit: o
+    If-None-Match é respondido com 304 antes da consulta da rota e, com a versão no cache, sem
+    usar uma conexão do banco. O CRUD usa a mesma versão nas chaves do cache de dados, para que
+    o corpo corresponda ao ETag.
+    Não há Last-Modified: datas HTTP têm resolução de segundos, e uma escrita no mesmo segundo
+    de uma leitura não mudaria a resposta a If-Modified-Since.
+    """
+
+    def __init__(self, tabela: str):
+        self.tabela = tabela
+
+    async def __call__(self, request: Request, response: Response, db_session: DatabaseDependency) -> None:
+        versao = await ler_versao(db_session, self.tabela)
+        cabecalhos = {
+            'ETag': formatar_etag(versao),
+            'Cache-Control': f'public, max-age={settings.HTTP_CACHE_MAX_AGE}',
+        }
+
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            etags = ler_etags(if_none_match)
+            if '*' in etags or str(versao) in etags:
+                raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=cabecalhos)
+
+        response.headers.update(cabecalhos)
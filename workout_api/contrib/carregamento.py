@@ -0,0 +1,46 @@
+import asyncio
+import importlib
+from typing import Callable, Optional
+
+from fastapi import FastAPI
+
+
+class CarregamentoTardio:
+    """
+    Registro tardio dos routers (LAZY_ROUTERS): os módulos pesados (controllers, CRUDs,
+    modelos, SQLAlchemy) são importados em uma thread depois que o servidor sobe, e as
+    requisições que chegarem antes disso aguardam o fim do carregamento.
+    """
+
+    def __init__(self, modulo: str, registrar: Callable[[FastAPI], None]):
+        self.modulo = modulo
+        self.registrar = registrar
+        self._tarefa: Optional[asyncio.Task] = None
+
+    def iniciar(self, app: FastAPI) -> asyncio.Task:
+        if self._tarefa is None:
+            self._tarefa = asyncio.create_task(self._carregar(app))
+        return self._tarefa
+
+    async def _carregar(self, app: FastAPI) -> None:
+        # A importação roda fora do event loop; só o registro das rotas, já barato, roda nele
+        await asyncio.to_thread(importlib.import_module, self.modulo)
+        self.registrar(app)
+        # O OpenAPI gerado antes do carregamento não teria as rotas
+        app.openapi_schema = None
+
+    async def aguardar(self, app: FastAPI) -> None:
+        await asyncio.shield(self.iniciar(app))
+
+
+class AguardarCarregamento:
+    """Middleware ASGI que segura as requisições até os routers estarem registrados."""
+
+    def __init__(self, app, carregamento: CarregamentoTardio):
+        self.app = app
+        self.carregamento = carregamento
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] in ('http', 'websocket'):
+            await self.carregamento.aguardar(scope['app'])
+        await self.app(scope, receive, send)
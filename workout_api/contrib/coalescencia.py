@@ -0,0 +1,80 @@
+import asyncio
+from collections import defaultdict
+from typing import Awaitable, Callable, TypeVar
+
+from workout_api.configs.database import SessaoSomenteLeitura
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import DatabaseDependency
+
+T = TypeVar('T')
+
+
+class Coalescencia:
+    """
+    Single-flight das leituras: chamadas concorrentes com a mesma chave compartilham uma única
+    execução (uma única ida ao banco, com a sessão de quem chegou primeiro), e o resultado ou
+    a exceção é entregue a todas. O resultado é compartilhado: quem o recebe não o altera.
+
+    As chaves seguem o formato '<namespace>:<...>' do cache. Leituras em réplica e no primário
+    não se misturam, e `esquecer` (chamado após as escritas) faz as leituras seguintes irem ao
+    banco de novo em vez de aguardar uma consulta iniciada antes da escrita.
+    """
+
+    def __init__(self):
+        self._em_andamento: dict[str, asyncio.Future] = {}
+        # Por namespace: execuções de fato e chamadas que aguardaram a execução de outra
+        self.executadas: dict[str, int] = defaultdict(int)
+        self.coalescidas: dict[str, int] = defaultdict(int)
+
+    async def executar(self, db_session: DatabaseDependency, chave: str, funcao: Callable[[], Awaitable[T]]) -> T:
+        if not settings.READ_COALESCING_ENABLED:
+            return await funcao()
+
+        if isinstance(db_session.sync_session, SessaoSomenteLeitura):
+            chave = f'{chave}:replica'
+        namespace = chave.split(':', 1)[0]
+
+        while (futuro := self._em_andamento.get(chave)) is not None:
+            try:
+                resultado = await asyncio.shield(futuro)
+            except asyncio.CancelledError:
+                if not futuro.cancelled():
+                    raise
+                # A execução foi cancelada com a requisição que a iniciou: outra chamada assume
+                continue
+            except Exception:
+                self.coalescidas[namespace] += 1
+                raise
+            self.coalescidas[namespace] += 1
+            return resultado
+
+        futuro = asyncio.get_running_loop().create_future()
+        self._em_andamento[chave] = futuro
+        self.executadas[namespace] += 1
+        try:
+            resultado = await funcao()
+        except asyncio.CancelledError:
+            futuro.cancel()
+            raise
+        except Exception as erro:
+            futuro.set_exception(erro)
+            # Marca a exceção como lida: sem chamadas aguardando, o asyncio a registraria no log
+            futuro.exception()
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            if self._em_andamento.get(chave) is futuro:
+                del self._em_andamento[chave]
+
+    def esquecer(self, namespace: str) -> None:
+        prefixo = f'{namespace}:'
+        for chave in [chave for chave in self._em_andamento if chave.startswith(prefixo)]:
+            del self._em_andamento[chave]
+
+    def estatisticas(self) -> dict:
+        return {'executadas': dict(self.executadas), 'coalescidas': dict(self.coalescidas)}
+
+
+coalescencia = Coalescencia()
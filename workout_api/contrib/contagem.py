@@ -0,0 +1,144 @@
+import json
+import time
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import Table, delete, func, insert, literal, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql import Select
+
+from workout_api.configs.database import dialeto
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import cache
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.models import ContagemModel
+from workout_api.contrib.pagination import ModoTotal, contar
+
+CACHE_NAMESPACE = 'contagens'
+
+
+def _chave_versao(tabela: str) -> str:
+    # No namespace da tabela, o mesmo do cache de dados do CRUD: cache.invalidar(namespace) a descarta junto
+    return f'{tabela}:versao'
+
+
+async def ajustar_contagem(db_session: DatabaseDependency, tabela: str, delta: int) -> None:
+    """
+    Soma `delta` ao contador de `tabela` (criando-o se preciso) e avança a versão da tabela,
+    que muda o ETag das suas respostas (ver contrib.cache_http). Não confirma a transação:
+    ambos só valem, para todos os workers, junto com a escrita; a nova versão vai para o
+    cache em publicar_versoes, depois do commit.
+    """
+    postgres = dialeto(db_session) == 'postgresql'
+    upsert = postgresql.insert if postgres else sqlite.insert
+    # max() com dois argumentos é o maior deles no SQLite
+    maior = func.greatest if postgres else func.max
+    contagens = ContagemModel.__table__
+    comando = upsert(contagens).values(tabela=tabela, quantidade=delta, versao=time.time_ns() // 1_000_000)
+    versao = (await db_session.execute(comando.on_conflict_do_update(
+        index_elements=['tabela'],
+        set_={
+            'quantidade': contagens.c.quantidade + comando.excluded.quantidade,
+            'versao': maior(comando.excluded.versao, contagens.c.versao + 1),
+        },
+    ).returning(contagens.c.versao))).scalar_one()
+    db_session.info.setdefault('versoes', {})[tabela] = versao
+    db_session.info.setdefault('versoes_alteradas', set()).add(tabela)
+
+
+async def publicar_versoes(db_session: DatabaseDependency) -> None:
+    """
+    Grava no cache as versões avançadas por ajustar_contagem. Chamada depois do commit: antes
+    dele, um leitor associaria a versão nova ao conteúdo antigo.
+    """
+    for tabela in db_session.info.pop('versoes_alteradas', ()):
+        await cache.set(_chave_versao(tabela), db_session.info['versoes'][tabela], ttl=settings.HTTP_CACHE_VERSION_TTL)
+
+
+async def ler_versao(db_session: DatabaseDependency, tabela: str) -> int:
+    """
+    Versão de `tabela`: lida uma vez por sessão (a dependência CacheHttp e o CRUD compartilham a
+    leitura) e, entre sessões, do cache; o banco só é consultado quando ela não está no cache.
+    """
+    versoes = db_session.info.setdefault('versoes', {})
+    if tabela not in versoes:
+        versao = await cache.get(_chave_versao(tabela))
+        if versao is None:
+            versao = (await db_session.execute(
+                select(ContagemModel.versao).where(ContagemModel.tabela == tabela))
+            ).scalar() or 0
+            await cache.set(_chave_versao(tabela), versao, ttl=settings.HTTP_CACHE_VERSION_TTL)
+        versoes[tabela] = versao
+    return versoes[tabela]
+
+
+async def ler_contagem(db_session: DatabaseDependency, tabela: str) -> int:
+    quantidade = (await db_session.execute(
+        select(ContagemModel.quantidade).where(ContagemModel.tabela == tabela))
+    ).scalar()
+    return quantidade or 0
+
+
+async def recalcular_contagem(conexao, tabela: Table) -> None:
+    """
+    Refaz o contador de `tabela` com um count(*) (sessão ou conexão; não confirma a transação).
+    Para cargas feitas fora da API.
+    """
+    await conexao.execute(delete(ContagemModel).where(ContagemModel.tabela == tabela.name))
+    await conexao.execute(
+        insert(ContagemModel.__table__).from_select(
+            ['tabela', 'quantidade', 'versao'],
+            select(literal(tabela.name), func.count(), literal(time.time_ns() // 1_000_000)).select_from(tabela),
+        )
+    )
+
+
+async def estimar_linhas(db_session: DatabaseDependency, query: Select) -> Optional[int]:
+    """
+    Linhas que o planejador do Postgres espera para `query` (EXPLAIN, sem executá-la), a partir
+    das estatísticas do ANALYZE. None nos demais bancos.
+    """
+    if dialeto(db_session) != 'postgresql':
+        return None
+    # Compilada com parâmetros nomeados, que o text() reconhece e repassa ao driver
+    compilada = query.order_by(None).limit(None).offset(None).compile(
+        dialect=postgresql.dialect(paramstyle='named'), compile_kwargs={'render_postcompile': True}
+    )
+    plano = (await db_session.execute(
+        text(f'EXPLAIN (FORMAT JSON) {compilada}').bindparams(**compilada.params)
+    )).scalar_one()
+    if isinstance(plano, str):
+        plano = json.loads(plano)
+    return int(plano[0]['Plan']['Plan Rows'])
+
+
+async def contar_total(
+    db_session: DatabaseDependency,
+    modo: ModoTotal,
+    query: Select,
+    chave: str,
+    exato: Optional[Callable[[], Awaitable[int]]] = None,
+) -> tuple[int, bool]:
+    """
+    Total de `query` no modo pedido pelo cliente, como (total, estimado):
+
+    - sem filtros (`exato` informado): o contador mantido nas escritas, sempre exato e barato,
+      em qualquer modo;
+    - 'exact': count(*) da consulta, guardado por COUNT_CACHE_TTL segundos para os 'estimate';
+    - 'estimate': o count(*) guardado, se ainda houver; senão a estimativa do planejador
+      (Postgres) ou, nos demais bancos, um count(*) que passa a ser guardado.
+
+    `chave` identifica a tabela e os filtros de `query` ('<tabela>:<filtros>').
+    """
+    if exato is not None:
+        return await exato(), False
+
+    chave = f'{CACHE_NAMESPACE}:{chave}'
+    if modo == 'estimate':
+        if (total := await cache.get(chave)) is not None:
+            return total, True
+        if (total := await estimar_linhas(db_session, query)) is not None:
+            return total, True
+
+    total = await contar(db_session, query)
+    await cache.set(chave, total, ttl=settings.COUNT_CACHE_TTL)
+    return total, False
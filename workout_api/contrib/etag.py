@@ -0,0 +1,25 @@
+from typing import Optional
+
+
+def formatar_etag(valor) -> str:
+    return f'"{valor}"'
+
+
+def ler_etags(cabecalho: Optional[str], fortes: bool = False) -> list[str]:
+    """
+    Valores de um cabeçalho If-Match/If-None-Match, sem aspas ('*' é mantido). Por padrão a
+    comparação é fraca e o prefixo W/ é descartado (If-None-Match); com `fortes` (If-Match,
+    RFC 7232) os ETags fracos mantêm o prefixo e, assim, não correspondem a nenhuma versão.
+    """
+    if not cabecalho:
+        return []
+
+    etags = []
+    for parte in cabecalho.split(','):
+        parte = parte.strip()
+        fraco = parte.startswith('W/')
+        if fraco:
+            parte = parte[2:]
+        parte = parte.strip('"')
+        etags.append(f'W/{parte}' if fraco and fortes else parte)
+    return etags
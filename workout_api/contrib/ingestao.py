@@ -0,0 +1,109 @@
+import csv
+import json
+from typing import AsyncIterator, TypeVar
+
+T = TypeVar('T')
+
+
+class LinhaInvalida(ValueError):
+    """Linha do arquivo que não pôde ser decodificada (UTF-8, JSON ou CSV malformado)."""
+
+
+async def ler_linhas(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    # Separa as linhas nos próprios bytes, sem acumular o corpo inteiro em memória: o byte
+    # '\n' nunca faz parte de um caractere multibyte em UTF-8, e cada linha é decodificada à parte
+    resto = b''
+
+    async for chunk in stream:
+        resto += chunk
+        *linhas, resto = resto.split(b'\n')
+        for linha in linhas:
+            yield linha.rstrip(b'\r')
+
+    if resto.strip():
+        yield resto.rstrip(b'\r')
+
+
+def _decodificar(linha: bytes) -> str | LinhaInvalida:
+    try:
+        return linha.decode('utf-8')
+    except UnicodeDecodeError as erro:
+        return LinhaInvalida(f'A linha não é UTF-8 válido (byte {erro.start + 1}).')
+
+
+async def ler_ndjson(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict | LinhaInvalida]]:
+    """Gera (número da linha, objeto) para cada linha não vazia de um corpo NDJSON."""
+    numero = 0
+    async for linha in ler_linhas(stream):
+        numero += 1
+        if not linha.strip():
+            continue
+
+        linha = _decodificar(linha)
+        if isinstance(linha, LinhaInvalida):
+            yield numero, linha
+            continue
+
+        try:
+            objeto = json.loads(linha)
+        except ValueError as erro:
+            yield numero, LinhaInvalida(f'JSON inválido: {erro}')
+            continue
+
+        if not isinstance(objeto, dict):
+            yield numero, LinhaInvalida('Cada linha deve conter um objeto JSON.')
+        else:
+            yield numero, objeto
+
+
+async def ler_csv(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict | LinhaInvalida]]:
+    """
+    Gera (número da linha, dicionário) a partir de um CSV com cabeçalho.
+    Cada registro deve ocupar uma única linha (sem quebras de linha dentro de aspas).
+    """
+    cabecalho = None
+    numero = 0
+    async for linha in ler_linhas(stream):
+        numero += 1
+        if not linha.strip():
+            continue
+
+        if cabecalho is None:
+            # Colunas com bytes inválidos não correspondem a nenhum campo: falham na validação das linhas
+            valores = next(csv.reader([linha.decode('utf-8', errors='replace')]))
+            cabecalho = [coluna.strip() for coluna in valores]
+            continue
+
+        linha = _decodificar(linha)
+        if isinstance(linha, LinhaInvalida):
+            yield numero, linha
+            continue
+
+        valores = next(csv.reader([linha]))
+        if len(valores) != len(cabecalho):
+            yield numero, LinhaInvalida(
+                f'Esperadas {len(cabecalho)} colunas, encontradas {len(valores)}.'
+            )
+        else:
+            yield numero, dict(zip(cabecalho, valores))
+
+
+async def em_lotes(itens: AsyncIterator[T], tamanho: int) -> AsyncIterator[list[T]]:
+    lote = []
+    async for item in itens:
+        lote.append(item)
+        if len(lote) >= tamanho:
+            yield lote
+            lote = []
+
+    if lote:
+        yield lote
+
+
+async def pular(itens: AsyncIterator[T], quantidade: int) -> AsyncIterator[T]:
+    """Os itens de `itens` depois dos `quantidade` primeiros."""
+    async for item in itens:
+        if quantidade > 0:
+            quantidade -= 1
+            continue
+        yield item
@@ -0,0 +1,180 @@
+import bisect
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+BUCKETS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_STATEMENTS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histograma:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.contagens = [0] * (len(buckets) + 1)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, valor: float) -> None:
+        self.contagens[bisect.bisect_left(self.buckets, valor)] += 1
+        self.soma += valor
+        self.total += 1
+
+
+class EstatisticasRequisicao:
+    __slots__ = ('statements', 'tempo_db', 'linhas')
+
+    def __init__(self):
+        self.statements = 0
+        self.tempo_db = 0.0
+        self.linhas = 0
+
+
+class RegistroMetricas:
+    """Métricas agregadas do processo, por (método, rota), no formato texto do Prometheus."""
+
+    def __init__(self):
+        self.latencia: dict[tuple, Histograma] = {}
+        self.statements: dict[tuple, Histograma] = {}
+        self.tempo_db: dict[tuple, float] = {}
+        self.linhas: dict[tuple, int] = {}
+        self.overhead = 0.0
+
+    def registrar(self, metodo: str, rota: str, status: int, duracao: float, estatisticas: EstatisticasRequisicao):
+        chave = (metodo, rota)
+        self.latencia.setdefault((metodo, rota, str(status)), Histograma(BUCKETS_LATENCIA)).observar(duracao)
+        self.statements.setdefault(chave, Histograma(BUCKETS_STATEMENTS)).observar(estatisticas.statements)
+        self.tempo_db[chave] = self.tempo_db.get(chave, 0.0) + estatisticas.tempo_db
+        self.linhas[chave] = self.linhas.get(chave, 0) + estatisticas.linhas
+
+    def renderizar(self, extras: Optional[list[tuple[str, str, dict, float]]] = None) -> str:
+        linhas = []
+        self._histograma(
+            linhas, 'workout_api_http_request_duration_seconds', 'Latência das requisições HTTP',
+            ('method', 'route', 'status'), self.latencia
+        )
+        self._histograma(
+            linhas, 'workout_api_db_statements_per_request', 'Comandos SQL executados por requisição',
+            ('method', 'route'), self.statements
+        )
+        self._contador(
+            linhas, 'workout_api_db_time_seconds_total', 'Tempo gasto em comandos SQL',
+            ('method', 'route'), self.tempo_db
+        )
+        self._contador(
+            linhas, 'workout_api_db_rows_total', 'Linhas retornadas ou afetadas pelos comandos SQL',
+            ('method', 'route'), self.linhas
+        )
+        self._contador(
+            linhas, 'workout_api_metrics_overhead_seconds_total', 'Tempo gasto pela própria instrumentação',
+            (), {(): self.overhead}
+        )
+
+        anterior = None
+        for nome, tipo, rotulos, valor in extras or []:
+            # Séries da mesma métrica (rótulos diferentes) vêm em sequência, sob um único TYPE
+            if nome != anterior:
+                linhas.append(f'# TYPE {nome} {tipo}')
+                anterior = nome
+            linhas.append(f'{nome}{_rotulos(rotulos)} {valor}')
+
+        return '\n'.join(linhas) + '\n'
+
+    @staticmethod
+    def _histograma(linhas: list, nome: str, ajuda: str, rotulos: tuple, series: dict) -> None:
+        linhas.append(f'# HELP {nome} {ajuda}')
+        linhas.append(f'# TYPE {nome} histogram')
+        for valores, histograma in series.items():
+            base = dict(zip(rotulos, valores))
+            acumulado = 0
+            for limite, contagem in zip(histograma.buckets, histograma.contagens):
+                acumulado += contagem
+                linhas.append(f'{nome}_bucket{_rotulos({**base, "le": limite})} {acumulado}')
+            linhas.append(f'{nome}_bucket{_rotulos({**base, "le": "+Inf"})} {histograma.total}')
+            linhas.append(f'{nome}_sum{_rotulos(base)} {histograma.soma}')
+            linhas.append(f'{nome}_count{_rotulos(base)} {histograma.total}')
+
+    @staticmethod
+    def _contador(linhas: list, nome: str, ajuda: str, rotulos: tuple, series: dict) -> None:
+        linhas.append(f'# HELP {nome} {ajuda}')
+        linhas.append(f'# TYPE {nome} counter')
+        for valores, valor in series.items():
+            linhas.append(f'{nome}{_rotulos(dict(zip(rotulos, valores)))} {valor}')
+
+
+def _escapar(valor) -> str:
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _rotulos(rotulos: dict) -> str:
+    if not rotulos:
+        return ''
+    return '{' + ','.join(f'{chave}="{_escapar(valor)}"' for chave, valor in rotulos.items()) + '}'
+
+
+registro = RegistroMetricas()
+_requisicao_atual: ContextVar[Optional[EstatisticasRequisicao]] = ContextVar('requisicao_atual', default=None)
+
+
+def instrumentar_engine(engine: 'AsyncEngine') -> None:
+    """Soma, na requisição corrente, cada comando SQL executado pela engine."""
+    # Importado aqui: o middleware é montado antes de o SQLAlchemy ser carregado (LAZY_ROUTERS)
+    from sqlalchemy import event
+
+    @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        context._metricas_inicio = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, 'after_cursor_execute')
+    def _depois(conn, cursor, statement, parameters, context, executemany):
+        fim = time.perf_counter()
+        estatisticas = _requisicao_atual.get()
+        if estatisticas is not None:
+            estatisticas.statements += 1
+            estatisticas.tempo_db += fim - context._metricas_inicio
+            # rowcount é -1 quando o driver não informa (ex.: SELECT no SQLite)
+            estatisticas.linhas += max(cursor.rowcount, 0)
+        registro.overhead += time.perf_counter() - fim
+
+
+class MetricasMiddleware:
+    """Middleware ASGI que mede latência e consumo de banco de cada requisição HTTP."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        estatisticas = EstatisticasRequisicao()
+        token = _requisicao_atual.set(estatisticas)
+        status_code = 500
+        inicio = time.perf_counter()
+
+        async def send_com_status(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_com_status)
+        finally:
+            fim = time.perf_counter()
+            _requisicao_atual.reset(token)
+
+            # Usa o template da rota (/atletas/{id}) para não criar uma série por id;
+            # caminhos que não casam com nenhuma rota são agrupados
+            rota = scope.get('route')
+            registro.registrar(
+                scope['method'],
+                getattr(rota, 'path', 'nao_encontrada'),
+                status_code,
+                fim - inicio,
+                estatisticas,
+            )
+            registro.overhead += time.perf_counter() - fim
@@ -1,8 +1,22 @@
 from uuid import uuid4
-from sqlalchemy import UUID
+from sqlalchemy import UUID, BigInteger, String, Uuid
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 
 class BaseModel(DeclarativeBase):
-    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), default=uuid4, nullable=False)
\ No newline at end of file
+    # Todas as rotas /{id} filtram por esta coluna: o índice único evita seq scan
+    id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), default=uuid4, nullable=False, unique=True, index=True)
+
+
+class ContagemModel(BaseModel):
+    """
+    Total exato de linhas por tabela e versão da tabela (ETag das suas respostas), mantidos
+    pelos CRUDs na transação de cada escrita.
+    """
+    __tablename__ = 'contagens'
+
+    id = None
+    tabela: Mapped[str] = mapped_column(String(50), primary_key=True)
+    quantidade: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Milissegundos desde a época da última escrita (ou +1, se o relógio não avançou)
+    versao: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default='0')
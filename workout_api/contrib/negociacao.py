@@ -0,0 +1,182 @@
+import gzip
+import json
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from fastapi import Response
+from pydantic_core import to_jsonable_python
+from starlette.datastructures import Headers, MutableHeaders
+
+from workout_api.configs.settings import settings
+
+MSGPACK = 'application/msgpack'
+
+# Formato pedido pela requisição corrente; lido por SerializacaoRapida para gerar
+# MessagePack direto dos dados, sem passar por JSON
+formato_resposta: ContextVar[str] = ContextVar('formato_resposta', default='json')
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError as erro:
+        raise RuntimeError('MSGPACK_ENABLED requer o pacote `msgpack` instalado.') from erro
+    return msgpack
+
+
+def _compressores() -> dict[str, Callable[[bytes], bytes]]:
+    compressores = {}
+    for codificacao in settings.COMPRESSION_ENCODINGS:
+        if codificacao == 'gzip':
+            compressores['gzip'] = lambda corpo: gzip.compress(corpo, compresslevel=6)
+        elif codificacao == 'br':
+            try:
+                import brotli
+            except ImportError as erro:
+                raise RuntimeError("COMPRESSION_ENCODINGS com 'br' requer o pacote `brotli` instalado.") from erro
+            compressores['br'] = lambda corpo: brotli.compress(corpo, quality=5)
+    return compressores
+
+
+def _qualidades(cabecalho: str) -> dict[str, float]:
+    # "application/msgpack, application/json;q=0.5" -> {'application/msgpack': 1.0, 'application/json': 0.5}
+    qualidades = {}
+    for item in cabecalho.split(','):
+        valor, *parametros = (parte.strip() for parte in item.split(';'))
+        if not valor:
+            continue
+        q = 1.0
+        for parametro in parametros:
+            if parametro.startswith('q='):
+                try:
+                    q = float(parametro[2:])
+                except ValueError:
+                    q = 0.0
+        qualidades[valor.lower()] = q
+    return qualidades
+
+
+class RespostaMsgpack(Response):
+    """Resposta MessagePack com o mesmo modelo de dados do JSON (UUIDs e datas como texto)."""
+    media_type = MSGPACK
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        # Tipos fora do MessagePack (UUID, datetime, modelos) são convertidos como no JSON
+        return _msgpack().packb(content, default=to_jsonable_python)
+
+
+class NegociacaoConteudo:
+    """
+    Middleware ASGI de formato e compressão das respostas de todas as rotas:
+
+    - com `Accept: application/msgpack` (preferido a application/json), respostas JSON viram
+      MessagePack; as rotas com serialização rápida já geram MessagePack direto;
+    - respostas a partir de COMPRESSION_MIN_BYTES são comprimidas com a primeira codificação
+      de COMPRESSION_ENCODINGS aceita em Accept-Encoding.
+
+    Só respostas de corpo único são alteradas: streaming (ex.: /atletas/export) passa intacto.
+    Quando a representação muda, o ETag vira fraco, já que os bytes não são mais os do JSON.
+    Todas as respostas levam Vary: Accept, Accept-Encoding.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.msgpack = _msgpack() if settings.MSGPACK_ENABLED else None
+        self.compressores = _compressores()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        cabecalhos = Headers(scope=scope)
+        usar_msgpack = self.msgpack is not None and self._prefere_msgpack(cabecalhos.get('accept', ''))
+        codificacao = self._codificacao(cabecalhos.get('accept-encoding', ''))
+        if not usar_msgpack and codificacao is None:
+            async def repassar(message):
+                if message['type'] == 'http.response.start':
+                    self._variar(message)
+                await send(message)
+
+            await self.app(scope, receive, repassar)
+            return
+
+        inicio: Optional[dict] = None
+        streaming = False
+
+        async def enviar(message):
+            nonlocal inicio, streaming
+            if message['type'] == 'http.response.start':
+                inicio = message
+                return
+            if message['type'] != 'http.response.body' or streaming:
+                await send(message)
+                return
+            if message.get('more_body', False):
+                # Corpo em partes: repassa como veio
+                streaming = True
+                self._variar(inicio)
+                await send(inicio)
+                await send(message)
+                return
+            await self._enviar_corpo(send, inicio, message.get('body', b''), usar_msgpack, codificacao)
+
+        token = formato_resposta.set('msgpack' if usar_msgpack else 'json')
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            formato_resposta.reset(token)
+
+    def _variar(self, inicio: dict) -> None:
+        # Em toda resposta, inclusive as que passam intactas: um cache compartilhado não pode
+        # entregar a representação de um cliente a outro que pediu formato/codificação diferente
+        cabecalhos = MutableHeaders(raw=inicio['headers'])
+        if self.msgpack is not None:
+            cabecalhos.add_vary_header('Accept')
+        if self.compressores:
+            cabecalhos.add_vary_header('Accept-Encoding')
+
+    @staticmethod
+    def _prefere_msgpack(accept: str) -> bool:
+        qualidades = _qualidades(accept)
+        q_msgpack = max(qualidades.get(MSGPACK, 0.0), qualidades.get('application/x-msgpack', 0.0))
+        return q_msgpack > 0 and q_msgpack >= qualidades.get('application/json', 0.0)
+
+    def _codificacao(self, accept_encoding: str) -> Optional[str]:
+        qualidades = _qualidades(accept_encoding)
+        for codificacao in self.compressores:
+            if qualidades.get(codificacao, 0.0) > 0:
+                return codificacao
+        return None
+
+    async def _enviar_corpo(self, send, inicio: dict, corpo: bytes, usar_msgpack: bool, codificacao: Optional[str]):
+        cabecalhos = MutableHeaders(raw=inicio['headers'])
+
+        if usar_msgpack and corpo and cabecalhos.get('content-type', '').startswith('application/json'):
+            corpo = self.msgpack.packb(json.loads(corpo))
+            cabecalhos['content-type'] = MSGPACK
+        # Gerado aqui ou já pela rota, o MessagePack é outra representação do mesmo recurso
+        # (no 304, sem corpo, vale o formato pedido)
+        alterado = cabecalhos.get('content-type') == MSGPACK or (usar_msgpack and inicio['status'] == 304)
+
+        if (
+            codificacao is not None
+            and len(corpo) >= settings.COMPRESSION_MIN_BYTES
+            and 'content-encoding' not in cabecalhos
+        ):
+            corpo = self.compressores[codificacao](corpo)
+            cabecalhos['content-encoding'] = codificacao
+            alterado = True
+
+        if alterado:
+            if inicio['status'] != 304:
+                cabecalhos['content-length'] = str(len(corpo))
+            etag = cabecalhos.get('etag')
+            if etag and not etag.startswith('W/'):
+                cabecalhos['etag'] = f'W/{etag}'
+        self._variar(inicio)
+
+        await send(inicio)
+        await send({'type': 'http.response.body', 'body': corpo})
@@ -0,0 +1,138 @@
+import base64
+import binascii
+import json
+from typing import Any, Awaitable, Callable, Generic, Literal, Optional, TypeVar
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+T = TypeVar('T')
+
+PROXIMA = 'proxima'
+ANTERIOR = 'anterior'
+
+ModoTotal = Literal['exact', 'estimate', 'none']
+
+
+class CursorParams:
+    """Parâmetros de paginação por cursor (keyset) recebidos via query string."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description='Cursor opaco retornado pela página anterior'),
+        size: int = Query(50, ge=1, le=100, description='Quantidade de itens por página'),
+        total: Literal['exact', 'estimate', 'none', 'true', 'false'] = Query(
+            'none',
+            description=(
+                "Contagem total de itens na resposta: 'exact', 'estimate' (mais barata em consultas "
+                "filtradas) ou 'none'; 'true' e 'false' equivalem a 'exact' e 'none'"
+            ),
+        ),
+    ):
+        self.cursor = cursor
+        self.size = size
+        self.total: ModoTotal = {'true': 'exact', 'false': 'none'}.get(total, total)
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    total: Optional[int] = Field(None, description='Total de itens (apenas quando solicitado)')
+    total_estimado: Optional[bool] = Field(None, description='Se o total é uma estimativa (apenas quando solicitado)')
+    size: int
+    next_page: Optional[str] = Field(None, description='Cursor para a próxima página')
+    previous_page: Optional[str] = Field(None, description='Cursor para a página anterior')
+
+
+def encode_cursor(valor: Any, direcao: str) -> str:
+    payload = json.dumps({'v': valor, 'd': direcao}, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        valor, direcao = payload['v'], payload['d']
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Cursor de paginação inválido.'
+        )
+
+    if direcao not in (PROXIMA, ANTERIOR):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Cursor de paginação inválido.'
+        )
+
+    return valor, direcao
+
+
+async def contar(db_session: AsyncSession, query: Select) -> int:
+    # Conta sobre a consulta já filtrada, sem ORDER BY/LIMIT
+    subquery = query.order_by(None).limit(None).subquery()
+    return (await db_session.execute(select(func.count()).select_from(subquery))).scalar_one()
+
+
+async def paginar_por_cursor(
+    db_session: AsyncSession,
+    query: Select,
+    chave: ColumnElement,
+    params: CursorParams,
+    transform: Callable[[Any], T] = lambda item: item,
+    escalar: bool = True,
+    contagem: Optional[Callable[[ModoTotal], Awaitable[tuple[int, bool]]]] = None,
+) -> CursorPage[T]:
+    """
+    Pagina `query` por keyset na coluna `chave` (única e ordenável), empurrando
+    o LIMIT e o filtro do cursor para o banco em vez de carregar a tabela inteira.
+    `contagem` devolve (total, estimado) no modo pedido (ver contrib.contagem); sem ela,
+    o total é sempre o count(*) exato da consulta.
+    """
+    total = total_estimado = None
+    if params.total != 'none':
+        if contagem is not None:
+            total, total_estimado = await contagem(params.total)
+        else:
+            total, total_estimado = await contar(db_session, query), False
+
+    direcao = PROXIMA
+    pagina = query
+    if params.cursor:
+        valor, direcao = decode_cursor(params.cursor)
+        pagina = pagina.where(chave > valor if direcao == PROXIMA else chave < valor)
+
+    # Busca um item a mais para saber se existe outra página na mesma direção
+    ordem = chave.asc() if direcao == PROXIMA else chave.desc()
+    pagina = pagina.order_by(ordem).limit(params.size + 1)
+
+    result = await db_session.execute(pagina)
+    linhas = list(result.scalars().all() if escalar else result.all())
+
+    tem_mais = len(linhas) > params.size
+    linhas = linhas[:params.size]
+    if direcao == ANTERIOR:
+        linhas.reverse()
+
+    next_page = previous_page = None
+    if linhas:
+        nome_chave = chave.key
+        primeiro = getattr(linhas[0], nome_chave)
+        ultimo = getattr(linhas[-1], nome_chave)
+
+        if tem_mais or direcao == ANTERIOR:
+            next_page = encode_cursor(ultimo, PROXIMA)
+        if (tem_mais and direcao == ANTERIOR) or (params.cursor and direcao == PROXIMA):
+            previous_page = encode_cursor(primeiro, ANTERIOR)
+
+    return CursorPage(
+        items=[transform(linha) for linha in linhas],
+        total=total,
+        total_estimado=total_estimado,
+        size=params.size,
+        next_page=next_page,
+        previous_page=previous_page,
+    )
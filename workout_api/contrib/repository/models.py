@@ -1,3 +1,6 @@
 from workout_api.categorias.models import CategoriaModel
 from workout_api.atleta.models import AtletaModel
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.jobs.models import JobModel
+from workout_api.treino.models import TreinoModel
+from workout_api.contrib.models import ContagemModel
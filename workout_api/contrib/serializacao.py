@@ -0,0 +1,57 @@
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.negociacao import RespostaMsgpack, formato_resposta
+
+
+def projetar(schema: type[BaseModel], linha: Mapping | Any) -> dict:
+    """
+    Dicionário com os campos de `schema` lidos de uma linha do banco (mapeamento, Row ou
+    objeto ORM), sem validação: os tipos vindos do banco já correspondem aos do schema.
+    Campos aninhados precisam ser montados pelo chamador.
+    """
+    if not isinstance(linha, Mapping):
+        linha = getattr(linha, '_mapping', None) or {
+            campo: getattr(linha, campo) for campo in schema.model_fields if hasattr(linha, campo)
+        }
+    return {campo: linha[campo] for campo in schema.model_fields if campo in linha}
+
+
+class RespostaJson(Response):
+    """Resposta JSON gerada pelo serializador do pydantic-core (Rust), que entende modelos, UUIDs e datas."""
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+
+class SerializacaoRapida:
+    """
+    Saída dos GETs de um router. Os CRUDs de leitura devolvem dados já projetados das linhas
+    do banco (dicts); quando o router está em FAST_SERIALIZATION_ROUTERS eles viram bytes
+    direto, sem a validação e a serialização pelo response_model feitas pelo FastAPI (que
+    continua descrevendo a resposta no OpenAPI). Do contrário, seguem o caminho padrão.
+    Se a requisição pediu MessagePack (ver NegociacaoConteudo), os bytes já saem nesse formato.
+    """
+
+    def __init__(self, router: str):
+        self.ativa = router in settings.FAST_SERIALIZATION_ROUTERS
+
+    def __call__(self, conteudo: Any, response: Optional[Response] = None) -> Any:
+        if not self.ativa:
+            return conteudo
+
+        classe = RespostaMsgpack if formato_resposta.get() == 'msgpack' else RespostaJson
+        resposta = classe(conteudo)
+        if response is not None:
+            # Cabeçalhos definidos por dependências (ex.: ETag) ficam na resposta temporária do FastAPI
+            for chave, valor in response.headers.items():
+                if chave != 'content-length':
+                    resposta.headers[chave] = valor
+        return resposta
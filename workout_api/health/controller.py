@@ -0,0 +1,104 @@
+import time
+
+from fastapi import APIRouter, Response, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from workout_api.configs.database import engine, estado_pool, roteador
+from workout_api.contrib import admissao
+from workout_api.contrib.cache import cache
+from workout_api.contrib.coalescencia import coalescencia
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.metricas import registro
+from workout_api.health.schemas import CacheHealth, DatabaseHealth, ReplicaStatus
+
+router = APIRouter()
+metrics_router = APIRouter()
+
+@router.get(
+    '/db',
+    summary='Estado do banco de dados e do pool de conexões',
+    status_code=status.HTTP_200_OK,
+    response_model=DatabaseHealth,
+)
+async def db(
+    db_session: DatabaseDependency,
+    response: Response
+) -> DatabaseHealth:
+    # O pool é lido antes do SELECT 1 para não contar a própria conexão da verificação
+    pool = estado_pool(engine)
+    replicas = [
+        ReplicaStatus(
+            url=replica.url.render_as_string(hide_password=True),
+            sessoes=roteador.em_uso[indice],
+            pool=estado_pool(replica),
+        )
+        for indice, replica in enumerate(roteador.engines)
+    ] if roteador is not None else []
+
+    inicio = time.perf_counter()
+    try:
+        await db_session.execute(text('SELECT 1'))
+    except SQLAlchemyError as erro:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return DatabaseHealth(status='erro', erro=type(erro).__name__, pool=pool, replicas=replicas)
+
+    return DatabaseHealth(
+        status='ok',
+        latencia_ms=round((time.perf_counter() - inicio) * 1000, 3),
+        pool=pool,
+        replicas=replicas,
+    )
+
+
+@router.get(
+    '/cache',
+    summary='Contadores do cache de dados de referência',
+    status_code=status.HTTP_200_OK,
+    response_model=CacheHealth,
+)
+async def cache_stats() -> CacheHealth:
+    return CacheHealth(**cache.estatisticas())
+
+
+
+@metrics_router.get(
+    '/metrics',
+    summary='Métricas no formato texto do Prometheus',
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+)
+async def metrics() -> PlainTextResponse:
+    pool = estado_pool(engine)
+    estatisticas_cache = cache.estatisticas()
+
+    extras = [
+        (f'workout_api_db_pool_{nome}', 'gauge', {}, pool[nome])
+        for nome in ('checked_in', 'checked_out', 'overflow')
+        if nome in pool
+    ]
+    extras += [
+        (f'workout_api_cache_{nome}_total', 'counter', {'backend': estatisticas_cache['backend']}, estatisticas_cache[nome])
+        for nome in ('hits', 'misses')
+    ]
+    estatisticas_coalescencia = coalescencia.estatisticas()
+    extras += [
+        (f'workout_api_read_{nome}_total', 'counter', {'namespace': namespace}, total)
+        for nome, chave in (('executions', 'executadas'), ('coalesced', 'coalescidas'))
+        for namespace, total in estatisticas_coalescencia[chave].items()
+    ]
+    extras += [
+        ('workout_api_admission_rejected_total', 'counter', {'reason': motivo}, total)
+        for motivo, total in admissao.recusadas.items()
+    ]
+    if admissao.concorrencia is not None:
+        extras += [
+            ('workout_api_requests_in_flight', 'gauge', {}, admissao.concorrencia.em_andamento),
+            ('workout_api_requests_waiting', 'gauge', {}, admissao.concorrencia.aguardando),
+        ]
+
+    return PlainTextResponse(
+        registro.renderizar(extras),
+        media_type='text/plain; version=0.0.4',
+    )
\ No newline at end of file
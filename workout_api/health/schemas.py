@@ -0,0 +1,34 @@
+from typing import Annotated, Optional
+
+from pydantic import Field
+from workout_api.contrib.schemas import BaseSchema
+
+
+class PoolStatus(BaseSchema):
+    classe: Annotated[str, Field(description='Classe do pool de conexões')]
+    tamanho: Annotated[Optional[int], Field(None, description='Conexões permanentes do pool (pool_size)')]
+    checked_in: Annotated[Optional[int], Field(None, description='Conexões ociosas no pool')]
+    checked_out: Annotated[Optional[int], Field(None, description='Conexões em uso')]
+    overflow: Annotated[Optional[int], Field(None, description='Conexões abertas além do pool_size')]
+
+
+class ReplicaStatus(BaseSchema):
+    url: Annotated[str, Field(description='URL da réplica, sem a senha')]
+    sessoes: Annotated[int, Field(description='Sessões de leitura abertas nesta réplica pelo processo')]
+    pool: Annotated[PoolStatus, Field(description='Estado do pool de conexões da réplica')]
+
+
+class DatabaseHealth(BaseSchema):
+    status: Annotated[str, Field(description="'ok' ou 'erro'", json_schema_extra={"example": "ok"})]
+    latencia_ms: Annotated[Optional[float], Field(None, description='Tempo de um SELECT 1')]
+    erro: Annotated[Optional[str], Field(None, description='Mensagem de erro, quando houver')]
+    pool: Annotated[PoolStatus, Field(description='Estado do pool de conexões do processo')]
+    replicas: Annotated[list[ReplicaStatus], Field([], description='Réplicas de leitura configuradas')]
+
+
+class CacheHealth(BaseSchema):
+    backend: Annotated[str, Field(description="Backend do cache ('memory' ou 'redis')")]
+    hits: Annotated[int, Field(description='Leituras atendidas pelo cache')]
+    misses: Annotated[int, Field(description='Leituras que precisaram ir ao banco')]
+    itens: Annotated[Optional[int], Field(None, description='Entradas no cache (apenas memory)')]
+    evictions: Annotated[Optional[int], Field(None, description='Entradas removidas pelo limite de tamanho')]
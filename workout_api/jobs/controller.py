@@ -0,0 +1,57 @@
+import os
+from uuid import UUID
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.jobs.job_crud import buscar_job_por_id, cancelar_job
+from workout_api.jobs.schemas import JobOut
+
+router = APIRouter()
+
+
+@router.get(
+    '/{id}',
+    summary='Consultar o status e o progresso de um Job',
+    status_code=status.HTTP_200_OK,
+    response_model=JobOut,
+)
+async def get(
+    id: UUID,
+    db_session: DatabaseDependency
+):
+    return await buscar_job_por_id(db_session, id)
+
+
+@router.post(
+    '/{id}/cancelar',
+    summary='Cancelar um Job pendente ou em execução',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobOut,
+)
+async def cancelar(
+    id: UUID,
+    db_session: DatabaseDependency
+):
+    return await cancelar_job(db_session, id)
+
+
+@router.get(
+    '/{id}/arquivo',
+    summary='Baixar o arquivo gerado por um Job concluído',
+    status_code=status.HTTP_200_OK,
+    response_class=FileResponse,
+)
+async def arquivo(
+    id: UUID,
+    db_session: DatabaseDependency
+):
+    job = await buscar_job_por_id(db_session, id)
+    caminho = (job.resultado or {}).get('arquivo') if job.status == 'concluido' else None
+
+    if not caminho or not os.path.exists(caminho):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'O job {id} não tem arquivo disponível.'
+        )
+
+    return FileResponse(caminho, filename=os.path.basename(caminho))
@@ -0,0 +1,321 @@
+import asyncio
+import logging
+import os
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.jobs.models import JobModel
+
+logger = logging.getLogger(__name__)
+
+
+class ContextoJob:
+    """
+    O que a função de um job recebe: seus parâmetros, o último progresso gravado (de uma
+    execução anterior interrompida, para retomá-la) e um meio de publicar o progresso.
+    """
+
+    def __init__(self, pk_id: int, parametros: dict, tentativa: int, progresso: Optional[dict] = None):
+        self.pk_id = pk_id
+        self.parametros = parametros
+        self.tentativa = tentativa
+        self.progresso = progresso
+
+    async def reportar(self, **progresso: Any) -> None:
+        # O progresso é informativo: uma falha ao gravá-lo (ex.: SQLite bloqueado por uma
+        # leitura longa do próprio job) não interrompe o job
+        try:
+            async with async_session() as db_session:
+                await self.reportar_na_transacao(db_session, **progresso)
+                await db_session.commit()
+        except SQLAlchemyError:
+            logger.warning('Falha ao gravar o progresso do job %s', self.pk_id, exc_info=True)
+
+    async def reportar_na_transacao(self, db_session: DatabaseDependency, **progresso: Any) -> None:
+        """Grava o progresso na transação de `db_session`: ele vale junto com o trabalho que descreve."""
+        self.progresso = to_jsonable_python(progresso)
+        await db_session.execute(
+            update(JobModel)
+            .where(JobModel.pk_id == self.pk_id, JobModel.tentativas == self.tentativa)
+            .values(progresso=self.progresso)
+        )
+
+
+@dataclass
+class Tarefa:
+    funcao: Callable[[ContextoJob], Awaitable[Optional[dict]]]
+    # Execuções simultâneas deste tipo em cada processo
+    concorrencia: int
+    semaforo: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self):
+        self.semaforo = asyncio.Semaphore(self.concorrencia)
+
+
+class FilaJobs:
+    """
+    Fila de jobs em segundo plano, executados por JOBS_WORKERS tarefas asyncio do próprio
+    processo, fora do ciclo das requisições. O estado fica na tabela `jobs`:
+
+    - um job só roda depois de reivindicado por um UPDATE condicional, então vários
+      processos podem compartilhar a mesma tabela sem executar o mesmo job duas vezes;
+    - enquanto roda, o job renova um lease; se o processo cair, o lease vence e a varredura
+      periódica (de qualquer processo) devolve o job à fila. A nova execução recebe o último
+      progresso gravado (ContextoJob.progresso) e deve continuar dele, ou poder ser repetida
+      do início sem efeito duplicado;
+    - o cancelamento marca o job e interrompe a tarefa onde quer que ela esteja rodando;
+    - o arquivo de um job (parâmetro `arquivo`: o envio de uma importação, o resultado de uma
+      exportação) é removido quando o job é cancelado ou falha, e os jobs terminados são
+      apagados com seus arquivos após JOBS_RETENTION_SECONDS.
+    """
+
+    def __init__(self):
+        self.tarefas: dict[str, Tarefa] = {}
+        self._fila: Optional[asyncio.Queue] = None
+        self._trabalhadores: list[asyncio.Task] = []
+        self._em_execucao: dict[int, asyncio.Task] = {}
+        self._enfileirados: set[int] = set()
+        # Jobs cuja interrupção foi pedida pelo usuário (as demais são desligamento do processo)
+        self._cancelados: set[int] = set()
+        self._parando = False
+
+    def tarefa(self, tipo: str, concorrencia: int = 1):
+        """Registra a função que executa os jobs de `tipo`."""
+        def registrar(funcao):
+            self.tarefas[tipo] = Tarefa(funcao, concorrencia)
+            return funcao
+        return registrar
+
+    @property
+    def ativa(self) -> bool:
+        return self._fila is not None and not self._parando
+
+    async def submeter(self, db_session: DatabaseDependency, tipo: str, parametros: dict) -> JobModel:
+        if tipo not in self.tarefas:
+            raise ValueError(f'Tipo de job desconhecido: {tipo}')
+
+        job = JobModel(
+            tipo=tipo,
+            status='pendente',
+            parametros=to_jsonable_python(parametros),
+            tentativas=0,
+            cancelamento_solicitado=False,
+            created_at=datetime.now(),
+        )
+        db_session.add(job)
+        await db_session.commit()
+
+        # Sem a fila ativa neste processo, o job fica para a varredura de outro processo
+        if self.ativa:
+            self._enfileirar(job.pk_id, tipo)
+        return job
+
+    def cancelar_local(self, pk_id: int) -> None:
+        tarefa = self._em_execucao.get(pk_id)
+        if tarefa is not None:
+            self._cancelados.add(pk_id)
+            tarefa.cancel()
+
+    async def iniciar(self) -> None:
+        self._parando = False
+        self._fila = asyncio.Queue()
+        self._trabalhadores = [asyncio.create_task(self._trabalhar()) for _ in range(settings.JOBS_WORKERS)]
+        self._trabalhadores.append(asyncio.create_task(self._varrer()))
+
+    async def parar(self) -> None:
+        # Jobs interrompidos aqui voltam a 'pendente' e são retomados pelo próximo processo
+        self._parando = True
+        for trabalhador in self._trabalhadores:
+            trabalhador.cancel()
+        await asyncio.gather(*self._trabalhadores, return_exceptions=True)
+        self._trabalhadores = []
+        self._fila = None
+        self._enfileirados.clear()
+
+    def _enfileirar(self, pk_id: int, tipo: str) -> None:
+        if pk_id in self._enfileirados or pk_id in self._em_execucao:
+            return
+        self._enfileirados.add(pk_id)
+        self._fila.put_nowait((pk_id, tipo))
+
+    async def _varrer(self) -> None:
+        while True:
+            try:
+                async with async_session() as db_session:
+                    disponiveis = (await db_session.execute(
+                        select(JobModel.pk_id, JobModel.tipo)
+                        .where(_disponivel(datetime.now()))
+                        .order_by(JobModel.pk_id)
+                    )).all()
+                for pk_id, tipo in disponiveis:
+                    self._enfileirar(pk_id, tipo)
+            except Exception:
+                logger.exception('Falha ao buscar jobs pendentes')
+            try:
+                await expurgar(datetime.now() - timedelta(seconds=settings.JOBS_RETENTION_SECONDS))
+            except Exception:
+                logger.exception('Falha ao remover jobs expirados')
+            await asyncio.sleep(settings.JOBS_POLL_SECONDS)
+
+    async def _trabalhar(self) -> None:
+        while True:
+            pk_id, tipo = await self._fila.get()
+            self._enfileirados.discard(pk_id)
+            tarefa = self.tarefas.get(tipo)
+
+            if tarefa is not None and tarefa.semaforo.locked():
+                # O tipo já está no limite: o job volta ao fim da fila sem ocupar este worker
+                asyncio.get_running_loop().call_later(0.5, self._reenfileirar, pk_id, tipo)
+                self._enfileirados.add(pk_id)
+                continue
+
+            try:
+                if tarefa is None:
+                    await _finalizar(pk_id, None, status='falhou', erro=f'Tipo de job desconhecido: {tipo}')
+                else:
+                    async with tarefa.semaforo:
+                        await self._executar(pk_id, tarefa)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('Falha ao executar o job %s', pk_id)
+
+    def _reenfileirar(self, pk_id: int, tipo: str) -> None:
+        if self.ativa:
+            self._fila.put_nowait((pk_id, tipo))
+        else:
+            self._enfileirados.discard(pk_id)
+
+    async def _executar(self, pk_id: int, tarefa: Tarefa) -> None:
+        agora = datetime.now()
+        async with async_session() as db_session:
+            reivindicado = (await db_session.execute(
+                update(JobModel)
+                .where(JobModel.pk_id == pk_id, _disponivel(agora))
+                .values(
+                    status='executando',
+                    tentativas=JobModel.tentativas + 1,
+                    iniciado_em=agora,
+                    lease_ate=agora + timedelta(seconds=settings.JOBS_LEASE_SECONDS),
+                )
+                .returning(JobModel.parametros, JobModel.tentativas, JobModel.progresso)
+            )).first()
+            await db_session.commit()
+
+        # Outro processo já pegou o job, ou ele foi cancelado/concluído
+        if reivindicado is None:
+            return
+
+        parametros, tentativa, progresso = reivindicado
+        execucao = asyncio.create_task(tarefa.funcao(ContextoJob(pk_id, parametros, tentativa, progresso)))
+        self._em_execucao[pk_id] = execucao
+        renovacao = asyncio.create_task(self._renovar_lease(pk_id, tentativa, execucao))
+
+        try:
+            resultado = await execucao
+        except asyncio.CancelledError:
+            if pk_id not in self._cancelados:
+                await _finalizar(pk_id, tentativa, status='pendente', concluido=False)
+                raise
+            await _finalizar(pk_id, tentativa, status='cancelado')
+            remover_arquivo(parametros)
+        except Exception as erro:
+            logger.exception('Job %s falhou', pk_id)
+            await _finalizar(pk_id, tentativa, status='falhou', erro=f'{type(erro).__name__}: {erro}')
+            remover_arquivo(parametros)
+        else:
+            await _finalizar(pk_id, tentativa, status='concluido', resultado=to_jsonable_python(resultado))
+        finally:
+            renovacao.cancel()
+            self._em_execucao.pop(pk_id, None)
+            self._cancelados.discard(pk_id)
+
+    async def _renovar_lease(self, pk_id: int, tentativa: int, execucao: asyncio.Task) -> None:
+        # Renova o lease a cada terço do prazo e atende cancelamentos pedidos por outro processo
+        while True:
+            await asyncio.sleep(settings.JOBS_LEASE_SECONDS / 3)
+            try:
+                async with async_session() as db_session:
+                    cancelar = (await db_session.execute(
+                        update(JobModel)
+                        .where(JobModel.pk_id == pk_id, JobModel.tentativas == tentativa)
+                        .values(lease_ate=datetime.now() + timedelta(seconds=settings.JOBS_LEASE_SECONDS))
+                        .returning(JobModel.cancelamento_solicitado)
+                    )).scalar_one_or_none()
+                    await db_session.commit()
+            except Exception:
+                logger.exception('Falha ao renovar o lease do job %s', pk_id)
+                continue
+            if cancelar:
+                self.cancelar_local(pk_id)
+                return
+
+
+def remover_arquivo(parametros: dict) -> None:
+    """Remove o arquivo do job, se houver (envio de importação ou exportação, inclusive parcial)."""
+    caminho = parametros.get('arquivo')
+    if caminho:
+        with suppress(FileNotFoundError):
+            os.remove(caminho)
+
+
+async def expurgar(limite: datetime) -> int:
+    """
+    Apaga os jobs terminados antes de `limite` e seus arquivos. Com vários processos, cada job
+    é apagado (e seu arquivo removido) por quem o DELETE devolveu.
+    """
+    async with async_session() as db_session:
+        expirados = (await db_session.execute(
+            delete(JobModel)
+            .where(JobModel.status.in_(('concluido', 'falhou', 'cancelado')), JobModel.concluido_em < limite)
+            .returning(JobModel.parametros)
+        )).scalars().all()
+        await db_session.commit()
+
+    for parametros in expirados:
+        remover_arquivo(parametros)
+    return len(expirados)
+
+
+def _disponivel(agora: datetime):
+    # Pendente, ou executando com o lease vencido (o processo que o rodava caiu)
+    return or_(
+        JobModel.status == 'pendente',
+        (JobModel.status == 'executando') & (JobModel.lease_ate < agora),
+    )
+
+
+async def _finalizar(
+    pk_id: int,
+    tentativa: Optional[int],
+    status: str,
+    resultado: Optional[dict] = None,
+    erro: Optional[str] = None,
+    concluido: bool = True
+) -> None:
+    query = update(JobModel).where(JobModel.pk_id == pk_id)
+    if tentativa is not None:
+        # Só a execução que detém o job o finaliza (após um lease vencido, outra pode tê-lo assumido)
+        query = query.where(JobModel.tentativas == tentativa, JobModel.status == 'executando')
+
+    async with async_session() as db_session:
+        await db_session.execute(query.values(
+            status=status,
+            resultado=resultado,
+            erro=erro,
+            lease_ate=None,
+            concluido_em=datetime.now() if concluido else None,
+        ))
+        await db_session.commit()
+
+
+fila = FilaJobs()
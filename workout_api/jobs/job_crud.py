@@ -0,0 +1,56 @@
+from datetime import datetime
+from uuid import UUID
+from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.future import select
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.jobs.fila import fila, remover_arquivo
+from workout_api.jobs.models import JobModel
+
+
+async def buscar_job_por_id(db_session: DatabaseDependency, id: UUID) -> JobModel:
+    job = (await db_session.execute(select(JobModel).filter_by(id=id))).scalars().first()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'Job não encontrado no id: {id}'
+        )
+
+    return job
+
+
+async def cancelar_job(db_session: DatabaseDependency, id: UUID) -> JobModel:
+    """
+    Um job pendente é cancelado na hora; um em execução é marcado e interrompido pelo
+    processo que o executa (imediatamente se for este, ou na próxima renovação do lease).
+    """
+    job = await buscar_job_por_id(db_session, id)
+
+    if job.status == 'pendente':
+        query = (
+            update(JobModel)
+            .where(JobModel.pk_id == job.pk_id, JobModel.status == 'pendente')
+            .values(status='cancelado', concluido_em=datetime.now())
+        )
+    elif job.status == 'executando':
+        query = (
+            update(JobModel)
+            .where(JobModel.pk_id == job.pk_id, JobModel.status == 'executando')
+            .values(cancelamento_solicitado=True)
+        )
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f'O job já terminou com status {job.status}.'
+        )
+
+    alterado = (await db_session.execute(query.execution_options(synchronize_session=False))).rowcount
+    await db_session.commit()
+    if job.status == 'pendente' and alterado:
+        # Não chegou a rodar: o arquivo enviado (importação) não será mais usado
+        remover_arquivo(job.parametros)
+    fila.cancelar_local(job.pk_id)
+
+    await db_session.refresh(job)
+    return job
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import JSON, Boolean, DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from workout_api.contrib.models import BaseModel
+
+
+class JobModel(BaseModel):
+    __tablename__ = 'jobs'
+
+    pk_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tipo: Mapped[str] = mapped_column(String(50), nullable=False)
+    # pendente -> executando -> concluido | falhou | cancelado
+    status: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    parametros: Mapped[dict] = mapped_column(JSON, nullable=False)
+    progresso: Mapped[Optional[dict]] = mapped_column(JSON)
+    resultado: Mapped[Optional[dict]] = mapped_column(JSON)
+    erro: Mapped[Optional[str]] = mapped_column(Text)
+    tentativas: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cancelamento_solicitado: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    iniciado_em: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    concluido_em: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    # Renovado enquanto o job roda: se vencer, o processo que o executava caiu e o job volta à fila
+    lease_ate: Mapped[Optional[datetime]] = mapped_column(DateTime)
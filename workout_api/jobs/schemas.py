@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Annotated, Any, Literal, Optional
+
+from pydantic import Field
+from workout_api.contrib.schemas import OutMixin
+
+
+class JobOut(OutMixin):
+    tipo: Annotated[str, Field(description="Tipo do job", json_schema_extra={"example": "atletas.importar"})]
+    status: Annotated[
+        Literal['pendente', 'executando', 'concluido', 'falhou', 'cancelado'],
+        Field(description="Situação atual do job")
+    ]
+    progresso: Annotated[Optional[dict[str, Any]], Field(None, description="Último progresso informado pelo job")]
+    resultado: Annotated[Optional[dict[str, Any]], Field(None, description="Resultado, quando concluído")]
+    erro: Annotated[Optional[str], Field(None, description="Motivo da falha")]
+    tentativas: Annotated[int, Field(description="Execuções iniciadas (mais de uma após reinício do processo)")]
+    iniciado_em: Annotated[Optional[datetime], Field(None, description="Início da execução atual")]
+    concluido_em: Annotated[Optional[datetime], Field(None, description="Fim da execução")]
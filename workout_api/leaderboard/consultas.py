@@ -0,0 +1,119 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.future import select
+
+from workout_api.atleta.atleta_crud import pks_atletas_por_id
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.categoria_crud import pks_categorias_por_nome
+from workout_api.centro_treinamento.centro_treinamento_crud import pks_centros_treinamento_por_nome
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.leaderboard.placares import placares
+from workout_api.treino.recordes import valor_resultado
+
+
+async def _placares_prontos() -> None:
+    if not settings.LEADERBOARD_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='O leaderboard está desativado.'
+        )
+    await placares.aguardar()
+
+
+async def consultar_placar(
+    db_session: DatabaseDependency,
+    categoria: str,
+    exercicio: str,
+    centro_treinamento: Optional[str] = None,
+    n: int = 10
+) -> dict:
+    """Top-N do placar, com id e nome dos atletas lidos em uma consulta de até N linhas."""
+    await _placares_prontos()
+
+    categoria_id = (await pks_categorias_por_nome(db_session, {categoria})).get(categoria)
+    if categoria_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'A categoria {categoria} não foi encontrada.'
+        )
+    centro_id = None
+    if centro_treinamento is not None:
+        centro_id = (
+            await pks_centros_treinamento_por_nome(db_session, {centro_treinamento})
+        ).get(centro_treinamento)
+        if centro_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'O centro de treinamento {centro_treinamento} não foi encontrado.'
+            )
+
+    while True:
+        ranking = placares.ranking((categoria_id, centro_id, exercicio))
+        topo = list(ranking.topo(n)) if ranking is not None else []
+        atletas = {
+            pk_id: (id, nome)
+            for pk_id, id, nome in (await db_session.execute(
+                select(AtletaModel.pk_id, AtletaModel.id, AtletaModel.nome)
+                .where(AtletaModel.pk_id.in_([atleta for _, atleta, _ in topo]))
+            )).tuples()
+        }
+        # Atletas removidos por outro processo saem do placar aqui, e o top-N é refeito
+        removidos = [atleta for _, atleta, _ in topo if atleta not in atletas]
+        if not removidos:
+            break
+        placares.remover_atletas(removidos)
+
+    return {
+        'categoria': categoria,
+        'centro_treinamento': centro_treinamento,
+        'exercicio': exercicio,
+        'total': len(ranking) if ranking is not None else 0,
+        'items': [
+            {
+                'posicao': posicao,
+                'atleta_id': atletas[atleta][0],
+                'nome': atletas[atleta][1],
+                'valor': valor_resultado(exercicio, chave),
+            }
+            for posicao, atleta, chave in topo
+        ],
+    }
+
+
+async def consultar_posicao(
+    db_session: DatabaseDependency,
+    atleta_id: UUID,
+    exercicio: str,
+    por_centro: bool = True
+) -> dict:
+    """Posição do atleta no placar da sua categoria (e do seu centro, com `por_centro`)."""
+    await _placares_prontos()
+
+    atleta = (await pks_atletas_por_id(db_session, {atleta_id})).get(atleta_id)
+    if atleta is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'Atleta não encontrado no id: {atleta_id}'
+        )
+
+    grupo = placares.grupo(atleta)
+    ranking = None
+    if grupo is not None:
+        categoria_id, centro_id = grupo
+        ranking = placares.ranking((categoria_id, centro_id if por_centro else None, exercicio))
+    posicao = ranking.posicao(atleta) if ranking is not None else None
+    if posicao is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'O atleta não tem resultado registrado em {exercicio}.'
+        )
+
+    return {
+        'exercicio': exercicio,
+        'posicao': posicao,
+        'total': len(ranking),
+        'valor': valor_resultado(exercicio, ranking.chave(atleta)),
+    }
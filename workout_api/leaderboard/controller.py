@@ -0,0 +1,38 @@
+from uuid import UUID
+from fastapi import APIRouter, Query, status
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.leaderboard.consultas import consultar_placar, consultar_posicao
+from workout_api.leaderboard.schemas import LeaderboardOut, LeaderboardPosicao
+
+router = APIRouter()
+
+@router.get(
+    '/',
+    summary='Consultar os primeiros colocados de um placar',
+    status_code=status.HTTP_200_OK,
+    response_model=LeaderboardOut,
+    response_model_exclude_none=True,
+)
+async def query(
+    db_session: DatabaseDependency,
+    categoria: str = Query(..., description='Nome da categoria'),
+    exercicio: str = Query(..., description='Exercício ou WOD'),
+    centro_treinamento: str | None = Query(None, description='Nome do centro (padrão: todos os centros)'),
+    n: int = Query(10, ge=1, le=100, description='Quantidade de colocados'),
+) -> LeaderboardOut:
+    return await consultar_placar(db_session, categoria, exercicio, centro_treinamento, n)
+
+
+@router.get(
+    '/atletas/{id}',
+    summary='Consultar a posição de um atleta no placar da sua categoria',
+    status_code=status.HTTP_200_OK,
+    response_model=LeaderboardPosicao,
+)
+async def get(
+    id: UUID,
+    db_session: DatabaseDependency,
+    exercicio: str = Query(..., description='Exercício ou WOD'),
+    por_centro: bool = Query(True, description='Placar do centro do atleta; falso compara toda a categoria'),
+) -> LeaderboardPosicao:
+    return await consultar_posicao(db_session, id, exercicio, por_centro)
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Iterable, Mapping, Optional
+
+from sqlalchemy import select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.leaderboard.ranking import Ranking
+from workout_api.treino.models import TreinoRecordeModel
+
+logger = logging.getLogger(__name__)
+
+# Registros lidos de novo a cada sincronização: cobre commits que chegam depois de outros
+# mais novos e diferenças de relógio entre processos (reaplicar um recorde não muda nada)
+MARGEM_SINCRONIZACAO = timedelta(seconds=60)
+
+# Placar: (categoria_id, centro_treinamento_id ou None para todos os centros, exercício)
+Placar = tuple[int, Optional[int], str]
+
+
+class Placares:
+    """
+    Placares do leaderboard em memória, um Ranking por (categoria, centro, exercício) e outro
+    por (categoria, exercício) somando os centros, montados a partir de `treinos_recordes`:
+
+    - reconstruídos do banco na subida (ou na primeira consulta, sem o lifespan);
+    - atualizados incrementalmente depois de cada escrita de treinos deste processo;
+    - sincronizados a cada LEADERBOARD_SYNC_SECONDS com os recordes alterados por outros
+      processos, e com atletas que mudaram de categoria ou centro (que tocam seus recordes).
+
+    Atletas removidos saem dos placares deste processo na remoção; nos demais, saem quando
+    aparecem em um top-N (ver leaderboard/consultas.py) ou na próxima reconstrução.
+    """
+
+    def __init__(self):
+        self._rankings: dict[Placar, Ranking] = {}
+        # atleta -> (categoria, centro) e exercícios com recorde
+        self._atletas: dict[int, tuple[int, int]] = {}
+        self._exercicios: dict[int, set[str]] = defaultdict(set)
+        self._marca: Optional[datetime] = None
+        self._reconstrucao: Optional[asyncio.Task] = None
+        self._sincronizacao: Optional[asyncio.Task] = None
+
+    @property
+    def pronto(self) -> bool:
+        return self._reconstrucao is not None and self._reconstrucao.done() and self._marca is not None
+
+    def ranking(self, placar: Placar) -> Optional[Ranking]:
+        return self._rankings.get(placar)
+
+    def grupo(self, atleta: int) -> Optional[tuple[int, int]]:
+        return self._atletas.get(atleta)
+
+    async def aguardar(self) -> None:
+        """Garante os placares montados; a primeira chamada dispara a reconstrução."""
+        if self._reconstrucao is None or (self._reconstrucao.done() and self._marca is None):
+            # Sem reconstrução ainda, ou a anterior falhou
+            self._reconstrucao = asyncio.create_task(self.reconstruir())
+        await asyncio.shield(self._reconstrucao)
+
+    async def iniciar(self) -> None:
+        await self.aguardar()
+        if settings.LEADERBOARD_SYNC_SECONDS > 0:
+            self._sincronizacao = asyncio.create_task(self._sincronizar_periodicamente())
+
+    async def parar(self) -> None:
+        if self._sincronizacao is not None:
+            self._sincronizacao.cancel()
+            await asyncio.gather(self._sincronizacao, return_exceptions=True)
+            self._sincronizacao = None
+
+    async def reconstruir(self) -> None:
+        """Monta todos os placares a partir dos recordes, de uma vez, e troca os atuais."""
+        inicio = datetime.now()
+        itens: dict[Placar, list[tuple[float, int]]] = defaultdict(list)
+        atletas: dict[int, tuple[int, int]] = {}
+        exercicios: dict[int, set[str]] = defaultdict(set)
+
+        async with async_session() as db_session:
+            linhas = await db_session.stream(_consulta().execution_options(yield_per=10_000))
+            async for atleta, exercicio, chave, categoria, centro in linhas:
+                atletas[atleta] = (categoria, centro)
+                exercicios[atleta].add(exercicio)
+                for placar in _placares(categoria, centro, exercicio):
+                    itens[placar].append((chave, atleta))
+
+        self._rankings = {placar: Ranking(lista) for placar, lista in itens.items()}
+        self._atletas = atletas
+        self._exercicios = exercicios
+        # Recordes gravados durante a leitura chegam pela sincronização seguinte
+        self._marca = inicio
+        logger.info('Placares reconstruídos: %d atletas, %d placares', len(atletas), len(self._rankings))
+
+    async def aplicar(self, db_session: DatabaseDependency, recordes: Iterable[Mapping]) -> None:
+        """Atualiza os placares com recordes recém-gravados (atleta_id, exercicio, chave)."""
+        recordes = list(recordes)
+        if not recordes or not self.pronto:
+            # Antes da reconstrução terminar, os recordes chegam pela leitura do banco
+            return
+
+        desconhecidos = {recorde['atleta_id'] for recorde in recordes} - self._atletas.keys()
+        if desconhecidos:
+            linhas = (await db_session.execute(
+                select(AtletaModel.pk_id, AtletaModel.categoria_id, AtletaModel.centro_treinamento_id)
+                .where(AtletaModel.pk_id.in_(desconhecidos))
+            )).tuples().all()
+            for atleta, categoria, centro in linhas:
+                self._atletas[atleta] = (categoria, centro)
+
+        for recorde in recordes:
+            grupo = self._atletas.get(recorde['atleta_id'])
+            if grupo is not None:
+                self._definir(recorde['atleta_id'], *grupo, recorde['exercicio'], recorde['chave'])
+
+    def remover_atletas(self, atletas: Iterable[int]) -> None:
+        for atleta in atletas:
+            grupo = self._atletas.pop(atleta, None)
+            if grupo is None:
+                continue
+            for exercicio in self._exercicios.pop(atleta, ()):
+                for placar in _placares(*grupo, exercicio):
+                    if (ranking := self._rankings.get(placar)) is not None:
+                        ranking.remover(atleta)
+
+    async def sincronizar(self) -> None:
+        if not self.pronto:
+            return
+        inicio = datetime.now()
+        async with async_session() as db_session:
+            linhas = (await db_session.execute(
+                _consulta().where(TreinoRecordeModel.atualizado_em >= self._marca - MARGEM_SINCRONIZACAO)
+            )).tuples().all()
+
+        for atleta, exercicio, chave, categoria, centro in linhas:
+            if self._atletas.get(atleta, (categoria, centro)) != (categoria, centro):
+                # Mudou de categoria ou centro: sai dos placares antigos com todos os recordes
+                self._mover(atleta, categoria, centro)
+            self._atletas[atleta] = (categoria, centro)
+            self._definir(atleta, categoria, centro, exercicio, chave)
+        self._marca = inicio
+
+    async def _sincronizar_periodicamente(self) -> None:
+        while True:
+            await asyncio.sleep(settings.LEADERBOARD_SYNC_SECONDS)
+            try:
+                await self.sincronizar()
+            except Exception:
+                logger.exception('Falha ao sincronizar os placares')
+
+    def _definir(self, atleta: int, categoria: int, centro: int, exercicio: str, chave: float) -> None:
+        self._exercicios[atleta].add(exercicio)
+        for placar in _placares(categoria, centro, exercicio):
+            ranking = self._rankings.get(placar)
+            if ranking is None:
+                ranking = self._rankings[placar] = Ranking()
+            ranking.definir(atleta, chave)
+
+    def _mover(self, atleta: int, categoria: int, centro: int) -> None:
+        antigo = self._atletas[atleta]
+        for exercicio in self._exercicios.get(atleta, ()):
+            chave = None
+            for placar in _placares(*antigo, exercicio):
+                if (ranking := self._rankings.get(placar)) is not None:
+                    chave = ranking.chave(atleta) if chave is None else chave
+                    ranking.remover(atleta)
+            if chave is not None:
+                for placar in _placares(categoria, centro, exercicio):
+                    self._rankings.setdefault(placar, Ranking()).definir(atleta, chave)
+
+
+def _placares(categoria: int, centro: int, exercicio: str) -> tuple[Placar, Placar]:
+    return (categoria, centro, exercicio), (categoria, None, exercicio)
+
+
+def _consulta():
+    return (
+        select(
+            TreinoRecordeModel.atleta_id,
+            TreinoRecordeModel.exercicio,
+            TreinoRecordeModel.chave,
+            AtletaModel.categoria_id,
+            AtletaModel.centro_treinamento_id,
+        )
+        .join(AtletaModel, AtletaModel.pk_id == TreinoRecordeModel.atleta_id)
+    )
+
+
+placares = Placares()
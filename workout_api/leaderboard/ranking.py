@@ -0,0 +1,131 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+
+class Ranking:
+    """
+    Classificação de um placar: atletas ordenados pela chave do resultado (menor é melhor).
+
+    Os itens (chave, atleta) ficam em listas ordenadas de até 2 x CARGA itens, com o maior
+    item de cada uma em `_maximos` e uma árvore de Fenwick sobre os tamanhos das listas.
+    Inserir, remover e obter a posição de um atleta custam O(log n) (mais o deslocamento
+    de no máximo 2 x CARGA referências dentro de uma lista); o top-N custa O(log n + N).
+    """
+
+    CARGA = 512
+
+    def __init__(self, itens: Iterable[tuple[float, int]] = ()):
+        itens = sorted(itens)
+        self._chaves: dict[int, float] = {atleta: chave for chave, atleta in itens}
+        self._listas: list[list[tuple[float, int]]] = [
+            itens[inicio:inicio + self.CARGA] for inicio in range(0, len(itens), self.CARGA)
+        ]
+        self._maximos: list[tuple[float, int]] = [lista[-1] for lista in self._listas]
+        self._indexar()
+
+    def __len__(self) -> int:
+        return len(self._chaves)
+
+    def __contains__(self, atleta: int) -> bool:
+        return atleta in self._chaves
+
+    def chave(self, atleta: int) -> Optional[float]:
+        return self._chaves.get(atleta)
+
+    def definir(self, atleta: int, chave: float) -> None:
+        """Coloca o atleta com a chave informada, substituindo a anterior."""
+        if atleta in self._chaves:
+            if self._chaves[atleta] == chave:
+                return
+            self._retirar((self._chaves[atleta], atleta))
+
+        self._chaves[atleta] = chave
+        item = (chave, atleta)
+        if not self._listas:
+            self._listas.append([item])
+            self._maximos.append(item)
+            self._indexar()
+            return
+
+        indice = bisect_right(self._maximos, item)
+        if indice == len(self._maximos):
+            indice -= 1
+            self._listas[indice].append(item)
+            self._maximos[indice] = item
+        else:
+            insort(self._listas[indice], item)
+        self._somar(indice, 1)
+
+        lista = self._listas[indice]
+        if len(lista) > 2 * self.CARGA:
+            # Divide a lista cheia; o índice de posições é refeito (custo amortizado pequeno)
+            self._listas[indice:indice + 1] = [lista[:self.CARGA], lista[self.CARGA:]]
+            self._maximos[indice:indice + 1] = [lista[self.CARGA - 1], lista[-1]]
+            self._indexar()
+
+    def remover(self, atleta: int) -> bool:
+        chave = self._chaves.pop(atleta, None)
+        if chave is None:
+            return False
+        self._retirar((chave, atleta))
+        return True
+
+    def posicao(self, atleta: int) -> Optional[int]:
+        """Posição do atleta (1 = melhor); resultados empatados dividem a mesma posição."""
+        chave = self._chaves.get(atleta)
+        if chave is None:
+            return None
+        return self._melhores_que(chave) + 1
+
+    def topo(self, n: int) -> Iterator[tuple[int, int, float]]:
+        """Os `n` primeiros como (posição, atleta, chave)."""
+        posicao, anterior = 0, None
+        itens = (item for lista in self._listas for item in lista)
+        for indice, (chave, atleta) in enumerate(islice(itens, n)):
+            if chave != anterior:
+                posicao, anterior = indice + 1, chave
+            yield posicao, atleta, chave
+
+    def _melhores_que(self, chave: float) -> int:
+        # (chave,) fica antes de qualquer (chave, atleta): conta só as chaves estritamente menores
+        indice = bisect_left(self._maximos, (chave,))
+        if indice == len(self._maximos):
+            return len(self._chaves)
+        return self._prefixo(indice) + bisect_left(self._listas[indice], (chave,))
+
+    def _retirar(self, item: tuple[float, int]) -> None:
+        indice = bisect_left(self._maximos, item)
+        lista = self._listas[indice]
+        del lista[bisect_left(lista, item)]
+        if lista:
+            self._maximos[indice] = lista[-1]
+            self._somar(indice, -1)
+        else:
+            del self._listas[indice]
+            del self._maximos[indice]
+            self._indexar()
+
+    # Árvore de Fenwick (1-based) com a quantidade de itens de cada lista
+
+    def _indexar(self) -> None:
+        arvore = [0] + [len(lista) for lista in self._listas]
+        for i in range(1, len(arvore)):
+            pai = i + (i & -i)
+            if pai < len(arvore):
+                arvore[pai] += arvore[i]
+        self._arvore = arvore
+
+    def _somar(self, indice: int, delta: int) -> None:
+        i = indice + 1
+        while i < len(self._arvore):
+            self._arvore[i] += delta
+            i += i & -i
+
+    def _prefixo(self, indice: int) -> int:
+        # Itens nas listas anteriores a `indice`
+        total, i = 0, indice
+        while i > 0:
+            total += self._arvore[i]
+            i -= i & -i
+        return total
@@ -0,0 +1,27 @@
+from typing import Annotated, Optional
+
+from pydantic import UUID4, Field
+from workout_api.contrib.schemas import BaseSchema
+
+
+class LeaderboardItem(BaseSchema):
+    posicao: Annotated[int, Field(description="Posição no placar (empates dividem a posição)")]
+    atleta_id: Annotated[UUID4, Field(description="Identificador do atleta")]
+    nome: Annotated[str, Field(description="Nome do atleta")]
+    valor: Annotated[float, Field(description="Melhor resultado do atleta no exercício")]
+
+
+class LeaderboardOut(BaseSchema):
+    categoria: Annotated[str, Field(description="Categoria do placar")]
+    centro_treinamento: Annotated[
+        Optional[str], Field(None, description="Centro de treinamento do placar (ausente: todos os centros)")]
+    exercicio: Annotated[str, Field(description="Exercício ou WOD do placar")]
+    total: Annotated[int, Field(description="Atletas no placar")]
+    items: Annotated[list[LeaderboardItem], Field(description="Primeiros colocados")]
+
+
+class LeaderboardPosicao(BaseSchema):
+    exercicio: Annotated[str, Field(description="Exercício ou WOD do placar")]
+    posicao: Annotated[int, Field(description="Posição do atleta (empates dividem a posição)")]
+    total: Annotated[int, Field(description="Atletas no placar")]
+    valor: Annotated[float, Field(description="Melhor resultado do atleta no exercício")]
@@ -1,5 +1,81 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from workout_api.routers import api_router
+from workout_api.configs.settings import settings
+from workout_api.contrib.admissao import AdmissaoMiddleware
+from workout_api.contrib.carregamento import AguardarCarregamento, CarregamentoTardio
+from workout_api.contrib.metricas import MetricasMiddleware, instrumentar_engine
+from workout_api.contrib.negociacao import NegociacaoConteudo
+
+
+def registrar_routers(app: FastAPI) -> None:
+    # Importações locais: com LAZY_ROUTERS elas só acontecem depois que o servidor sobe
+    from workout_api.configs.database import engine, roteador
+    from workout_api.health.controller import metrics_router
+    from workout_api.routers import api_router
+
+    app.include_router(api_router)
+
+    if settings.METRICS_ENABLED:
+        for instrumentada in [engine, *(roteador.engines if roteador is not None else [])]:
+            instrumentar_engine(instrumentada)
+        app.include_router(metrics_router)
+
+
+carregamento = CarregamentoTardio('workout_api.routers', registrar_routers)
+
+
+async def iniciar_servicos(app: FastAPI) -> None:
+    if settings.LAZY_ROUTERS:
+        await carregamento.aguardar(app)
+
+    if settings.JOBS_ENABLED:
+        from workout_api.jobs.fila import fila
+        await fila.iniciar()
+    if settings.LEADERBOARD_ENABLED:
+        from workout_api.leaderboard.placares import placares
+        await placares.iniciar()
+
+
+async def parar_servicos() -> None:
+    if settings.JOBS_ENABLED:
+        from workout_api.jobs.fila import fila
+        await fila.parar()
+    if settings.LEADERBOARD_ENABLED:
+        from workout_api.leaderboard.placares import placares
+        await placares.parar()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.LAZY_ROUTERS:
+        carregamento.iniciar(app)
+
+    inicio_servicos = None
+    if settings.JOBS_ENABLED or settings.LEADERBOARD_ENABLED:
+        # Com LAZY_ROUTERS a fila e os placares sobem depois do carregamento, sem atrasar o início do servidor
+        inicio_servicos = asyncio.create_task(iniciar_servicos(app))
+        if not settings.LAZY_ROUTERS:
+            await inicio_servicos
+
+    yield
+
+    if inicio_servicos is not None:
+        await inicio_servicos
+        await parar_servicos()
+
+
+app = FastAPI(title='WorkoutApi', lifespan=lifespan)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricasMiddleware)
+
+# Recusas (429/503) saem antes das métricas por rota, mas passam pela negociação de formato
+app.add_middleware(AdmissaoMiddleware)
+app.add_middleware(NegociacaoConteudo)
 
-app = FastAPI(title='WorkoutApi')
-app.include_router(api_router)
+if settings.LAZY_ROUTERS:
+    app.add_middleware(AguardarCarregamento, carregamento=carregamento)
+else:
+    registrar_routers(app)
@@ -2,8 +2,16 @@ from fastapi import APIRouter
 from workout_api.atleta.controller import router as atleta
 from workout_api.categorias.controller import router as categorias
 from workout_api.centro_treinamento.controller import router as centro_treinamento
+from workout_api.health.controller import router as health
+from workout_api.jobs.controller import router as jobs
+from workout_api.leaderboard.controller import router as leaderboard
+from workout_api.treino.controller import router as treino
 
 api_router = APIRouter()
 api_router.include_router(atleta, prefix='/atletas', tags=['atletas'])
 api_router.include_router(categorias, prefix='/categorias', tags=['categorias'])
-api_router.include_router(centro_treinamento, prefix='/centros_treinamento', tags=['centros_treinamento'])
\ No newline at end of file
+api_router.include_router(centro_treinamento, prefix='/centros_treinamento', tags=['centros_treinamento'])
+api_router.include_router(health, prefix='/health', tags=['health'])
+api_router.include_router(jobs, prefix='/jobs', tags=['jobs'])
+api_router.include_router(leaderboard, prefix='/leaderboard', tags=['leaderboard'])
+api_router.include_router(treino, prefix='/treinos', tags=['treinos'])
\ No newline at end of file
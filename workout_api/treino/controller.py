@@ -0,0 +1,89 @@
+from datetime import datetime
+from uuid import UUID
+from fastapi import APIRouter, Body, Depends, Query, Request, Response, status
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.ingestao import ler_csv, ler_ndjson
+from workout_api.contrib.pagination import CursorPage, CursorParams
+from workout_api.contrib.serializacao import SerializacaoRapida
+from workout_api.jobs.fila import fila
+from workout_api.jobs.schemas import JobOut
+from workout_api.treino import jobs  # noqa: F401 (registra as tarefas da fila)
+from workout_api.treino.schemas import TreinoImportacaoOut, TreinoIn, TreinoOut
+
+from workout_api.treino.treino_crud import (
+    importar_treinos,
+    listar_treinos,
+    registrar_treino,
+)
+
+router = APIRouter()
+responder = SerializacaoRapida('treinos')
+
+@router.post(
+    '/',
+    summary='Registrar um treino',
+    status_code=status.HTTP_201_CREATED,
+    response_model=TreinoOut,
+)
+async def post(
+    db_session: DatabaseDependency,
+    treino_in: TreinoIn = Body(...)
+) -> TreinoOut:
+    return await registrar_treino(db_session, treino_in)
+
+
+@router.post(
+    '/bulk',
+    summary='Registrar treinos em lote (NDJSON ou CSV)',
+    status_code=status.HTTP_200_OK,
+    response_model=TreinoImportacaoOut,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/x-ndjson': {'schema': {'type': 'string'}},
+                'text/csv': {'schema': {'type': 'string'}},
+            },
+        }
+    },
+)
+async def bulk(
+    request: Request,
+    db_session: DatabaseDependency
+):
+    # O corpo é lido em streaming, com as colunas de TreinoIn
+    if 'csv' in request.headers.get('content-type', ''):
+        registros = ler_csv(request.stream())
+    else:
+        registros = ler_ndjson(request.stream())
+
+    return await importar_treinos(db_session, registros)
+
+
+@router.get(
+    '/',
+    summary='Consultar os treinos de um atleta em uma janela de tempo',
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[TreinoOut],
+)
+async def query(
+    db_session: DatabaseDependency,
+    response: Response,
+    atleta_id: UUID = Query(..., description='Identificador do atleta'),
+    inicio: datetime | None = Query(None, description='Início da janela (padrão: TREINOS_JANELA_DIAS antes do fim)'),
+    fim: datetime | None = Query(None, description='Fim da janela, exclusivo (padrão: agora)'),
+    params: CursorParams = Depends(),
+) -> CursorPage[TreinoOut]:
+    return responder(await listar_treinos(db_session, atleta_id, params, inicio, fim), response)
+
+
+@router.post(
+    '/jobs/recordes',
+    summary='Recalcular os recordes do leaderboard em segundo plano',
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobOut,
+)
+async def job_recordes(
+    db_session: DatabaseDependency
+):
+    return await fila.submeter(db_session, 'treinos.recordes', {})
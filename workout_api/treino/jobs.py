@@ -0,0 +1,19 @@
+"""
+Operações pesadas de treinos executadas pela fila de jobs. O recálculo dos recordes refaz a
+tabela inteira e pode ser repetido do início após um reinício.
+"""
+from workout_api.configs.database import async_session
+from workout_api.jobs.fila import ContextoJob, fila
+from workout_api.leaderboard.placares import placares
+from workout_api.treino.recordes import recalcular_recordes
+
+
+@fila.tarefa('treinos.recordes', concorrencia=1)
+async def recordes(contexto: ContextoJob) -> None:
+    async with async_session() as db_session:
+        await recalcular_recordes(db_session)
+        await db_session.commit()
+    # Os placares deste processo são remontados; nos demais, a sincronização relê os recordes
+    # (todos com atualizado_em novo)
+    if placares.pronto:
+        await placares.reconstruir()
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+from workout_api.contrib.models import BaseModel
+
+
+class TreinoModel(BaseModel):
+    # Registros de treino (séries de força e resultados de WOD), só acrescentados. No Postgres a
+    # tabela é particionada por mês de realizado_em (ver treino/particoes.py); no SQLite é comum.
+    __tablename__ = 'treinos'
+    __table_args__ = (
+        # Consultas por atleta e janela de tempo, já na ordem da paginação
+        Index('ix_treinos_atleta_realizado', 'atleta_id', 'realizado_em', 'id'),
+        {'postgresql_partition_by': 'RANGE (realizado_em)'},
+    )
+
+    # Em tabela particionada toda chave única inclui a coluna de particionamento: a chave é
+    # (realizado_em, id), sem o pk_id sequencial e o índice único só em id das demais tabelas
+    realizado_em: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
+    atleta_id: Mapped[int] = mapped_column(ForeignKey("atletas.pk_id", ondelete='CASCADE'), nullable=False)
+    # 'forca': séries x repetições com carga; 'wod': pontuação (tempo, rounds ou repetições)
+    tipo: Mapped[str] = mapped_column(String(10), nullable=False)
+    exercicio: Mapped[str] = mapped_column(String(50), nullable=False)
+    series: Mapped[Optional[int]] = mapped_column(Integer)
+    repeticoes: Mapped[Optional[int]] = mapped_column(Integer)
+    carga: Mapped[Optional[float]] = mapped_column(Float)
+    pontuacao: Mapped[Optional[float]] = mapped_column(Float)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class TreinoRecordeModel(BaseModel):
+    # Melhor resultado de cada atleta em cada exercício, mantido na mesma transação de cada
+    # escrita em treinos (ver treino/recordes.py); é a base dos placares do leaderboard
+    __tablename__ = 'treinos_recordes'
+
+    # A linha é identificada por (atleta, exercício): dispensa o id (UUID) comum às demais tabelas
+    id = None
+    atleta_id: Mapped[int] = mapped_column(ForeignKey("atletas.pk_id", ondelete='CASCADE'), primary_key=True)
+    exercicio: Mapped[str] = mapped_column(String(50), primary_key=True)
+    valor: Mapped[float] = mapped_column(Float, nullable=False)
+    # Resultado normalizado para "menor é melhor" (carga e repetições entram negativas)
+    chave: Mapped[float] = mapped_column(Float, nullable=False)
+    realizado_em: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Lido pela sincronização dos placares entre processos
+    atualizado_em: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
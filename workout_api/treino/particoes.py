@@ -0,0 +1,52 @@
+import logging
+from datetime import date, datetime
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from workout_api.configs.database import dialeto
+from workout_api.contrib.dependencies import DatabaseDependency
+
+logger = logging.getLogger(__name__)
+
+# Meses cujas partições este processo já garantiu
+_garantidas: set[date] = set()
+
+
+def mes_de(momento: datetime) -> date:
+    return date(momento.year, momento.month, 1)
+
+
+def proximo_mes(mes: date) -> date:
+    return date(mes.year + mes.month // 12, mes.month % 12 + 1, 1)
+
+
+def ddl_particao(mes: date) -> str:
+    """CREATE TABLE da partição mensal de `treinos` que contém `mes`."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS treinos_p{mes:%Y_%m} PARTITION OF treinos "
+        f"FOR VALUES FROM ('{mes.isoformat()}') TO ('{proximo_mes(mes).isoformat()}')"
+    )
+
+
+async def garantir_particoes(db_session: DatabaseDependency, momentos: Iterable[datetime]) -> None:
+    """
+    Cria, no Postgres, as partições mensais que ainda faltam para os horários informados.
+    Roda antes da escrita e é confirmada em seguida, para que o lock da criação na tabela
+    principal dure só o comando; cada mês vai ao banco uma vez por processo.
+    """
+    if dialeto(db_session) != 'postgresql':
+        return
+
+    meses = {mes_de(momento) for momento in momentos} - _garantidas
+    for mes in sorted(meses):
+        try:
+            await db_session.execute(text(ddl_particao(mes)))
+            await db_session.commit()
+        except SQLAlchemyError:
+            # Outro processo criou a mesma partição ao mesmo tempo
+            await db_session.rollback()
+            logger.warning('Falha ao criar a partição de treinos de %s', mes, exc_info=True)
+            continue
+        _garantidas.add(mes)
@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Iterable, Mapping
+
+from sqlalchemy import case, delete, func, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from workout_api.configs.database import dialeto
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.treino.models import TreinoModel, TreinoRecordeModel
+
+
+def chave_resultado(exercicio: str, valor: float) -> float:
+    """Resultado normalizado para "menor é melhor": só exercícios por tempo mantêm o sinal."""
+    return valor if exercicio in settings.LEADERBOARD_EXERCICIOS_POR_TEMPO else -valor
+
+
+def valor_resultado(exercicio: str, chave: float) -> float:
+    # A normalização é a sua própria inversa
+    return chave_resultado(exercicio, chave)
+
+
+def _melhores(linhas: Iterable[Mapping]) -> list[dict]:
+    # Melhor resultado de cada (atleta, exercício) do lote: o ON CONFLICT não altera a mesma linha duas vezes
+    melhores: dict[tuple[int, str], dict] = {}
+    for linha in linhas:
+        valor = linha['carga'] if linha['tipo'] == 'forca' else linha['pontuacao']
+        if valor is None:
+            continue
+        chave = chave_resultado(linha['exercicio'], valor)
+        atual = melhores.get((linha['atleta_id'], linha['exercicio']))
+        if atual is None or (chave, linha['realizado_em']) < (atual['chave'], atual['realizado_em']):
+            melhores[(linha['atleta_id'], linha['exercicio'])] = {
+                'atleta_id': linha['atleta_id'],
+                'exercicio': linha['exercicio'],
+                'valor': valor,
+                'chave': chave,
+                'realizado_em': linha['realizado_em'],
+            }
+    return list(melhores.values())
+
+
+async def atualizar_recordes(db_session: DatabaseDependency, linhas: Iterable[Mapping]) -> list[dict]:
+    """
+    Registra os resultados de um lote de treinos que superam o recorde do atleta no exercício,
+    com um único INSERT ... ON CONFLICT DO UPDATE na transação da escrita. Devolve os recordes
+    alterados (atleta_id, exercicio, chave), que atualizam os placares depois do commit.
+    """
+    melhores = _melhores(linhas)
+    if not melhores:
+        return []
+
+    agora = datetime.now()
+    recordes = TreinoRecordeModel.__table__
+    comando = (postgresql.insert if dialeto(db_session) == 'postgresql' else sqlite.insert)(recordes)
+    comando = comando.values([{**melhor, 'atualizado_em': agora} for melhor in melhores])
+    comando = comando.on_conflict_do_update(
+        index_elements=['atleta_id', 'exercicio'],
+        set_={
+            'valor': comando.excluded.valor,
+            'chave': comando.excluded.chave,
+            'realizado_em': comando.excluded.realizado_em,
+            'atualizado_em': comando.excluded.atualizado_em,
+        },
+        where=comando.excluded.chave < recordes.c.chave,
+    ).returning(recordes.c.atleta_id, recordes.c.exercicio, recordes.c.chave)
+
+    return [dict(linha) for linha in (await db_session.execute(comando)).mappings()]
+
+
+async def tocar_recordes(db_session: DatabaseDependency, atletas: list[int]) -> None:
+    """Marca os recordes dos atletas como alterados: a sincronização dos placares os relê (ex.: mudança de categoria)."""
+    if atletas:
+        await db_session.execute(
+            update(TreinoRecordeModel.__table__)
+            .where(TreinoRecordeModel.atleta_id.in_(atletas))
+            .values(atualizado_em=datetime.now())
+        )
+
+
+async def recalcular_recordes(conexao) -> None:
+    """
+    Refaz a tabela de recordes a partir de todos os treinos (sessão ou conexão; não confirma
+    a transação). Para cargas feitas fora da API ou depois de mudar LEADERBOARD_EXERCICIOS_POR_TEMPO.
+    """
+    treinos = TreinoModel.__table__
+    valor = case((treinos.c.tipo == 'forca', treinos.c.carga), else_=treinos.c.pontuacao)
+    chave = case((treinos.c.exercicio.in_(settings.LEADERBOARD_EXERCICIOS_POR_TEMPO), valor), else_=-valor)
+    ordenados = (
+        select(
+            treinos.c.atleta_id,
+            treinos.c.exercicio,
+            valor.label('valor'),
+            chave.label('chave'),
+            treinos.c.realizado_em,
+            func.row_number().over(
+                partition_by=(treinos.c.atleta_id, treinos.c.exercicio),
+                order_by=(chave, treinos.c.realizado_em),
+            ).label('ordem'),
+        )
+        .where(valor.is_not(None))
+        .subquery()
+    )
+
+    await conexao.execute(delete(TreinoRecordeModel.__table__))
+    await conexao.execute(
+        insert(TreinoRecordeModel.__table__).from_select(
+            ['atleta_id', 'exercicio', 'valor', 'chave', 'realizado_em', 'atualizado_em'],
+            select(
+                ordenados.c.atleta_id,
+                ordenados.c.exercicio,
+                ordenados.c.valor,
+                ordenados.c.chave,
+                ordenados.c.realizado_em,
+                literal(datetime.now()),
+            ).where(ordenados.c.ordem == 1),
+        )
+    )
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Annotated, Literal, Optional
+
+from pydantic import UUID4, Field, NonNegativeFloat, PositiveInt, field_validator, model_validator
+from workout_api.contrib.schemas import BaseSchema, OutMixin
+
+
+def sem_fuso(valor: datetime) -> datetime:
+    # As colunas de data não guardam fuso: horários com fuso viram o horário local
+    return valor.astimezone().replace(tzinfo=None) if valor.tzinfo else valor
+
+
+class Treino(BaseSchema):
+    tipo: Annotated[
+        Literal['forca', 'wod'],
+        Field(description="'forca' (séries x repetições com carga) ou 'wod' (pontuação)", json_schema_extra={"example": "forca"})]
+    exercicio: Annotated[
+        str, Field(max_length=50, description="Exercício ou nome do WOD", json_schema_extra={"example": "Back Squat"})]
+    realizado_em: Annotated[
+        datetime, Field(description="Data e hora do treino", json_schema_extra={"example": "2026-10-18T07:30:00"})]
+    series: Annotated[
+        Optional[PositiveInt], Field(None, description="Séries (força)", json_schema_extra={"example": 5})]
+    repeticoes: Annotated[
+        Optional[PositiveInt], Field(None, description="Repetições por série (força)", json_schema_extra={"example": 5})]
+    carga: Annotated[
+        Optional[NonNegativeFloat], Field(None, description="Carga em kg", json_schema_extra={"example": 100.0})]
+    pontuacao: Annotated[
+        Optional[float], Field(None, description="Resultado do WOD (tempo em segundos, rounds ou repetições)")]
+
+    @field_validator('realizado_em')
+    @classmethod
+    def _sem_fuso(cls, valor: datetime) -> datetime:
+        return sem_fuso(valor)
+
+    @model_validator(mode='after')
+    def _campos_do_tipo(self):
+        if self.tipo == 'forca' and (self.series is None or self.repeticoes is None):
+            raise ValueError("Treinos de força exigem series e repeticoes.")
+        if self.tipo == 'wod' and self.pontuacao is None:
+            raise ValueError("Treinos do tipo wod exigem pontuacao.")
+        return self
+
+
+class TreinoIn(Treino):
+    atleta_id: Annotated[UUID4, Field(description="Identificador do atleta")]
+
+
+class TreinoOut(TreinoIn, OutMixin):
+    pass
+
+
+class TreinoImportacaoFalha(BaseSchema):
+    linha: Annotated[int, Field(description="Número da linha no arquivo enviado")]
+    detalhe: Annotated[str, Field(description="Motivo da rejeição")]
+
+
+class TreinoImportacaoOut(BaseSchema):
+    total: Annotated[int, Field(description="Linhas processadas")]
+    inseridos: Annotated[int, Field(description="Treinos registrados")]
+    invalidos: Annotated[int, Field(description="Linhas rejeitadas")]
+    falhas: Annotated[list[TreinoImportacaoFalha], Field(description="Motivo de cada linha não inserida")]
@@ -0,0 +1,249 @@
+from datetime import datetime, timedelta
+from typing import AsyncIterator
+from uuid import UUID, uuid4
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.future import select
+from workout_api.atleta.atleta_crud import pks_atletas_por_id
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.ingestao import LinhaInvalida, em_lotes
+from workout_api.contrib.pagination import (
+    ANTERIOR, PROXIMA, CursorPage, CursorParams, contar, decode_cursor, encode_cursor
+)
+from workout_api.contrib.serializacao import projetar
+from workout_api.leaderboard.placares import placares
+from workout_api.treino.models import TreinoModel
+from workout_api.treino.particoes import garantir_particoes
+from workout_api.treino.recordes import atualizar_recordes
+from workout_api.treino.schemas import (
+    TreinoImportacaoFalha, TreinoImportacaoOut, TreinoIn, TreinoOut, sem_fuso
+)
+
+# 1000 linhas x 11 colunas fica abaixo do limite de parâmetros do asyncpg e do SQLite
+TAMANHO_LOTE_TREINOS = 1000
+
+COLUNAS = tuple(coluna.name for coluna in TreinoModel.__table__.columns)
+
+
+def _linha(treino: TreinoIn, atleta_pk: int, agora: datetime) -> dict:
+    return {
+        **treino.model_dump(exclude={'atleta_id'}),
+        'id': uuid4(),
+        'atleta_id': atleta_pk,
+        'created_at': agora,
+    }
+
+
+async def _acrescentar(db_session: DatabaseDependency, linhas: list[dict]) -> None:
+    """
+    Grava um lote de treinos. No Postgres com asyncpg o lote vai por COPY (binário, sem
+    montar um INSERT com milhares de parâmetros), roteado pelo próprio banco às partições.
+    """
+    await garantir_particoes(db_session, (linha['realizado_em'] for linha in linhas))
+
+    conexao = await db_session.connection()
+    if conexao.dialect.driver == 'asyncpg':
+        bruta = await conexao.get_raw_connection()
+        await bruta.driver_connection.copy_records_to_table(
+            TreinoModel.__tablename__,
+            records=[tuple(linha[coluna] for coluna in COLUNAS) for linha in linhas],
+            columns=COLUNAS,
+        )
+    else:
+        await db_session.execute(insert(TreinoModel.__table__).values(linhas))
+
+
+async def registrar_treino(db_session: DatabaseDependency, treino_in: TreinoIn) -> TreinoOut:
+    atleta_pk = (await pks_atletas_por_id(db_session, {treino_in.atleta_id})).get(treino_in.atleta_id)
+    if atleta_pk is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'O atleta {treino_in.atleta_id} não foi encontrado.'
+        )
+
+    linha = _linha(treino_in, atleta_pk, datetime.now())
+    await garantir_particoes(db_session, [linha['realizado_em']])
+    try:
+        await db_session.execute(insert(TreinoModel.__table__).values(linha))
+        recordes = await atualizar_recordes(db_session, [linha])
+        await db_session.commit()
+    except SQLAlchemyError:
+        await db_session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Ocorreu um erro ao inserir os dados no banco"
+        )
+    await placares.aplicar(db_session, recordes)
+
+    return TreinoOut.model_construct(
+        **dict(treino_in), id=linha['id'], created_at=linha['created_at']
+    )
+
+
+def _resumir_erros(erro: ValidationError) -> str:
+    return '; '.join(
+        f"{'.'.join(str(parte) for parte in e['loc']) or 'treino'}: {e['msg']}" for e in erro.errors()
+    )
+
+
+async def importar_treinos(
+    db_session: DatabaseDependency,
+    registros: AsyncIterator[tuple[int, dict | LinhaInvalida]]
+) -> TreinoImportacaoOut:
+    """
+    Registra treinos em lotes: resolve os atletas de cada lote em uma consulta, grava o lote
+    (e os recordes que ele supera) de uma vez e confirma lote a lote, de modo que linhas
+    inválidas não abortam o restante.
+    """
+    falhas: list[TreinoImportacaoFalha] = []
+    total = inseridos = 0
+
+    async for lote in em_lotes(registros, TAMANHO_LOTE_TREINOS):
+        total += len(lote)
+
+        validos: list[tuple[int, TreinoIn]] = []
+        for numero, dados in lote:
+            if isinstance(dados, LinhaInvalida):
+                falhas.append(TreinoImportacaoFalha(linha=numero, detalhe=str(dados)))
+                continue
+            try:
+                # Colunas vazias do CSV equivalem a campos ausentes
+                dados = {campo: valor for campo, valor in dados.items() if valor != ''}
+                validos.append((numero, TreinoIn.model_validate(dados)))
+            except ValidationError as erro:
+                falhas.append(TreinoImportacaoFalha(linha=numero, detalhe=_resumir_erros(erro)))
+
+        atletas = await pks_atletas_por_id(db_session, {treino.atleta_id for _, treino in validos})
+
+        agora = datetime.now()
+        linhas: list[tuple[int, dict]] = []
+        for numero, treino in validos:
+            if treino.atleta_id not in atletas:
+                falhas.append(TreinoImportacaoFalha(
+                    linha=numero, detalhe=f'O atleta {treino.atleta_id} não foi encontrado.'
+                ))
+            else:
+                linhas.append((numero, _linha(treino, atletas[treino.atleta_id], agora)))
+
+        if not linhas:
+            continue
+
+        try:
+            await _acrescentar(db_session, [linha for _, linha in linhas])
+            recordes = await atualizar_recordes(db_session, [linha for _, linha in linhas])
+            await db_session.commit()
+        except SQLAlchemyError:
+            await db_session.rollback()
+            falhas.extend(
+                TreinoImportacaoFalha(linha=numero, detalhe='Ocorreu um erro ao inserir os dados no banco')
+                for numero, _ in linhas
+            )
+            continue
+
+        inseridos += len(linhas)
+        await placares.aplicar(db_session, recordes)
+
+    falhas.sort(key=lambda falha: falha.linha)
+
+    return TreinoImportacaoOut(total=total, inseridos=inseridos, invalidos=len(falhas), falhas=falhas)
+
+
+def _ler_posicao(valor) -> tuple[datetime, UUID]:
+    try:
+        realizado_em, id = valor
+        return datetime.fromisoformat(realizado_em), UUID(id)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Cursor de paginação inválido.'
+        )
+
+
+def _treino_out(linha, atleta_id: UUID) -> dict:
+    treino = projetar(TreinoOut, linha)
+    treino['atleta_id'] = atleta_id
+    # O SQLite devolve REAL sem parte fracionária como inteiro
+    for campo in ('carga', 'pontuacao'):
+        if treino[campo] is not None:
+            treino[campo] = float(treino[campo])
+    return treino
+
+
+async def listar_treinos(
+    db_session: DatabaseDependency,
+    atleta_id: UUID,
+    params: CursorParams,
+    inicio: datetime | None = None,
+    fim: datetime | None = None
+) -> CursorPage[dict]:
+    """
+    Treinos de um atleta em [inicio, fim), do mais recente ao mais antigo. A janela limita a
+    consulta às partições dos meses envolvidos e o índice (atleta, realizado_em, id) entrega
+    as linhas já ordenadas, então o custo de uma página não cresce com o histórico.
+    """
+    fim = sem_fuso(fim) if fim else datetime.now() + timedelta(seconds=1)
+    inicio = sem_fuso(inicio) if inicio else fim - timedelta(days=settings.TREINOS_JANELA_DIAS)
+    if inicio >= fim:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='O início da janela deve ser anterior ao fim.'
+        )
+
+    atleta_pk = (await pks_atletas_por_id(db_session, {atleta_id})).get(atleta_id)
+    if atleta_pk is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'Atleta não encontrado no id: {atleta_id}'
+        )
+
+    query = (
+        select(*(coluna for coluna in TreinoModel.__table__.columns if coluna.name != 'atleta_id'))
+        .where(
+            TreinoModel.atleta_id == atleta_pk,
+            TreinoModel.realizado_em >= inicio,
+            TreinoModel.realizado_em < fim,
+        )
+    )
+    # Sem contador próprio: a janela limita a contagem às partições envolvidas, e ela é sempre exata
+    total = await contar(db_session, query) if params.total != 'none' else None
+
+    # Keyset em (realizado_em, id): a próxima página segue para o passado
+    posicao = tuple_(TreinoModel.realizado_em, TreinoModel.id)
+    direcao = PROXIMA
+    pagina = query
+    if params.cursor:
+        valor, direcao = decode_cursor(params.cursor)
+        referencia = _ler_posicao(valor)
+        pagina = pagina.where(posicao < referencia if direcao == PROXIMA else posicao > referencia)
+
+    if direcao == PROXIMA:
+        pagina = pagina.order_by(TreinoModel.realizado_em.desc(), TreinoModel.id.desc())
+    else:
+        pagina = pagina.order_by(TreinoModel.realizado_em.asc(), TreinoModel.id.asc())
+
+    linhas = (await db_session.execute(pagina.limit(params.size + 1))).mappings().all()
+    tem_mais = len(linhas) > params.size
+    linhas = list(linhas[:params.size])
+    if direcao == ANTERIOR:
+        linhas.reverse()
+
+    next_page = previous_page = None
+    if linhas:
+        primeiro = [linhas[0]['realizado_em'].isoformat(), str(linhas[0]['id'])]
+        ultimo = [linhas[-1]['realizado_em'].isoformat(), str(linhas[-1]['id'])]
+        if tem_mais or direcao == ANTERIOR:
+            next_page = encode_cursor(ultimo, PROXIMA)
+        if (tem_mais and direcao == ANTERIOR) or (params.cursor and direcao == PROXIMA):
+            previous_page = encode_cursor(primeiro, ANTERIOR)
+
+    return CursorPage(
+        items=[_treino_out(linha, atleta_id) for linha in linhas],
+        total=total,
+        total_estimado=False if total is not None else None,
+        size=params.size,
+        next_page=next_page,
+        previous_page=previous_page,
+    )